@@ -0,0 +1,188 @@
+"""
+API benchmarks against the generated dataset (see conftest.py)
+
+Requests go through the full ASGI stack (middleware, routing, validation,
+serialization), so numbers reflect what a client sees minus the network.
+"""
+import itertools
+import secrets
+
+import datagen
+from conftest import CREATED_EMAIL_DOMAIN
+
+
+def test_create_interview(benchmark, client):
+    counter = itertools.count()
+
+    def create():
+        response = client.post("/api/interviews/create", json={
+            "candidate_name": "Bench Candidate",
+            "candidate_email": f"create{next(counter)}-{secrets.token_hex(4)}@{CREATED_EMAIL_DOMAIN}",
+            "role": "Benchmark",
+        })
+        assert response.status_code == 200
+        return response
+
+    benchmark(create)
+
+
+def test_list_interviews_filtered(benchmark, client, dataset):
+    # Pending interviews of one role: exercises the filter/aggregate/ETag path
+    # without serializing every transcript in the dataset
+    params = {"role": dataset["role"], "status": "pending"}
+
+    def list_page():
+        response = client.get("/api/interviews", params=params)
+        assert response.status_code == 200
+        return response
+
+    benchmark(list_page)
+
+
+def test_list_interviews_with_results(benchmark, client, dataset):
+    # Completed interviews of one role: joinedload + transcript serialization
+    params = {"role": dataset["role"], "status": "completed"}
+
+    def list_page():
+        response = client.get("/api/interviews", params=params)
+        assert response.status_code == 200
+        return response
+
+    benchmark.pedantic(list_page, rounds=5, iterations=1, warmup_rounds=1)
+
+
+def test_list_interviews_by_evaluation(benchmark, client, dataset):
+    # Recommendation + score range + sort by a JSON-only sub-score, all in SQL
+    params = {
+        "role": dataset["role"],
+        "recommendation": [datagen.RECOMMENDATIONS[0], datagen.RECOMMENDATIONS[1]],
+        "min_score": 6,
+        "sort_by": datagen.SUB_SCORES[0],
+    }
+
+    def list_page():
+        response = client.get("/api/interviews", params=params)
+        assert response.status_code == 200
+        return response
+
+    benchmark.pedantic(list_page, rounds=5, iterations=1, warmup_rounds=1)
+
+
+def test_list_interviews_query_budget(client, dataset):
+    # The ETag aggregate plus one joined query, however many rows come back (N+1 guard)
+    from services.profiling import assert_max_queries
+
+    for params in ({}, {"role": dataset["role"], "status": "completed"}):
+        client.get("/api/interviews", params=params)  # Warm per-process caches (compression dictionaries)
+        with assert_max_queries(2):
+            response = client.get("/api/interviews", params=params)
+        assert response.status_code == 200
+
+
+def test_list_interviews_not_modified(benchmark, client):
+    etag = client.get("/api/interviews", params={"status": "pending"}).headers["ETag"]
+
+    def revalidate():
+        response = client.get("/api/interviews", params={"status": "pending"},
+                              headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        return response
+
+    benchmark(revalidate)
+
+
+def test_get_interview_by_uid(benchmark, client, dataset):
+    def get():
+        response = client.get(f"/api/interviews/by-uid/{dataset['completed_uid']}")
+        assert response.status_code == 200
+        return response
+
+    benchmark(get)
+
+
+def test_verify_password(benchmark, client, dataset):
+    # Dominated by bcrypt.checkpw at the stored work factor
+    def verify():
+        response = client.post(
+            f"/api/interviews/by-uid/{dataset['pending_uid']}/verify-password",
+            json={"password": datagen.PASSWORD},
+        )
+        assert response.json()["valid"] is True
+        return response
+
+    benchmark(verify)
+
+
+def test_bootstrap_candidate_page(benchmark, client, dataset):
+    # Password check + interview + VAPI config in one request (a page refresh:
+    # the interview has already left pending, so nothing is written)
+    def bootstrap():
+        response = client.post(
+            f"/api/interviews/by-uid/{dataset['completed_uid']}/bootstrap",
+            json={"password": datagen.PASSWORD},
+        )
+        assert response.json()["valid"] is True
+        return response
+
+    benchmark(bootstrap)
+
+
+def _end_of_call_payload(unique_id: str, seed: int) -> dict:
+    rng = datagen.random.Random(seed)
+    transcript = datagen.make_transcript(rng, "Bench Candidate", "Benchmark")
+    messages = []
+    for turn in transcript.split("\n\n"):
+        role, _, text = turn.partition(": ")
+        messages.append({"role": "bot" if role == "ASSISTANT" else "user", "message": text})
+    call_id = f"{rng.getrandbits(128):032x}"
+    return {"message": {
+        "type": "end-of-call-report",
+        "call": {"id": call_id, "metadata": {"interviewId": unique_id}, "duration": 1200},
+        "messages": messages,
+        "analysis": {"summary": datagen._answer(rng)},
+        "artifact": {"structuredOutputs": {
+            "bench-output": {
+                "name": "Interview_Evaluation",
+                "result": datagen.make_evaluation(rng, "Bench Candidate", "Benchmark"),
+            }
+        }},
+    }}
+
+
+def test_webhook_end_of_call(benchmark, client, new_live_interview):
+    # Includes structured outputs, so no background polling is scheduled
+    seeds = itertools.count()
+
+    def setup():
+        payload = _end_of_call_payload(new_live_interview(), next(seeds))
+        return (payload,), {}
+
+    def ingest(payload):
+        response = client.post("/api/webhooks/vapi", json=payload)
+        assert response.status_code == 200
+        return response
+
+    benchmark.pedantic(ingest, setup=setup, rounds=50, warmup_rounds=2)
+
+
+def test_webhook_non_dict_evaluation(client, new_live_interview):
+    # A malformed structured output is stored and marked invalid (queued for re-fetch), not a 500
+    from database import SessionLocal
+    from models import Interview
+    from services.evaluation_schema import INVALID
+
+    for seed, malformed in enumerate(["not an evaluation", ["not", "an", "evaluation"]]):
+        unique_id = new_live_interview()
+        payload = _end_of_call_payload(unique_id, seed)
+        payload["message"]["artifact"]["structuredOutputs"]["bench-output"]["result"] = malformed
+        response = client.post("/api/webhooks/vapi", json=payload)
+        assert response.status_code == 200
+
+        db = SessionLocal()
+        try:
+            interview = db.query(Interview).filter(Interview.unique_id == unique_id).one()
+            assert interview.status == "completed"
+            assert interview.result.evaluation == malformed
+            assert interview.result.evaluation_status == INVALID
+        finally:
+            db.close()
@@ -0,0 +1,131 @@
+"""
+SQLite write throughput: default settings vs. the production profile
+
+Each round applies WRITES status-update webhooks (apply_status_update, the
+mutation the webhook route queues) from CONCURRENCY concurrent requests to a
+fresh copy of a small database:
+
+    default       pysqlite defaults, one commit per request
+    wal           WAL + pragmas from database._tune_sqlite, one commit per request
+    wal_grouped   WAL + pragmas, commits batched by the WriteQueue
+
+The three share the "sqlite-writes" group, so `pytest benchmarks -k sqlite`
+prints them side by side; writes/s is recorded in each run's extra_info.
+"""
+import asyncio
+import secrets
+import shutil
+
+import pytest
+
+WRITES = 400
+CONCURRENCY = 16
+INTERVIEWS = WRITES  # One status update per interview, like real call starts
+
+
+@pytest.fixture(scope="module")
+def template_db(tmp_path_factory):
+    """Empty schema plus INTERVIEWS pending interviews, copied for every round"""
+    from sqlalchemy.orm import Session
+    from database import Base, _create_engine
+    from models import Interview
+
+    path = tmp_path_factory.mktemp("sqlite-writes") / "template.db"
+    engine = _create_engine(f"sqlite:///{path}", tune_sqlite=False)
+    Base.metadata.create_all(engine)
+    uids = [secrets.token_urlsafe(16) for _ in range(INTERVIEWS)]
+    with Session(engine) as db:
+        db.add_all(
+            Interview(
+                candidate_name=f"Writer {i}",
+                candidate_email=f"writer{i}@example.com",
+                role="Benchmark",
+                interview_link=f"http://localhost:5173/interview/{uid}",
+                unique_id=uid,
+                status="pending",
+            )
+            for i, uid in enumerate(uids)
+        )
+        db.commit()
+    engine.dispose()
+    return path, uids
+
+
+def _payloads(uids: list[str]) -> list[dict]:
+    return [
+        {"message": {
+            "type": "status-update",
+            "status": "in-progress",
+            "call": {"id": f"call-{n}", "metadata": {"interviewId": uids[n % len(uids)]}},
+        }}
+        for n in range(WRITES)
+    ]
+
+
+def _commit_each(session_factory, payloads):
+    from routes.webhooks import apply_status_update
+
+    def commit_one(payload):
+        db = session_factory()
+        try:
+            apply_status_update(db, payload)
+            db.commit()
+        finally:
+            db.close()
+
+    async def run():
+        semaphore = asyncio.Semaphore(CONCURRENCY)
+
+        async def one(payload):
+            async with semaphore:
+                await asyncio.to_thread(commit_one, payload)
+
+        await asyncio.gather(*(one(p) for p in payloads))
+
+    asyncio.run(run())
+
+
+def _group_commit(session_factory, payloads):
+    from routes.webhooks import apply_status_update
+    from services.write_queue import WriteQueue
+
+    async def run():
+        queue = WriteQueue(session_factory=session_factory)
+        semaphore = asyncio.Semaphore(CONCURRENCY)
+
+        async def one(payload):
+            async with semaphore:
+                await queue.submit(lambda db: apply_status_update(db, payload))
+
+        await asyncio.gather(*(one(p) for p in payloads))
+        await queue.aclose()
+
+    asyncio.run(run())
+
+
+@pytest.mark.benchmark(group="sqlite-writes")
+@pytest.mark.parametrize("profile", ["default", "wal", "wal_grouped"])
+def test_status_update_throughput(benchmark, template_db, tmp_path, profile):
+    from sqlalchemy.orm import sessionmaker
+    from database import _create_engine
+
+    template, uids = template_db
+    payloads = _payloads(uids)
+    engines = []
+    rounds = iter(range(1_000_000))
+
+    def setup():
+        path = tmp_path / f"round{next(rounds)}.db"
+        shutil.copy(template, path)
+        engine = _create_engine(f"sqlite:///{path}", tune_sqlite=profile != "default")
+        engines.append(engine)
+        return (sessionmaker(autocommit=False, autoflush=False, bind=engine), payloads), {}
+
+    write = _group_commit if profile == "wal_grouped" else _commit_each
+    try:
+        benchmark.pedantic(write, setup=setup, rounds=5, warmup_rounds=1)
+    finally:
+        for engine in engines:
+            engine.dispose()
+    if benchmark.stats:  # None under --benchmark-disable (plain test run)
+        benchmark.extra_info["writes_per_second"] = round(WRITES / benchmark.stats.stats.median)
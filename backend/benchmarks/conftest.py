@@ -0,0 +1,147 @@
+"""
+Benchmark fixtures
+
+Run from backend/:
+    pytest benchmarks                       # 10k rows (default)
+    pytest benchmarks --rows 100000
+    pytest benchmarks --benchmark-save=baseline   # record a new baseline
+    python benchmarks/report.py              # compare the latest run against the baseline
+
+The dataset for each --rows/--seed is generated once into benchmarks/.data/
+and reused. Rows written by the benchmarks are removed again at the end.
+"""
+import functools
+import os
+import sys
+
+import pytest
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+sys.path.insert(0, BENCH_DIR)
+
+BASELINE_STORAGE = os.path.join(BENCH_DIR, "baselines")
+CREATED_EMAIL_DOMAIN = "bench-created.example.com"
+
+
+def pytest_addoption(parser):
+    parser.addoption("--rows", type=int, default=10_000, help="Interviews in the benchmark dataset")
+    parser.addoption("--seed", type=int, default=42, help="Seed for the benchmark dataset")
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_configure(config):
+    # Must run before the app modules are imported: they read settings at import time
+    if str(config.rootpath) != BENCH_DIR:
+        return  # Picked up by a plain `pytest` run elsewhere in backend/
+    import datagen
+
+    rows, seed = config.getoption("rows"), config.getoption("seed")
+    path = datagen.dataset_path(rows, seed)
+    os.environ.update({
+        "VAPI_API_KEY": "benchmark",
+        "SECRET_KEY": "benchmark",
+        "DATABASE_URL": f"sqlite:///{path}",
+        "DATABASE_REPLICA_URLS": "",
+        "VAPI_RATE_LIMIT_PER_SECOND": "0",
+        "RECONCILE_INTERVAL_MINUTES": "0",
+        "PROFILING_SAMPLE_RATE": "0",
+    })
+    if not os.path.exists(path):
+        print(f"\n🧪 Generating benchmark dataset ({rows} rows, seed {seed})...")
+        datagen.generate_database(path, rows, seed)
+
+    # Keep baselines next to the suite instead of ./.benchmarks
+    if config.getoption("benchmark_storage", None) == "file://./.benchmarks":
+        config.option.benchmark_storage = f"file://{BASELINE_STORAGE}"
+
+
+def pytest_benchmark_update_machine_info(config, machine_info):
+    # Recorded with every run so report.py can flag comparisons across dataset sizes
+    machine_info["rows"] = config.getoption("rows")
+    machine_info["seed"] = config.getoption("seed")
+
+
+@pytest.fixture(scope="session")
+def client(tmp_path_factory):
+    from fastapi.testclient import TestClient
+    from main import app
+    from routes import webhooks
+    from services.webhook_log import append_webhook_log
+
+    # Keep the real (indexed) debug log write in the measured path, but off the repo's log
+    log_path = str(tmp_path_factory.mktemp("webhooks") / "webhook_debug.log")
+    original = webhooks.append_webhook_log
+    webhooks.append_webhook_log = functools.partial(append_webhook_log, log_path=log_path)
+    try:
+        with TestClient(app) as test_client:
+            yield test_client
+    finally:
+        webhooks.append_webhook_log = original
+        _remove_created_rows()
+
+
+def _remove_created_rows():
+    from database import SessionLocal
+    from models import Interview, InterviewResult
+    from services.search_index import remove_from_index
+
+    db = SessionLocal()
+    try:
+        ids = [i for (i,) in db.query(Interview.id).filter(
+            Interview.candidate_email.like(f"%@{CREATED_EMAIL_DOMAIN}")
+        )]
+        for interview_id in ids:
+            remove_from_index(db, interview_id)
+        db.query(InterviewResult).filter(InterviewResult.interview_id.in_(ids)).delete(synchronize_session=False)
+        db.query(Interview).filter(Interview.id.in_(ids)).delete(synchronize_session=False)
+        db.commit()
+    finally:
+        db.close()
+
+
+@pytest.fixture(scope="session")
+def dataset(request):
+    """A few known rows from the generated dataset"""
+    from database import SessionLocal
+    from models import Interview
+
+    db = SessionLocal()
+    try:
+        completed = db.query(Interview).filter(Interview.status == "completed").order_by(Interview.id).first()
+        pending = db.query(Interview).filter(Interview.status == "pending").order_by(Interview.id).first()
+        return {
+            "rows": request.config.getoption("rows"),
+            "completed_uid": completed.unique_id,
+            "pending_uid": pending.unique_id,
+            "role": completed.role,
+        }
+    finally:
+        db.close()
+
+
+@pytest.fixture
+def new_live_interview():
+    """Factory inserting a fresh in-progress interview (cleaned up at session end)"""
+    import secrets
+    from database import SessionLocal
+    from models import Interview
+
+    def create():
+        unique_id = secrets.token_urlsafe(16)
+        db = SessionLocal()
+        try:
+            db.add(Interview(
+                candidate_name="Bench Candidate",
+                candidate_email=f"{unique_id[:8].lower()}@{CREATED_EMAIL_DOMAIN}",
+                role="Benchmark",
+                interview_link=f"http://localhost:5173/interview/{unique_id}",
+                unique_id=unique_id,
+                status="in_progress",
+            ))
+            db.commit()
+        finally:
+            db.close()
+        return unique_id
+
+    return create
@@ -0,0 +1,202 @@
+"""
+Seeded synthetic data for benchmarks
+
+Generates Interview / InterviewResult rows with realistic sizes: ~40-turn
+transcripts (6-10 KB), evaluations shaped like vapi-prompts/*-schema.json
+and a trimmed end-of-call payload. The same seed always yields the same data.
+
+Usage: python benchmarks/datagen.py --rows 100000 [--seed 42] [--out benchmarks/.data/bench_100000.db]
+"""
+import argparse
+import os
+import random
+import sys
+from datetime import datetime, timedelta
+
+import bcrypt
+from sqlalchemy import create_engine, event, insert
+from sqlalchemy.orm import sessionmaker
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), ".data")
+# Part of the cached file name: bump when the models change so datasets are regenerated
+DATASET_VERSION = 9
+
+# Every generated interview shares this password (bcrypt is too slow to hash per row)
+PASSWORD = "BENCH1"
+_PASSWORD_HASH = bcrypt.hashpw(PASSWORD.encode("utf-8"), bcrypt.gensalt(rounds=12)).decode("utf-8")
+
+ROLES = [
+    "Fulbright Masters", "Fulbright PhD", "Chevening", "DAAD Research", "Erasmus Mundus",
+    "Commonwealth Scholarship", "Rhodes", "Gates Cambridge", "MEXT", "Global UGRAD",
+]
+FIRST_NAMES = ["Ali", "Sara", "Hassan", "Ayesha", "John", "Maria", "Omar", "Fatima", "Chen", "Priya",
+               "David", "Zainab", "Lucas", "Amina", "Noah", "Hira", "Ivan", "Leila", "Tom", "Mei"]
+LAST_NAMES = ["Khan", "Ahmed", "Smith", "Garcia", "Raza", "Chaudhry", "Lee", "Patel", "Silva", "Malik"]
+QUESTIONS = [
+    "Could you briefly introduce yourself and your academic background?",
+    "Why have you chosen this particular program and field of study?",
+    "How does this program connect with your long-term career goals?",
+    "Tell me about a leadership experience where you had to take responsibility for others.",
+    "What challenges do you expect to face while studying abroad, and how will you handle them?",
+    "How do you plan to contribute to your home country after completing your studies?",
+    "Describe a research project or academic work you are particularly proud of.",
+    "What makes you a strong candidate compared with other applicants?",
+]
+ANSWER_WORDS = (
+    "research community development education policy engineering data analysis public health "
+    "leadership volunteer university project experience learning impact students teaching "
+    "innovation sustainability collaboration mentoring conference publication internship "
+    "government organization responsibility opportunity challenge growth skills knowledge"
+).split()
+RECOMMENDATIONS = ["Strongly Recommend", "Recommend", "Borderline", "Not Recommended"]
+SUB_SCORES = ["academic_readiness", "motivation_clarity", "communication_clarity",
+              "leadership_potential", "home_country_commitment"]
+
+
+def _answer(rng: random.Random) -> str:
+    sentences = []
+    for _ in range(rng.randint(3, 6)):
+        words = rng.choices(ANSWER_WORDS, k=rng.randint(10, 22))
+        sentences.append(" ".join(words).capitalize() + ".")
+    return " ".join(sentences)
+
+
+def make_transcript(rng: random.Random, name: str, role: str) -> str:
+    turns = [f"ASSISTANT: Hi {name}! It's great to meet you. I'm part of the Selection Committee "
+             f"for the {role} program. How are you doing today?",
+             "USER: I'm doing well, thank you for having me."]
+    for _ in range(rng.randint(16, 22)):
+        turns.append(f"ASSISTANT: {rng.choice(QUESTIONS)}")
+        turns.append(f"USER: {_answer(rng)}")
+    return "\n\n".join(turns)
+
+
+def make_evaluation(rng: random.Random, name: str, role: str) -> dict:
+    scores = {key: rng.randint(1, 10) for key in SUB_SCORES}
+    return {
+        "candidate_name": name,
+        "role": role,
+        "overall_recommendation": rng.choice(RECOMMENDATIONS),
+        "overall_score": round(sum(scores.values()) / len(scores), 1),
+        **scores,
+        "key_strengths": [_answer(rng)[:120] for _ in range(3)],
+        "key_concerns": [_answer(rng)[:120] for _ in range(2)],
+        "summary": _answer(rng),
+    }
+
+
+def generate_rows(rows: int, seed: int = 42, start: datetime = datetime(2025, 1, 1)):
+    """Yield (interview, result or None) dicts; results exist for completed interviews"""
+    rng = random.Random(seed)
+    for i in range(1, rows + 1):
+        name = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+        role = rng.choice(ROLES)
+        unique_id = f"{rng.getrandbits(96):024x}"
+        created_at = start + timedelta(seconds=rng.randint(0, 365 * 24 * 3600))
+        status = rng.choices(["completed", "in_progress", "pending"], weights=[70, 15, 15])[0]
+        interview = {
+            "id": i,
+            "candidate_name": name,
+            "candidate_email": f"candidate{i}@example.com",
+            "role": role,
+            "interview_link": f"http://localhost:5173/interview/{unique_id}",
+            "unique_id": unique_id,
+            "password_hash": _PASSWORD_HASH,
+            "status": status,
+            "created_at": created_at,
+            "updated_at": created_at + timedelta(minutes=45),
+        }
+        result = None
+        if status == "completed":
+            call_id = f"{rng.getrandbits(128):032x}"
+            result = {
+                "interview_id": i,
+                "vapi_call_id": call_id,
+                "call_duration": float(rng.randint(600, 1800)),
+                "transcript": make_transcript(rng, name, role),
+                "summary": _answer(rng),
+                "evaluation": make_evaluation(rng, name, role),
+                "completed_at": created_at + timedelta(minutes=40),
+                "raw_webhook_data": {"type": "end-of-call-report", "call": {"id": call_id},
+                                     "metadata": {"interviewId": unique_id}},
+            }
+        yield interview, result
+
+
+def generate_database(path: str, rows: int, seed: int = 42, batch_size: int = 5000) -> str:
+    """Create a SQLite database at `path` filled with `rows` interviews"""
+    from database import Base
+    from models import Interview, InterviewResult
+    from services.search_index import init_search_index, rebuild_search_index
+    from services.duplicate_index import rebuild_duplicate_index
+    from services.evaluation_schema import UNVALIDATED, typed_scores
+    from services.compression import train_dictionary, recompress_results
+
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    tmp_path = f"{path}.partial"
+    if os.path.exists(tmp_path):
+        os.remove(tmp_path)
+
+    engine = create_engine(f"sqlite:///{tmp_path}")
+
+    @event.listens_for(engine, "connect")
+    def _fast_bulk_load(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=OFF")
+        cursor.execute("PRAGMA synchronous=OFF")
+        cursor.close()
+
+    Base.metadata.create_all(bind=engine)
+    interviews, results = [], []
+    with engine.begin() as conn:
+        for n, (interview, result) in enumerate(generate_rows(rows, seed), start=1):
+            interviews.append(interview)
+            if result:
+                # Generated evaluations follow no deployed schema
+                result.update(typed_scores(result["evaluation"]), evaluation_status=UNVALIDATED,
+                              evaluation_fetch_attempts=0)
+                results.append(result)
+            if len(interviews) >= batch_size:
+                conn.execute(insert(Interview.__table__), interviews)
+                if results:
+                    conn.execute(insert(InterviewResult.__table__), results)
+                interviews, results = [], []
+                print(f"  {n}/{rows} rows", end="\r")
+        if interviews:
+            conn.execute(insert(Interview.__table__), interviews)
+        if results:
+            conn.execute(insert(InterviewResult.__table__), results)
+
+    session_factory = sessionmaker(bind=engine)
+    init_search_index(bind=engine)
+    rebuild_search_index(batch_size=1000, session_factory=session_factory)
+    rebuild_duplicate_index(batch_size=1000, session_factory=session_factory)
+
+    # Store texts the way production does: compressed with a dictionary trained on them
+    with session_factory() as db:
+        train_dictionary(db, seed=seed)
+        db.commit()
+    recompress_results(session_factory, batch_size=2000, log=lambda message: None)
+    engine.dispose()
+
+    os.replace(tmp_path, path)
+    print(f"✅ Generated {rows} interviews in {path}")
+    return path
+
+
+def dataset_path(rows: int, seed: int = 42) -> str:
+    return os.path.join(DATA_DIR, f"bench_{rows}_{seed}_v{DATASET_VERSION}.db")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate a synthetic benchmark database")
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--out", default=None)
+    args = parser.parse_args()
+
+    os.environ.setdefault("VAPI_API_KEY", "benchmark")
+    os.environ.setdefault("SECRET_KEY", "benchmark")
+    generate_database(args.out or dataset_path(args.rows, args.seed), args.rows, args.seed)
@@ -0,0 +1,106 @@
+"""
+Regression report: compare a benchmark run against the stored baseline
+
+Usage (from backend/):
+    pytest benchmarks --benchmark-autosave
+    python benchmarks/report.py [--threshold 10] [--baseline FILE] [--current FILE]
+
+Without arguments the newest *baseline*.json under benchmarks/baselines/ is
+compared with the newest other run. Medians are compared; a benchmark slower
+than the baseline by more than --threshold percent is a regression and the
+script exits with status 1 (use it as a CI gate).
+"""
+import argparse
+import glob
+import json
+import os
+import sys
+
+BASELINE_STORAGE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baselines")
+
+
+def load(path: str) -> dict:
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    return {
+        "path": path,
+        "rows": data.get("machine_info", {}).get("rows"),
+        "benchmarks": {b["name"]: b["stats"] for b in data.get("benchmarks", [])},
+    }
+
+
+def latest_runs(storage: str = BASELINE_STORAGE) -> tuple[str | None, str | None]:
+    """Newest baseline file and newest non-baseline run"""
+    files = sorted(glob.glob(os.path.join(storage, "*", "*.json")), key=os.path.getmtime)
+    baselines = [f for f in files if "baseline" in os.path.basename(f)]
+    runs = [f for f in files if "baseline" not in os.path.basename(f)]
+    return (baselines[-1] if baselines else None), (runs[-1] if runs else None)
+
+
+def compare(baseline: dict, current: dict, threshold: float) -> list[dict]:
+    rows = []
+    for name in sorted(set(baseline["benchmarks"]) | set(current["benchmarks"])):
+        before = baseline["benchmarks"].get(name)
+        after = current["benchmarks"].get(name)
+        if not before or not after:
+            rows.append({"name": name, "before": before and before["median"],
+                         "after": after and after["median"], "change": None,
+                         "status": "new" if after else "missing"})
+            continue
+        change = (after["median"] - before["median"]) / before["median"] * 100
+        if change > threshold:
+            status = "REGRESSION"
+        elif change < -threshold:
+            status = "faster"
+        else:
+            status = "ok"
+        rows.append({"name": name, "before": before["median"], "after": after["median"],
+                     "change": change, "status": status})
+    return rows
+
+
+def _ms(seconds) -> str:
+    return "-" if seconds is None else f"{seconds * 1000:.3f}"
+
+
+def render(rows: list[dict], baseline: dict, current: dict, threshold: float) -> str:
+    lines = [
+        f"Baseline: {os.path.relpath(baseline['path'])} ({baseline['rows']} rows)",
+        f"Current:  {os.path.relpath(current['path'])} ({current['rows']} rows)",
+        f"Threshold: +{threshold:g}% on median",
+        "",
+        "| Benchmark | Baseline median (ms) | Current median (ms) | Change | Status |",
+        "|---|---:|---:|---:|---|",
+    ]
+    for row in rows:
+        change = "-" if row["change"] is None else f"{row['change']:+.1f}%"
+        lines.append(f"| {row['name']} | {_ms(row['before'])} | {_ms(row['after'])} | {change} | {row['status']} |")
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare benchmark results with the stored baseline")
+    parser.add_argument("--baseline", help="Baseline JSON (default: newest *baseline*.json)")
+    parser.add_argument("--current", help="Run to check (default: newest other run)")
+    parser.add_argument("--threshold", type=float, default=10.0, help="Allowed slowdown in percent")
+    args = parser.parse_args()
+
+    default_baseline, default_current = latest_runs()
+    baseline_path = args.baseline or default_baseline
+    current_path = args.current or default_current
+    if not baseline_path or not current_path:
+        print("❌ Need a baseline and a run to compare; see --help")
+        sys.exit(2)
+
+    baseline, current = load(baseline_path), load(current_path)
+    if baseline["rows"] != current["rows"]:
+        print(f"⚠️  Dataset sizes differ ({baseline['rows']} vs {current['rows']} rows)")
+
+    rows = compare(baseline, current, args.threshold)
+    print(render(rows, baseline, current, args.threshold))
+
+    regressions = [r["name"] for r in rows if r["status"] == "REGRESSION"]
+    if regressions:
+        print(f"\n❌ {len(regressions)} regression(s): {', '.join(regressions)}")
+        sys.exit(1)
+    print("\n✅ No regressions")
@@ -0,0 +1,20 @@
+"""
+candimind - operations CLI for the interview backend
+
+Replaces the one-off scripts that used to live in scripts/. Every command
+shares the app's session factory and a single pooled VAPI client, accepts
+several ids at once (arguments, a file, or "-" for stdin) and runs VAPI
+requests concurrently.
+
+Usage (from backend/):
+    python -m candimind calls list --limit 20
+    python -m candimind link 12:019c48d0-1951-7449-84ea-1f23042c4b46
+    python -m candimind link --auto 12 13 14
+    python -m candimind fetch 12 13 abc123 --concurrency 8
+    python -m candimind fetch --file ids.txt
+    python -m candimind reconcile
+    python -m candimind check-db --list
+    python -m candimind check-config
+    python -m candimind sync-config --apply
+    python -m candimind webhook-log --call-id 019c474f --event end-of-call-report
+"""
@@ -0,0 +1,40 @@
+import argparse
+import asyncio
+import sys
+
+from candimind.commands import COMMAND_MODULES
+from services.circuit_breaker import CircuitOpenError
+from services.vapi_service import vapi_service
+
+if sys.stdout.encoding != 'utf-8':
+    try:
+        sys.stdout.reconfigure(encoding='utf-8')
+    except Exception:
+        pass
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="candimind", description="Interview platform operations")
+    subparsers = parser.add_subparsers(dest="command", metavar="COMMAND", required=True)
+    for module in COMMAND_MODULES:
+        module.register(subparsers)
+    return parser
+
+
+async def _run(handler, args) -> int:
+    try:
+        return await handler(args) or 0
+    except CircuitOpenError as e:
+        print(f"🔌 {e}")
+        return 1
+    finally:
+        await vapi_service.aclose()
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    try:
+        return asyncio.run(_run(args.handler, args))
+    except KeyboardInterrupt:
+        print("\n⛔ Interrupted")
+        return 130
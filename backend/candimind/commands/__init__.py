@@ -0,0 +1,4 @@
+from candimind.commands import archive, calls, results, database, outbox, recordings, vapi_config, webhook_log
+
+# Each module adds its subcommands through register(subparsers)
+COMMAND_MODULES = [calls, results, database, vapi_config, webhook_log, archive, recordings, outbox]
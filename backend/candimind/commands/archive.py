@@ -0,0 +1,63 @@
+from database import SessionLocal
+from candimind.context import add_batch_input, open_session, read_batch_input, resolve_interviews
+from services.archive import archive_due_results, rehydrate as rehydrate_result, role_retention_days
+from config import get_settings
+
+settings = get_settings()
+
+
+async def archive(args) -> int:
+    """Move completed interviews past their retention period to Parquet"""
+    days = settings.archive_after_days if args.days is None else args.days
+    policy = {"default": days, **role_retention_days()}
+    print("Retention: " + ", ".join(f"{role} {f'{d} days' if d else 'never'}" for role, d in policy.items()))
+    summary = archive_due_results(SessionLocal, batch_size=args.batch_size, dry_run=args.dry_run, default_days=days)
+    if args.dry_run:
+        print(f"\nWould archive {summary['archived']} interviews into {summary['partitions']} partitions")
+    else:
+        print(f"\n✅ Archived {summary['archived']} interviews: {summary['files']} files "
+              f"in {summary['partitions']} partitions under {settings.archive_dir}")
+    return 0
+
+
+async def rehydrate(args) -> int:
+    """Move archived interviews back into the database"""
+    refs = read_batch_input(args)
+    if not refs:
+        print("❌ No interviews given")
+        return 2
+
+    db = open_session()
+    failed = 0
+    try:
+        interviews, missing = resolve_interviews(db, refs)
+        for ref in missing:
+            print(f"❌ Interview {ref} not found")
+        for interview in interviews:
+            if interview.result is None or interview.result.archived_at is None:
+                print(f"  {interview.candidate_name} (ID: {interview.id}) is not archived")
+                continue
+            try:
+                rehydrate_result(db, interview.result)
+            except LookupError as e:
+                print(f"❌ {e}")
+                failed += 1
+                continue
+            db.commit()
+            print(f"✅ {interview.candidate_name} (ID: {interview.id}) rehydrated")
+    finally:
+        db.close()
+    return 1 if missing or failed else 0
+
+
+def register(subparsers):
+    arc = subparsers.add_parser("archive", help="Archive completed interviews past their retention period")
+    arc.add_argument("--days", type=int, default=None,
+                     help="Retention for roles without ARCHIVE_ROLE_DAYS (default ARCHIVE_AFTER_DAYS)")
+    arc.add_argument("--batch-size", type=int, default=500, help="Interviews per file write and commit")
+    arc.add_argument("--dry-run", action="store_true", help="Only count what would be archived")
+    arc.set_defaults(handler=archive)
+
+    reh = subparsers.add_parser("rehydrate", help="Move archived interviews back into the database")
+    add_batch_input(reh, "INTERVIEW", "Interview id or unique id")
+    reh.set_defaults(handler=rehydrate)
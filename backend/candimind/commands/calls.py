@@ -0,0 +1,175 @@
+import json
+
+from candimind.context import (
+    add_batch_input, open_session, read_batch_input, resolve_interviews, run_concurrently
+)
+from models import InterviewResult
+from services.rate_limiter import PRIORITY_BACKGROUND
+from services.vapi_service import vapi_service
+
+
+def _candidate(call: dict) -> str:
+    variables = call.get("variableValues") or {}
+    customer = call.get("customer") or {}
+    return variables.get("candidateName") or customer.get("name") or "-"
+
+
+def _interview_uid(call: dict) -> str | None:
+    overrides = call.get("assistantOverrides") or {}
+    metadata = overrides.get("metadata") or call.get("metadata") or {}
+    return metadata.get("interviewId")
+
+
+async def list_calls(args) -> int:
+    calls = await vapi_service.list_calls(limit=args.limit, priority=PRIORITY_BACKGROUND)
+    calls.sort(key=lambda c: c.get("startedAt") or "", reverse=True)
+
+    if args.interview:
+        db = open_session()
+        try:
+            interviews, missing = resolve_interviews(db, args.interview)
+        finally:
+            db.close()
+        for ref in missing:
+            print(f"❌ Interview {ref} not found")
+        matched = []
+        for interview in interviews:
+            matched += [c for c in vapi_service.match_calls(calls, interview.unique_id, interview.candidate_name)
+                        if c not in matched]
+        calls = matched
+
+    if args.json:
+        print(json.dumps(calls, indent=2))
+        return 0
+    if not calls:
+        print("NO_CALLS_FOUND")
+        return 1
+
+    db = open_session()
+    try:
+        linked = dict(
+            db.query(InterviewResult.vapi_call_id, InterviewResult.interview_id)
+            .filter(InterviewResult.vapi_call_id.in_([c.get("id") for c in calls]))
+        )
+    finally:
+        db.close()
+
+    print(f"{'CALL ID':<38} {'STARTED':<20} {'STATUS':<10} {'CANDIDATE':<24} LINKED")
+    for call in calls:
+        started = (call.get("startedAt") or "-")[:19].replace("T", " ")
+        link = linked.get(call.get("id"))
+        print(
+            f"{call.get('id', '-'):<38} {started:<20} {call.get('status') or '-':<10} "
+            f"{_candidate(call)[:24]:<24} {f'interview {link}' if link else _interview_uid(call) or '-'}"
+        )
+    return 0
+
+
+def _parse_pairs(items: list[str]) -> tuple[list[tuple[str, str]], list[str]]:
+    pairs, bad = [], []
+    for item in items:
+        ref, sep, call_id = item.partition(":")
+        if sep and ref.strip() and call_id.strip():
+            pairs.append((ref.strip(), call_id.strip()))
+        else:
+            bad.append(item)
+    return pairs, bad
+
+
+async def link_calls(args) -> int:
+    """Store VAPI call ids on interview results so `fetch` can pick them up"""
+    items = read_batch_input(args)
+    if not items:
+        print("❌ Nothing to link (pass INTERVIEW:CALL_ID pairs, or interview ids with --auto)")
+        return 2
+
+    db = open_session()
+    try:
+        failures = 0
+        if args.auto:
+            interviews, missing = resolve_interviews(db, items)
+            calls = await vapi_service.list_calls(limit=args.search_limit, priority=PRIORITY_BACKGROUND)
+            pairs = []
+            for interview in interviews:
+                matches = vapi_service.match_calls(calls, interview.unique_id, interview.candidate_name)
+                if matches:
+                    pairs.append((interview, matches[0].get("id")))
+                else:
+                    print(f"🔍 No recent call matches {interview.candidate_name} (ID: {interview.id})")
+                    failures += 1
+        else:
+            raw_pairs, bad = _parse_pairs(items)
+            for item in bad:
+                print(f"❌ Expected INTERVIEW:CALL_ID, got {item!r}")
+            interviews, missing = resolve_interviews(db, [ref for ref, _ in raw_pairs])
+            by_ref = {}
+            for interview in interviews:
+                by_ref[str(interview.id)] = by_ref[interview.unique_id] = interview
+            pairs = [(by_ref[ref], call_id) for ref, call_id in raw_pairs if ref in by_ref]
+            failures += len(bad)
+        for ref in missing:
+            print(f"❌ Interview {ref} not found")
+        failures += len(missing)
+
+        if args.verify and pairs:
+            found = await run_concurrently(
+                pairs,
+                lambda pair: vapi_service.get_call_details(pair[1], priority=PRIORITY_BACKGROUND),
+                args.concurrency,
+                label="verify",
+            )
+            verified = []
+            for (interview, call_id), details in zip(pairs, found):
+                if isinstance(details, Exception) or not details:
+                    print(f"❌ Call {call_id} not found on VAPI, not linking {interview.candidate_name}")
+                    failures += 1
+                else:
+                    verified.append((interview, call_id))
+            pairs = verified
+
+        for interview, call_id in pairs:
+            result = interview.result
+            if result is None:
+                db.add(InterviewResult(
+                    interview=interview,
+                    vapi_call_id=call_id,
+                    transcript="",
+                    summary="",
+                    evaluation=None,
+                    call_duration=0
+                ))
+            else:
+                result.vapi_call_id = call_id
+            print(f"✅ Linked call {call_id} to {interview.candidate_name} (ID: {interview.id})")
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+    if pairs:
+        print(f"\nRun `python -m candimind fetch {' '.join(str(i.id) for i, _ in pairs)}` to pull their results.")
+    return 1 if failures else 0
+
+
+def register(subparsers):
+    calls = subparsers.add_parser("calls", help="Inspect calls on the VAPI account")
+    calls_sub = calls.add_subparsers(dest="calls_command", metavar="ACTION", required=True)
+
+    list_parser = calls_sub.add_parser("list", help="List recent calls, newest first")
+    list_parser.add_argument("--limit", type=int, default=20)
+    list_parser.add_argument("--interview", nargs="+", metavar="INTERVIEW",
+                             help="Only calls matching these interviews (id or unique id)")
+    list_parser.add_argument("--json", action="store_true", help="Print the raw VAPI response")
+    list_parser.set_defaults(handler=list_calls)
+
+    link = subparsers.add_parser("link", help="Link VAPI calls to interviews")
+    add_batch_input(link, "ITEM", "INTERVIEW:CALL_ID pairs (interview id or unique id); "
+                                  "with --auto just interview ids")
+    link.add_argument("--auto", action="store_true",
+                      help="Find each interview's call among recent calls by metadata / candidate name")
+    link.add_argument("--search-limit", type=int, default=100, help="Recent calls searched with --auto")
+    link.add_argument("--verify", action="store_true", help="Check each call exists on VAPI first")
+    link.add_argument("--concurrency", type=int, default=5)
+    link.set_defaults(handler=link_calls)
@@ -0,0 +1,76 @@
+import json
+
+from sqlalchemy import func
+
+from candimind.context import add_batch_input, open_session, read_batch_input, resolve_interviews
+from models import Interview, InterviewResult
+from services.reconciliation import find_incomplete_interviews
+
+
+def _print_counts(title: str, rows):
+    print(f"\n{title}")
+    for key, count in rows:
+        print(f"  {key or '-':<16} {count}")
+
+
+def _show(interview: Interview):
+    result = interview.result
+    print(f"\n--- {interview.candidate_name} (ID: {interview.id}, {interview.unique_id}) ---")
+    print(f"Role: {interview.role} | Status: {interview.status} | Updated: {interview.updated_at}")
+    if not result:
+        print("❌ No result record (no webhook or fetch has stored one yet)")
+        return
+    print(f"VAPI Call ID: {result.vapi_call_id or 'None'} | Duration: {result.call_duration}")
+    print(f"Evaluation ({result.evaluation_schema or 'unknown schema'}, {result.evaluation_status or 'unchecked'}):")
+    if result.evaluation_error:
+        print(f"  ⚠️  {result.evaluation_error}")
+    print(json.dumps(result.evaluation, indent=2) if result.evaluation else "None")
+
+
+async def check_db(args) -> int:
+    db = open_session()
+    try:
+        refs = read_batch_input(args)
+        if refs:
+            interviews, missing = resolve_interviews(db, refs)
+            for interview in interviews:
+                _show(interview)
+            for ref in missing:
+                print(f"❌ Interview {ref} not found")
+            return 1 if missing else 0
+
+        total = db.query(func.count(Interview.id)).scalar()
+        print(f"Total Interviews: {total}")
+        _print_counts("By status:", db.query(Interview.status, func.count()).group_by(Interview.status)
+                      .order_by(Interview.status))
+        _print_counts("Evaluations:", db.query(InterviewResult.evaluation_status, func.count())
+                      .group_by(InterviewResult.evaluation_status).order_by(InterviewResult.evaluation_status))
+        unlinked = db.query(func.count(InterviewResult.id)).filter(InterviewResult.vapi_call_id.is_(None)).scalar()
+        print(f"\nResults without a call id: {unlinked}")
+        print(f"Incomplete (reconcile would fetch): {len(find_incomplete_interviews(db))}")
+
+        if args.list or args.candidate or args.status:
+            query = db.query(Interview, InterviewResult.vapi_call_id).outerjoin(
+                InterviewResult, InterviewResult.interview_id == Interview.id
+            )
+            if args.candidate:
+                query = query.filter(Interview.candidate_name.ilike(f"%{args.candidate}%"))
+            if args.status:
+                query = query.filter(Interview.status == args.status)
+            print()
+            for interview, call_id in query.order_by(Interview.id.desc()).limit(args.limit):
+                print(f"ID: {interview.id} | Candidate: {interview.candidate_name} | Role: {interview.role} | "
+                      f"Status: {interview.status} | CallID: {call_id or 'None'}")
+        return 0
+    finally:
+        db.close()
+
+
+def register(subparsers):
+    parser = subparsers.add_parser("check-db", help="Summarise the database, or show given interviews in detail")
+    add_batch_input(parser, "INTERVIEW", "Show these interviews (id or unique id) with their evaluation")
+    parser.add_argument("--list", action="store_true", help="Also list interviews, newest first")
+    parser.add_argument("--candidate", help="List interviews whose candidate name contains this")
+    parser.add_argument("--status", help="List interviews with this status")
+    parser.add_argument("--limit", type=int, default=50, help="Max interviews listed")
+    parser.set_defaults(handler=check_db)
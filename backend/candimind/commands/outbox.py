@@ -0,0 +1,55 @@
+from datetime import datetime
+
+from database import SessionLocal
+from models import OutboxEvent
+from services.outbox import DEAD, PENDING, SENT, outbox_counts, outbox_dispatcher
+
+
+async def outbox(args) -> int:
+    """Show the notification outbox; optionally retry dead events and send what's due now"""
+    db = SessionLocal()
+    try:
+        if args.retry_dead:
+            revived = db.query(OutboxEvent).filter(OutboxEvent.status == DEAD).update(
+                {"status": PENDING, "attempts": 0, "next_attempt_at": datetime.utcnow()}, synchronize_session=False
+            )
+            db.commit()
+            print(f"🔁 {revived} dead events will be retried")
+    finally:
+        db.close()
+
+    if args.drain:
+        try:
+            print(f"📨 Dispatched: {await outbox_dispatcher.run_once()}")
+        finally:
+            await outbox_dispatcher.aclose()
+
+    db = SessionLocal()
+    try:
+        rows = outbox_counts(db)
+        if not rows:
+            print("Outbox is empty")
+        for destination, status, count in rows:
+            print(f"  {destination:<60} {status:<8} {count}")
+        if args.errors:
+            failing = (
+                db.query(OutboxEvent)
+                .filter(OutboxEvent.last_error.isnot(None), OutboxEvent.status != SENT)
+                .order_by(OutboxEvent.id.desc())
+                .limit(args.errors)
+            )
+            for event in failing:
+                print(f"\n#{event.id} {event.event_type} -> {event.destination} "
+                      f"({event.status}, {event.attempts} attempts, next {event.next_attempt_at:%Y-%m-%d %H:%M:%S})")
+                print(f"  ⚠️  {event.last_error}")
+    finally:
+        db.close()
+    return 0
+
+
+def register(subparsers):
+    parser = subparsers.add_parser("outbox", help="Show and drain the notification outbox")
+    parser.add_argument("--drain", action="store_true", help="Send everything that's due now")
+    parser.add_argument("--retry-dead", action="store_true", help="Retry events that ran out of attempts")
+    parser.add_argument("--errors", type=int, default=0, metavar="N", help="Show the last N failing events")
+    parser.set_defaults(handler=outbox)
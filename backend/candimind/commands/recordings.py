@@ -0,0 +1,52 @@
+from sqlalchemy import func
+
+from database import SessionLocal
+from models import CallRecording
+from services.recordings import FAILED, PENDING, STORED, backfill_recordings, recording_downloader
+
+
+def _counts() -> dict:
+    db = SessionLocal()
+    try:
+        return dict(db.query(CallRecording.status, func.count()).group_by(CallRecording.status).all())
+    finally:
+        db.close()
+
+
+async def sync_recordings(args) -> int:
+    """Download pending call recordings now (optionally queueing ones found in stored webhooks)"""
+    if args.backfill:
+        print(f"📼 Queued {backfill_recordings()} recordings from stored webhook payloads")
+    if args.retry_failed:
+        db = SessionLocal()
+        try:
+            reset = db.query(CallRecording).filter(CallRecording.status == FAILED).update(
+                {"status": PENDING, "attempts": 0}, synchronize_session=False
+            )
+            db.commit()
+        finally:
+            db.close()
+        print(f"🔁 {reset} failed recordings will be retried")
+
+    totals = {STORED: 0, FAILED: 0, "skipped": 0}
+    try:
+        while True:
+            outcomes = await recording_downloader.run_once()
+            for outcome, count in outcomes.items():
+                totals[outcome] += count
+            if not outcomes[STORED]:
+                break  # Nothing left, or only failures waiting for their backoff
+    finally:
+        await recording_downloader.aclose()
+
+    print(f"\nDone: {totals}")
+    print("Recordings: " + ", ".join(f"{status} {count}" for status, count in sorted(_counts().items())))
+    return 1 if totals[FAILED] else 0
+
+
+def register(subparsers):
+    parser = subparsers.add_parser("recordings", help="Download pending call recordings")
+    parser.add_argument("--backfill", action="store_true",
+                        help="First queue recordings of results stored before downloads were enabled")
+    parser.add_argument("--retry-failed", action="store_true", help="Retry recordings that ran out of attempts")
+    parser.set_defaults(handler=sync_recordings)
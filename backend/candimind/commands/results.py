@@ -0,0 +1,78 @@
+from candimind.context import Progress, add_batch_input, open_session, read_batch_input, resolve_interviews
+from services.reconciliation import (
+    find_incomplete_interviews, reconcile_interviews, UPDATED, NOT_READY, UNRESOLVED, INVALID
+)
+
+ICONS = {UPDATED: "✅", NOT_READY: "⏳", UNRESOLVED: "🔍", INVALID: "⚠️"}
+
+
+async def _reconcile(db, interviews, args, label: str) -> dict:
+    progress = Progress(len(interviews), label)
+
+    def report(done, total, interview, outcome):
+        icon = ICONS.get(outcome, "❌")
+        quiet = args.quiet and outcome == UPDATED
+        progress.advance(None if quiet else f"{icon} {interview.candidate_name} (ID: {interview.id}): {outcome}")
+
+    try:
+        return await reconcile_interviews(
+            db,
+            interviews,
+            concurrency=args.concurrency,
+            batch_size=args.batch_size,
+            search_limit=args.search_limit,
+            progress=report
+        )
+    finally:
+        progress.close()
+
+
+async def fetch_results(args) -> int:
+    """Fetch results from VAPI for specific interviews (calls are found if not linked yet)"""
+    refs = read_batch_input(args)
+    if not refs:
+        print("❌ No interviews given")
+        return 2
+
+    db = open_session()
+    try:
+        interviews, missing = resolve_interviews(db, refs)
+        for ref in missing:
+            print(f"❌ Interview {ref} not found")
+        summary = await _reconcile(db, interviews, args, "fetch")
+    finally:
+        db.close()
+    print(f"\nDone: {summary}")
+    return 1 if missing or summary["total"] != summary[UPDATED] else 0
+
+
+async def reconcile(args) -> int:
+    """Fetch missing results for every incomplete interview"""
+    db = open_session()
+    try:
+        interviews = find_incomplete_interviews(db, limit=args.limit)
+        summary = await _reconcile(db, interviews, args, "reconcile")
+    finally:
+        db.close()
+    print(f"\nDone: {summary}")
+    return 0
+
+
+def _add_fetch_options(parser):
+    parser.add_argument("--concurrency", type=int, default=5, help="VAPI requests in flight")
+    parser.add_argument("--batch-size", type=int, default=20, help="Interviews per database transaction")
+    parser.add_argument("--search-limit", type=int, default=100,
+                        help="Recent calls searched for interviews without a linked call")
+    parser.add_argument("--quiet", "-q", action="store_true", help="Only print interviews that didn't update")
+
+
+def register(subparsers):
+    fetch = subparsers.add_parser("fetch", help="Fetch results from VAPI for the given interviews")
+    add_batch_input(fetch, "INTERVIEW", "Interview id or unique id")
+    _add_fetch_options(fetch)
+    fetch.set_defaults(handler=fetch_results)
+
+    rec = subparsers.add_parser("reconcile", help="Fetch missing results for all incomplete interviews")
+    rec.add_argument("--limit", type=int, default=None)
+    _add_fetch_options(rec)
+    rec.set_defaults(handler=reconcile)
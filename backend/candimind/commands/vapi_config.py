@@ -0,0 +1,81 @@
+import asyncio
+import json
+
+from config import get_settings
+from services.config_sync import ConfigSync, load_manifest
+from services.rate_limiter import PRIORITY_BACKGROUND
+from services.vapi_service import vapi_service
+
+settings = get_settings()
+
+
+async def sync_config(args) -> int:
+    """Sync assistants and structured outputs on VAPI with vapi-prompts/ (see vapi-sync.json)"""
+    if not args.apply:
+        print("🔍 Dry run - pass --apply to update VAPI\n")
+    summary = await ConfigSync().run(dry_run=not args.apply)
+    print(f"\nDone: {summary}")
+    return 1 if summary["failed"] else 0
+
+
+async def check_config(args) -> int:
+    """Show the live configuration of every assistant declared in vapi-sync.json"""
+    assistants = {}
+    for spec in load_manifest().get("assistants", []):
+        assistant_id = getattr(settings, spec["id_setting"], None)
+        if assistant_id:
+            assistants[spec["name"]] = assistant_id
+        else:
+            print(f"⏭️  {spec['name']}: {spec['id_setting'].upper()} not set")
+
+    remote_assistants, remote_outputs = await asyncio.gather(
+        asyncio.gather(
+            *(vapi_service.get_assistant(a, priority=PRIORITY_BACKGROUND) for a in assistants.values()),
+            return_exceptions=True
+        ),
+        vapi_service.list_structured_outputs(priority=PRIORITY_BACKGROUND),
+        return_exceptions=True
+    )
+    if isinstance(remote_assistants, Exception):
+        raise remote_assistants
+    if isinstance(remote_outputs, Exception):
+        print(f"❌ Could not list structured outputs: {remote_outputs}")
+        remote_outputs = []
+    output_names = {o.get("id"): o.get("name") for o in remote_outputs if isinstance(o, dict)}
+
+    if args.raw:
+        print(json.dumps({
+            "assistants": {name: (r if isinstance(r, dict) else str(r))
+                           for name, r in zip(assistants, remote_assistants)},
+            "structured_outputs": remote_outputs,
+        }, indent=2))
+        return 0
+
+    failed = 0
+    for (name, assistant_id), data in zip(assistants.items(), remote_assistants):
+        print(f"\n{'=' * 50}\n{name} Assistant (ID: {assistant_id})\n{'=' * 50}")
+        if isinstance(data, Exception):
+            print(f"❌ Failed to fetch assistant: {data}")
+            failed += 1
+            continue
+        server = data.get("server") or {}
+        print(f"Name: {data.get('name', 'Unnamed')}")
+        print(f"Server URL: {server.get('url') or data.get('serverUrl') or 'None'}")
+        print(f"Model: {(data.get('model') or {}).get('model')}")
+        for output_id in (data.get("artifactPlan") or {}).get("structuredOutputIds", []):
+            print(f"  -> Structured output {output_names.get(output_id, '❓ unknown')} ({output_id})")
+
+    print(f"\nStructured outputs on the account: {len(remote_outputs)}")
+    for output in remote_outputs:
+        print(f"  {output.get('name')} ({output.get('id')})")
+    return 1 if failed else 0
+
+
+def register(subparsers):
+    sync = subparsers.add_parser("sync-config", help="Sync VAPI assistants and structured outputs with vapi-prompts/")
+    sync.add_argument("--apply", action="store_true", help="Apply changes (default is a dry run)")
+    sync.set_defaults(handler=sync_config)
+
+    check = subparsers.add_parser("check-config", help="Show the live VAPI assistant configuration")
+    check.add_argument("--raw", action="store_true", help="Print the full JSON returned by VAPI")
+    check.set_defaults(handler=check_config)
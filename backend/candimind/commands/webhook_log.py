@@ -0,0 +1,42 @@
+from services.webhook_log import LOG_PATH, find_entries, read_blocks, read_index, rebuild_index
+
+
+async def query_webhook_log(args) -> int:
+    """Query webhook_debug.log through its offset index instead of scanning the file"""
+    if args.rebuild:
+        print(f"✅ Indexed {rebuild_index(args.log)} webhook blocks")
+        return 0
+
+    matches = find_entries(
+        read_index(args.log),
+        call_id=args.call_id,
+        event_type=args.event,
+        since=args.since,
+        until=args.until
+    )
+    if args.tail:
+        matches = matches[-args.tail:]
+
+    if not matches:
+        print("❌ No matching webhooks found")
+        return 1
+    if args.list:
+        for e in matches:
+            print(f"{e['timestamp']}  {e['event_type'] or '-':<24} {e['call_id'] or '-':<40} @{e['offset']}")
+    else:
+        for block in read_blocks(matches, args.log):
+            print(block)
+    return 0
+
+
+def register(subparsers):
+    parser = subparsers.add_parser("webhook-log", help="Query the indexed webhook debug log")
+    parser.add_argument("--log", default=LOG_PATH, help="Path to webhook_debug.log")
+    parser.add_argument("--call-id", help="Call id or call id prefix")
+    parser.add_argument("--event", help="Event type, e.g. end-of-call-report")
+    parser.add_argument("--since", help="ISO timestamp (UTC), inclusive")
+    parser.add_argument("--until", help="ISO timestamp (UTC), inclusive")
+    parser.add_argument("--tail", type=int, help="Only the last N matching blocks")
+    parser.add_argument("--list", action="store_true", help="Print index entries instead of blocks")
+    parser.add_argument("--rebuild", action="store_true", help="Rebuild the index from the log")
+    parser.set_defaults(handler=query_webhook_log)
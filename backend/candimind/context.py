@@ -0,0 +1,128 @@
+import asyncio
+import shutil
+import sys
+from typing import Awaitable, Callable, Iterable
+
+from sqlalchemy.orm import Session
+
+from database import SessionLocal
+from models import Interview
+
+
+def open_session() -> Session:
+    """Session shared by a whole command; loaded objects stay usable across commits"""
+    return SessionLocal(expire_on_commit=False)
+
+
+def add_batch_input(parser, metavar: str, help: str):
+    """Positional ids plus --file (one per line, '#' comments, '-' for stdin)"""
+    parser.add_argument("items", nargs="*", metavar=metavar, help=help)
+    parser.add_argument("--file", "-f", help="Read more items from a file, one per line ('-' for stdin)")
+
+
+def read_batch_input(args) -> list[str]:
+    """Items from the command line and --file, de-duplicated, in order"""
+    items = list(args.items)
+    if args.file:
+        stream = sys.stdin if args.file == "-" else open(args.file, "r", encoding="utf-8")
+        try:
+            for line in stream:
+                line = line.split("#", 1)[0].strip()
+                if line:
+                    items.append(line)
+        finally:
+            if stream is not sys.stdin:
+                stream.close()
+    return list(dict.fromkeys(items))
+
+
+def resolve_interviews(db: Session, refs: Iterable[str]) -> tuple[list[Interview], list[str]]:
+    """
+    Look up interviews by database id or unique id, in one query each
+
+    Returns (interviews in the order given, refs that matched nothing).
+    """
+    refs = list(refs)
+    numeric = [int(ref) for ref in refs if ref.isdigit()]
+    found = db.query(Interview).filter(
+        Interview.id.in_(numeric) | Interview.unique_id.in_(refs)
+    ).all() if refs else []
+    by_id = {str(i.id): i for i in found}
+    by_uid = {i.unique_id: i for i in found}
+
+    interviews, missing = [], []
+    for ref in refs:
+        interview = by_uid.get(ref) or by_id.get(ref)
+        if interview is None:
+            missing.append(ref)
+        elif interview not in interviews:
+            interviews.append(interview)
+    return interviews, missing
+
+
+class Progress:
+    """
+    Single-line progress bar on stderr; messages are printed above it
+
+    Falls back to plain "[done/total]" lines when stderr isn't a terminal.
+    """
+
+    def __init__(self, total: int, label: str = ""):
+        self.total = total
+        self.label = label
+        self.done = 0
+        self.interactive = sys.stderr.isatty()
+
+    def _bar(self) -> str:
+        width = max(10, min(40, shutil.get_terminal_size().columns - 30 - len(self.label)))
+        filled = int(width * self.done / self.total) if self.total else width
+        return f"{self.label} [{'#' * filled}{'-' * (width - filled)}] {self.done}/{self.total}"
+
+    def _clear(self):
+        if self.interactive:
+            sys.stderr.write("\r\033[K")
+
+    def advance(self, message: str | None = None):
+        self.done += 1
+        self._clear()
+        if message:
+            print(message if self.interactive else f"[{self.done}/{self.total}] {message}")
+        if self.interactive:
+            sys.stderr.write(self._bar())
+            sys.stderr.flush()
+
+    def close(self):
+        self._clear()
+        if self.interactive:
+            sys.stderr.flush()
+
+
+async def run_concurrently(
+    items: list,
+    worker: Callable[[object], Awaitable],
+    concurrency: int,
+    label: str = "",
+    describe: Callable[[object, object], str | None] | None = None,
+) -> list:
+    """
+    Run `worker` over `items` with at most `concurrency` in flight, showing progress
+
+    Exceptions are returned in place of results. `describe(item, result)`
+    returns the line to print when an item finishes (None for nothing).
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    progress = Progress(len(items), label)
+
+    async def run(item):
+        async with semaphore:
+            try:
+                result = await worker(item)
+            except Exception as e:
+                result = e
+        progress.advance(describe(item, result) if describe else None)
+        return result
+
+    try:
+        return await asyncio.gather(*(run(item) for item in items))
+    finally:
+        progress.close()
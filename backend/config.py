@@ -10,9 +10,85 @@ class Settings(BaseSettings):
     vapi_api_key: str
     vapi_phone_number_id: str | None = None
     vapi_scholarship_assistant_id: str | None = None
+    vapi_assistant_frontend_id: str | None = None
+    vapi_assistant_backend_id: str | None = None
+    
+    # VAPI rate limiting (shared across workers and scripts)
+    vapi_rate_limit_per_second: float = 2.0  # 0 disables limiting
+    vapi_rate_limit_burst: int = 10
+    vapi_rate_limit_reserved_fraction: float = 0.3  # Share of the burst kept for user-facing calls
+    vapi_rate_limit_backend: str = "sql"  # sql, file or redis
+    vapi_rate_limit_file: str = str(Path(__file__).parent / ".vapi_rate_limit.json")
+    vapi_rate_limit_redis_url: str = "redis://localhost:6379/0"
+    
+    # VAPI circuit breaker (per worker): fail fast while VAPI is erroring or slow
+    vapi_timeout_seconds: float = 30.0
+    vapi_circuit_window: int = 20  # Recent calls the error/slow rates are computed over
+    vapi_circuit_min_calls: int = 5
+    vapi_circuit_failure_rate: float = 0.5
+    vapi_circuit_slow_call_seconds: float = 10.0
+    vapi_circuit_slow_rate: float = 0.8
+    vapi_circuit_open_seconds: float = 30.0  # Cool-down before probing again
+    vapi_circuit_half_open_probes: int = 2
+    
+    # Background reconciliation of interviews missing results
+    reconcile_interval_minutes: int = 0  # 0 disables the scheduled task
+    reconcile_concurrency: int = 5
+    evaluation_refetch_attempts: int = 3  # Fetches of a schema-invalid evaluation before giving up
+    
+    # Retention: completed interviews older than this move to Parquet (see services/archive.py)
+    archive_after_days: int = 0  # 0 keeps everything in the database
+    archive_role_days: str = ""  # Per-role overrides, e.g. "Fulbright PhD=365,Global UGRAD=90" (0 = never)
+    archive_dir: str = str(Path(__file__).parent / "archive")
+    archive_interval_hours: float = 24.0  # How often the policy runs while archiving is enabled
+    
+    # Call recordings, downloaded from VAPI in the background and served with Range support
+    recordings_enabled: bool = True
+    recordings_dir: str = str(Path(__file__).parent / "recordings")
+    recording_download_concurrency: int = 3
+    recording_max_attempts: int = 5  # Failed downloads are retried with backoff up to this many times
+    recording_retry_minutes: float = 5.0  # Backoff before the first retry (doubles per attempt)
+    recording_allowed_hosts: str = "storage.vapi.ai"  # Comma-separated; subdomains included, https only
+    recording_max_mb: int = 500  # Larger downloads are abandoned
+    
+    # Notifications when interviews complete (transactional outbox, see services/outbox.py)
+    notify_emails: str = ""  # Comma-separated HR recipients; empty disables email
+    notify_webhook_urls: str = ""  # Comma-separated URLs that receive batched JSON events
+    notify_webhook_secret: str | None = None  # Signs webhook bodies (X-Candimind-Signature: sha256=<hmac>)
+    smtp_host: str = "localhost"  # Local stand-in for development: python -m aiosmtpd -n -l localhost:1025
+    smtp_port: int = 1025
+    smtp_username: str | None = None
+    smtp_password: str | None = None
+    smtp_starttls: bool = False
+    smtp_from: str = "candimind@localhost"
+    outbox_batch_size: int = 50  # Events sent per SMTP session / webhook request
+    outbox_poll_seconds: float = 30.0  # Rescan interval; new events are dispatched right after commit
+    outbox_max_attempts: int = 8  # Then the event is marked dead (see `candimind outbox`)
+    outbox_email_concurrency: int = 1  # SMTP sessions at once
+    outbox_webhook_concurrency: int = 2  # Requests in flight per webhook URL
+    
+    # Admission control for live calls (see services/admission.py)
+    admission_max_concurrent_calls: int = 0  # Your VAPI concurrency limit; 0 disables the queue
+    admission_hold_seconds: int = 90  # An admitted candidate's slot is kept this long for the call to start
+    admission_poll_seconds: int = 5  # How often waiting candidate pages check in
+    admission_waiting_timeout_seconds: int = 30  # Waiting candidates that stop checking in lose their place
+    admission_max_call_minutes: int = 60  # Calls without an end-of-call report free their slot after this
+    admission_default_call_minutes: float = 20.0  # Call length for wait estimates until there's history
     
     # Database
     database_url: str = "sqlite:///./interviews.db"
+    database_replica_urls: str = ""  # Comma-separated read replica URLs
+    read_your_writes_seconds: float = 5.0  # Reads stay on the primary this long after a client's write
+    
+    # SQLite tuning (ignored for other databases)
+    sqlite_wal: bool = True  # WAL journal + synchronous=NORMAL
+    sqlite_busy_timeout_ms: int = 5000
+    sqlite_cache_size_mb: int = 64
+    sqlite_mmap_size_mb: int = 256
+    
+    # Webhook writes are group-committed by one writer per worker
+    write_queue_max_batch: int = 100
+    write_queue_max_delay_ms: float = 2.0  # How long the writer waits for more writes to batch
     
     # Server URLs
     backend_url: str = "http://localhost:8000"
@@ -21,6 +97,18 @@ class Settings(BaseSettings):
     # Security
     secret_key: str
     
+    # Profiling (send X-Profile-Token to profile a single request)
+    profiling_token: str | None = None
+    profiling_sample_rate: float = 0.0  # Fraction of requests profiled automatically
+    profiling_dir: str = str(Path(__file__).parent / "profiles")
+    
+    # Tracing (OpenTelemetry, optional; see services/tracing.py)
+    tracing_exporter: str = ""  # Empty (off), otlp, file or console
+    tracing_otlp_endpoint: str = "http://localhost:4318/v1/traces"
+    tracing_file: str = str(Path(__file__).parent / "traces" / "spans.jsonl")
+    tracing_service_name: str = "candimind-backend"
+    tracing_sample_rate: float = 1.0  # Fraction of new traces recorded
+    
     model_config = SettingsConfigDict(
         env_file=str(Path(__file__).parent / ".env"),
         case_sensitive=False
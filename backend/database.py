@@ -1,19 +1,103 @@
-from sqlalchemy import create_engine
+from contextvars import ContextVar
+import itertools
+import time
+from fastapi import Request
+from sqlalchemy import create_engine, event
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from config import get_settings
 
 settings = get_settings()
 
-# Create SQLAlchemy engine
-connect_args = {"check_same_thread": False} if "sqlite" in settings.database_url else {}
-engine = create_engine(
-    settings.database_url,
-    connect_args=connect_args
-)
+
+def _tune_sqlite(target_engine):
+    """
+    Production profile for SQLite, applied to every new connection
+
+    WAL lets dashboard reads run while a webhook commits, synchronous=NORMAL
+    only fsyncs at checkpoints, and busy_timeout makes writers wait for the
+    lock instead of failing with "database is locked".
+    """
+
+    @event.listens_for(target_engine, "connect")
+    def _on_connect(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        if settings.sqlite_wal:
+            cursor.execute("PRAGMA journal_mode=WAL")
+            cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute(f"PRAGMA busy_timeout={int(settings.sqlite_busy_timeout_ms)}")
+        cursor.execute(f"PRAGMA cache_size=-{int(settings.sqlite_cache_size_mb) * 1024}")
+        cursor.execute(f"PRAGMA mmap_size={int(settings.sqlite_mmap_size_mb) * 1024 * 1024}")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.close()
+
+    @event.listens_for(target_engine, "begin")
+    def _on_begin(conn):
+        # The write queue takes the write lock up front, so the reads inside
+        # its transaction never have to upgrade (which fails instantly in WAL
+        # instead of waiting for busy_timeout). Other sessions keep pysqlite's
+        # default of starting the transaction at the first write.
+        if conn.get_execution_options().get("sqlite_immediate"):
+            conn.exec_driver_sql("BEGIN IMMEDIATE")
+
+
+def _create_engine(database_url: str, tune_sqlite: bool = True):
+    is_sqlite = database_url.startswith("sqlite")
+    connect_args = {"check_same_thread": False} if is_sqlite else {}
+    new_engine = create_engine(
+        database_url,
+        connect_args=connect_args
+    )
+    if is_sqlite and tune_sqlite:
+        _tune_sqlite(new_engine)
+    return new_engine
+
+
+# Create SQLAlchemy engine (primary, receives all writes)
+engine = _create_engine(settings.database_url)
+
+# Optional read replicas for read-only routes
+replica_engines = [
+    _create_engine(url.strip())
+    for url in settings.database_replica_urls.split(",")
+    if url.strip()
+]
+
+# Per-request SQL accounting. services.profiling puts a QueryStats object here
+# for profiled requests; the engine hooks below feed every statement into it.
+query_stats: ContextVar = ContextVar("query_stats", default=None)
+
+
+def instrument_engine(target_engine):
+    """Attach statement timing hooks to an engine"""
+
+    @event.listens_for(target_engine, "before_cursor_execute")
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        context._query_started_at = time.perf_counter()
+
+    @event.listens_for(target_engine, "after_cursor_execute")
+    def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        stats = query_stats.get()
+        if stats is not None:
+            stats.record(statement, time.perf_counter() - context._query_started_at)
+
+
+for _engine in [engine, *replica_engines]:
+    instrument_engine(_engine)
 
 # Create session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+ReplicaSessionLocal = sessionmaker(autocommit=False, autoflush=False)
+_replica_cycle = itertools.cycle(replica_engines)
+
+# Clients echo the last X-Last-Write-At they received; reads within
+# READ_YOUR_WRITES_SECONDS of it go to the primary so they see their own changes
+LAST_WRITE_HEADER = "X-Last-Write-At"
+
+
+@event.listens_for(ReplicaSessionLocal, "before_flush")
+def _reject_replica_writes(session, flush_context, instances):
+    raise RuntimeError("Attempted to write through a read-replica session; use get_db instead")
 
 # Base class for models
 Base = declarative_base()
@@ -28,6 +112,35 @@ def get_db():
         db.close()
 
 
+def _wrote_recently(request: Request) -> bool:
+    try:
+        last_write = float(request.headers.get(LAST_WRITE_HEADER, 0))
+    except ValueError:
+        return False
+    return time.time() - last_write < settings.read_your_writes_seconds
+
+
+def create_read_session(request: Request | None = None):
+    """
+    Session for read-only work
+    
+    Uses a read replica (round-robin) unless none is configured or the client
+    made a write within the read-your-writes window.
+    """
+    if not replica_engines or (request is not None and _wrote_recently(request)):
+        return SessionLocal()
+    return ReplicaSessionLocal(bind=next(_replica_cycle))
+
+
+def get_read_db(request: Request):
+    """Dependency for read-only routes (see create_read_session)"""
+    db = create_read_session(request)
+    try:
+        yield db
+    finally:
+        db.close()
+
+
 def init_db():
     """Initialize database tables"""
     Base.metadata.create_all(bind=engine)
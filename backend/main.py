@@ -1,9 +1,24 @@
-from fastapi import FastAPI, Request, Depends
+import asyncio
+import math
+import time
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
-from sqlalchemy.orm import Session
-from database import init_db, get_db
-from routes import interviews, webhooks
+from database import init_db, SessionLocal, LAST_WRITE_HEADER
+from routes import interviews, webhooks, rankings
 from config import get_settings
+from services.profiling import ProfilingMiddleware
+from services.tracing import TracingMiddleware, setup_tracing, shutdown_tracing
+from services.reconciliation import reconciliation_loop
+from services.archive import archive_loop, archiving_enabled
+from services.recordings import recording_downloader
+from services.outbox import outbox_dispatcher
+from services.admission import admission_enabled, admission_snapshot
+from services.search_index import init_search_index, rebuild_search_index
+from services.duplicate_index import needs_backfill, rebuild_duplicate_index
+from services.vapi_service import vapi_service
+from services.write_queue import write_queue
+from services.circuit_breaker import CircuitOpenError, vapi_circuit, OPEN
 
 settings = get_settings()
 
@@ -26,11 +41,39 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[LAST_WRITE_HEADER, "ETag"],
 )
 
+
+@app.middleware("http")
+async def mark_writes(request: Request, call_next):
+    """Stamp successful mutations so the client's next reads skip lagging replicas"""
+    response = await call_next(request)
+    if request.method not in ("GET", "HEAD", "OPTIONS") and response.status_code < 400:
+        response.headers[LAST_WRITE_HEADER] = f"{time.time():.3f}"
+    return response
+
+# On-demand request profiling (X-Profile-Token header or sampling)
+app.add_middleware(ProfilingMiddleware)
+
+# Request spans when TRACING_EXPORTER is set (outermost, so they include the other middleware)
+if setup_tracing():
+    app.add_middleware(TracingMiddleware)
+
+@app.exception_handler(CircuitOpenError)
+async def circuit_open_handler(request: Request, exc: CircuitOpenError):
+    """VAPI is known to be down: answer immediately instead of waiting on timeouts"""
+    retry_after = max(1, math.ceil(exc.retry_after))
+    return JSONResponse(
+        status_code=503,
+        content={"detail": f"{exc.name} is temporarily unavailable. Please try again in {retry_after}s."},
+        headers={"Retry-After": str(retry_after)},
+    )
+
 # Include routers
 app.include_router(interviews.router)
 app.include_router(webhooks.router)
+app.include_router(rankings.router)
 
 
 @app.on_event("startup")
@@ -39,10 +82,39 @@ async def startup_event():
     print("🚀 Starting AI Interview Platform API...")
     init_db()
     print("✅ Database initialized")
+    if init_search_index():
+        print(f"🔎 Search index built, indexed {rebuild_search_index()} interviews")
+    db = SessionLocal()
+    try:
+        backfill = needs_backfill(db)
+    finally:
+        db.close()
+    if backfill:
+        print(f"🧬 Duplicate index built for {rebuild_duplicate_index()} transcripts")
+    if settings.reconcile_interval_minutes > 0:
+        asyncio.create_task(reconciliation_loop())
+        print(f"🔁 Reconciling incomplete interviews every {settings.reconcile_interval_minutes} min")
+    if settings.recordings_enabled:
+        recording_downloader.start()
+        recording_downloader.wake()  # Pick up downloads left over from the last run
+    outbox_dispatcher.start()
+    outbox_dispatcher.wake()  # Send notifications left over from the last run
+    if archiving_enabled():
+        asyncio.create_task(archive_loop())
+        print(f"🗄️  Archiving completed interviews every {settings.archive_interval_hours:g} h")
     print(f"📡 Backend URL: {settings.backend_url}")
     print(f"🌐 Frontend URL: {settings.frontend_url}")
 
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    await write_queue.aclose()
+    await recording_downloader.aclose()
+    await outbox_dispatcher.aclose()
+    await vapi_service.aclose()
+    shutdown_tracing()
+
+
 @app.get("/")
 async def root():
     """Health check endpoint"""
@@ -54,23 +126,37 @@ async def root():
 
 
 @app.post("/")
-async def diagnostic_root(request: Request, db: Session = Depends(get_db)):
+async def diagnostic_root(request: Request):
     """Diagnostic route to catch and redirect misdirected VAPI webhooks"""
     data = await request.json()
     print(f"📡 DIAGNOSTIC WEBHOOK: {data.get('type')}")
     from routes.webhooks import handle_status_update
-    await handle_status_update(data, db)
+    await handle_status_update(data)
     return {"status": "success", "message": "LIVE_BACKEND_READY"}
 
 
 @app.get("/health")
 async def health_check():
     """Detailed health check"""
+    vapi_state = vapi_circuit.state
     return {
-        "status": "healthy",
+        "status": "degraded" if vapi_state == OPEN else "healthy",
         "database": "connected",
-        "vapi": "configured"
+        "vapi": "configured",
+        "vapi_circuit": vapi_state
+    }
+
+
+@app.get("/metrics")
+async def metrics():
+    """Runtime counters for dashboards and alerting"""
+    counters = {
+        "vapi_circuit": vapi_circuit.snapshot(),
+        "write_queue": write_queue.stats
     }
+    if admission_enabled():
+        counters["admission"] = await asyncio.to_thread(admission_snapshot)
+    return counters
 
 
 if __name__ == "__main__":
@@ -0,0 +1,36 @@
+"""
+Add the archive columns (archived_at, archive_path) to interview_results
+Run this ONCE after updating your code (safe to re-run)
+
+Needed before enabling ARCHIVE_AFTER_DAYS / ARCHIVE_ROLE_DAYS; existing rows
+start out unarchived.
+"""
+
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from sqlalchemy import inspect, text
+
+from database import engine
+
+
+def migrate():
+    columns = {col["name"] for col in inspect(engine).get_columns("interview_results")}
+    with engine.begin() as conn:
+        if "archived_at" not in columns:
+            print("Adding archived_at column to interview_results...")
+            conn.execute(text("ALTER TABLE interview_results ADD COLUMN archived_at TIMESTAMP"))
+        if "archive_path" not in columns:
+            print("Adding archive_path column to interview_results...")
+            conn.execute(text("ALTER TABLE interview_results ADD COLUMN archive_path VARCHAR(500)"))
+
+
+if __name__ == "__main__":
+    try:
+        migrate()
+        print("✅ Migration completed successfully!")
+    except Exception as e:
+        print(f"❌ Error during migration: {e}")
+        sys.exit(1)
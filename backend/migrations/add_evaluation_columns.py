@@ -0,0 +1,89 @@
+"""
+Add evaluation validation and typed score columns to interview_results
+Run this ONCE after updating your code (safe to re-run)
+
+Existing evaluations are validated and their scores copied into the new
+columns in batches. Works with any DATABASE_URL (SQLite or PostgreSQL).
+"""
+
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from sqlalchemy import inspect, text
+
+from database import engine, SessionLocal
+from models import InterviewResult
+from services.evaluation_schema import apply_evaluation_checks
+from services.results import EVALUATION_OUTPUT_NAMES
+
+NEW_COLUMNS = [
+    ("evaluation_schema", "VARCHAR(100)"),
+    ("evaluation_status", "VARCHAR(20)"),
+    ("evaluation_error", "TEXT"),
+    ("evaluation_fetch_attempts", "INTEGER NOT NULL DEFAULT 0"),
+    ("overall_score", "FLOAT"),
+    ("communication_clarity", "FLOAT"),
+    ("culture_fit_ownership", "FLOAT"),
+]
+INDEXED = ["evaluation_status", "overall_score", "communication_clarity", "culture_fit_ownership"]
+
+
+def add_columns():
+    existing = {col["name"] for col in inspect(engine).get_columns("interview_results")}
+    with engine.begin() as conn:
+        for name, ddl in NEW_COLUMNS:
+            if name not in existing:
+                print(f"Adding {name} column to interview_results...")
+                conn.execute(text(f"ALTER TABLE interview_results ADD COLUMN {name} {ddl}"))
+        for name in INDEXED:
+            conn.execute(text(
+                f"CREATE INDEX IF NOT EXISTS ix_interview_results_{name} ON interview_results ({name})"
+            ))
+
+
+def output_name_of(raw_webhook_data) -> str | None:
+    """Structured output name recorded in the stored webhook payload, if any"""
+    outputs = ((raw_webhook_data or {}).get("artifact") or {}).get("structuredOutputs") or {}
+    for output in outputs.values():
+        if isinstance(output, dict) and output.get("name") in EVALUATION_OUTPUT_NAMES:
+            return output.get("name")
+    return None
+
+
+def backfill(batch_size: int = 500) -> int:
+    db = SessionLocal()
+    try:
+        done = 0
+        last_id = 0
+        while True:
+            batch = (
+                db.query(InterviewResult)
+                .filter(InterviewResult.id > last_id, InterviewResult.evaluation_status.is_(None))
+                .order_by(InterviewResult.id)
+                .limit(batch_size)
+                .all()
+            )
+            if not batch:
+                return done
+            for result in batch:
+                if result.evaluation is not None:
+                    result.evaluation_schema = result.evaluation_schema or output_name_of(result.raw_webhook_data)
+                    apply_evaluation_checks(result)
+            last_id = batch[-1].id
+            db.commit()
+            db.expunge_all()
+            done += len(batch)
+            print(f"  {done} results checked")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    try:
+        add_columns()
+        print(f"✅ Migration completed successfully! Backfilled {backfill()} results.")
+    except Exception as e:
+        print(f"❌ Error during migration: {e}")
+        sys.exit(1)
@@ -0,0 +1,52 @@
+"""
+Index evaluations for server-side filtering on interview_results
+Run this ONCE after updating your code (safe to re-run)
+
+PostgreSQL: converts `evaluation` to JSONB and adds overall_recommendation as
+a stored generated column. SQLite: adds overall_recommendation as a virtual
+generated column (SQLite can't add stored ones to an existing table).
+Both get an index on it; the database fills it, so there is nothing to backfill.
+"""
+
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from sqlalchemy import inspect, text
+from sqlalchemy.schema import CreateColumn
+
+from database import engine
+from models import InterviewResult
+
+
+def migrate():
+    columns = {col["name"]: col for col in inspect(engine).get_columns("interview_results")}
+    is_postgres = engine.dialect.name == "postgresql"
+    with engine.begin() as conn:
+        if is_postgres and columns["evaluation"]["type"].__class__.__name__ != "JSONB":
+            print("Converting evaluation column to JSONB...")
+            conn.execute(text(
+                "ALTER TABLE interview_results ALTER COLUMN evaluation TYPE JSONB USING evaluation::jsonb"
+            ))
+
+        if "overall_recommendation" not in columns:
+            print("Adding overall_recommendation column to interview_results...")
+            ddl = str(CreateColumn(InterviewResult.__table__.c.overall_recommendation).compile(dialect=engine.dialect))
+            if not is_postgres:
+                ddl = ddl.replace(" STORED", " VIRTUAL")
+            conn.execute(text(f"ALTER TABLE interview_results ADD COLUMN {ddl}"))
+
+        conn.execute(text(
+            "CREATE INDEX IF NOT EXISTS ix_interview_results_overall_recommendation "
+            "ON interview_results (overall_recommendation)"
+        ))
+
+
+if __name__ == "__main__":
+    try:
+        migrate()
+        print("✅ Migration completed successfully!")
+    except Exception as e:
+        print(f"❌ Error during migration: {e}")
+        sys.exit(1)
@@ -0,0 +1,59 @@
+"""
+Compress interview transcripts and summaries with a trained zstd dictionary
+Run once after updating your code; re-run with --train whenever the interview
+mix changes enough that a fresh dictionary would compress better.
+
+Usage: python migrations/compress_transcripts.py [--train] [--batch-size 500]
+
+Rows are rewritten in batches (one commit each), so the script can be
+stopped and resumed. Rows compressed with older dictionaries stay readable.
+"""
+
+import argparse
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from sqlalchemy import inspect, text
+
+from database import engine, SessionLocal, Base
+from models import CompressionDictionary
+from services.compression import train_dictionary, recompress_results
+
+
+def add_columns():
+    binary = "BYTEA" if engine.dialect.name == "postgresql" else "BLOB"
+    existing = {col["name"] for col in inspect(engine).get_columns("interview_results")}
+    Base.metadata.create_all(bind=engine, tables=[CompressionDictionary.__table__])
+    with engine.begin() as conn:
+        for name, ddl in [
+            ("transcript_compressed", binary),
+            ("summary_compressed", binary),
+            ("compression_dictionary_id", "INTEGER REFERENCES compression_dictionaries(id)"),
+        ]:
+            if name not in existing:
+                print(f"Adding {name} column to interview_results...")
+                conn.execute(text(f"ALTER TABLE interview_results ADD COLUMN {name} {ddl}"))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compress transcripts and summaries")
+    parser.add_argument("--train", action="store_true", help="Train a new dictionary first")
+    parser.add_argument("--batch-size", type=int, default=500)
+    args = parser.parse_args()
+
+    try:
+        add_columns()
+        db = SessionLocal()
+        try:
+            if args.train or not db.query(CompressionDictionary.id).first():
+                dictionary_id = train_dictionary(db)
+                db.commit()
+                print(f"📚 Trained compression dictionary v{dictionary_id}")
+        finally:
+            db.close()
+        print(f"✅ Migration completed successfully! Recompressed {recompress_results(SessionLocal, args.batch_size)} results.")
+    except Exception as e:
+        print(f"❌ Error during migration: {e}")
+        sys.exit(1)
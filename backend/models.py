@@ -1,5 +1,6 @@
-from sqlalchemy import Column, Integer, String, DateTime, Text, ForeignKey, Float, JSON
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Integer, String, DateTime, Text, ForeignKey, Float, JSON, LargeBinary, UniqueConstraint, Index, Computed
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import relationship, object_session, deferred
 from datetime import datetime
 from database import Base
 
@@ -26,6 +27,19 @@ class Interview(Base):
         return f"<Interview {self.candidate_name} - {self.role}>"
 
 
+class CompressionDictionary(Base):
+    """A trained zstd dictionary; rows keep the id of the version they were compressed with"""
+    __tablename__ = "compression_dictionaries"
+    
+    id = Column(Integer, primary_key=True)
+    data = Column(LargeBinary, nullable=False)
+    sample_count = Column(Integer, nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    
+    def __repr__(self):
+        return f"<CompressionDictionary v{self.id}>"
+
+
 class InterviewResult(Base):
     """Interview result model - stores feedback and summary from VAPI"""
     __tablename__ = "interview_results"
@@ -37,17 +51,257 @@ class InterviewResult(Base):
     vapi_call_id = Column(String(255), nullable=True)
     call_duration = Column(Float, nullable=True)  # Duration in seconds
     
-    # Interview content
-    transcript = Column(Text, nullable=True)
-    summary = Column(Text, nullable=True)
-    evaluation = Column(JSON, nullable=True)  # Structured evaluation from AI
+    # Interview content, zstd-compressed with a trained dictionary (see services/compression.py).
+    # Use the `transcript` / `summary` properties; the *_text columns only hold
+    # rows written before compression, until the recompress migration runs.
+    # Deferred as one group: loaded on first access, or up front with undefer_group("texts").
+    transcript_text = deferred(Column("transcript", Text, nullable=True), group="texts")
+    summary_text = deferred(Column("summary", Text, nullable=True), group="texts")
+    transcript_compressed = deferred(Column(LargeBinary, nullable=True), group="texts")
+    summary_compressed = deferred(Column(LargeBinary, nullable=True), group="texts")
+    compression_dictionary_id = Column(Integer, ForeignKey("compression_dictionaries.id"), nullable=True)
+    evaluation = Column(JSON().with_variant(JSONB(), "postgresql"), nullable=True)  # Structured evaluation from AI
+    
+    # Evaluation checks (see services/evaluation_schema.py)
+    evaluation_schema = Column(String(100), nullable=True)  # Structured output name, e.g. Interview_Evaluation
+    evaluation_status = Column(String(20), nullable=True, index=True)  # valid, invalid, unvalidated
+    evaluation_error = Column(Text, nullable=True)  # First validation error
+    evaluation_fetch_attempts = Column(Integer, nullable=False, default=0)  # Fetches that returned invalid output
+    
+    # Typed copies of shared evaluation scores, for indexed sorting
+    overall_score = Column(Float, nullable=True, index=True)
+    communication_clarity = Column(Float, nullable=True, index=True)
+    culture_fit_ownership = Column(Float, nullable=True, index=True)
+    
+    # Generated by the database from the evaluation JSON (read-only), for indexed filtering
+    overall_recommendation = Column(
+        String(50), Computed(evaluation["overall_recommendation"].as_string(), persisted=True), index=True
+    )
     
     # Metadata
     completed_at = Column(DateTime, default=datetime.utcnow)
     raw_webhook_data = Column(JSON, nullable=True)  # Store complete webhook payload
     
+    # Set when the texts and raw payload have moved to the Parquet archive (services/archive.py);
+    # the row stays as a stub with the evaluation and scores
+    archived_at = Column(DateTime, nullable=True)
+    archive_path = Column(String(500), nullable=True)  # Relative to ARCHIVE_DIR
+    
     # Relationship
     interview = relationship("Interview", back_populates="result")
     
+    def _bind(self):
+        session = object_session(self)
+        return session.get_bind() if session is not None else None
+    
+    def _read_text(self, field: str) -> str | None:
+        """Plain or decompressed value; decompressed only on access and cached per row version"""
+        plain = getattr(self, f"{field}_text")
+        if plain is not None:
+            return plain
+        data = getattr(self, f"{field}_compressed")
+        if data is None:
+            return None
+        cache = self.__dict__.setdefault("_decompressed", {})
+        hit = cache.get(field)
+        if hit is None or hit[0] is not data:
+            from services.compression import decompress
+            hit = cache[field] = (data, decompress(data, self.compression_dictionary_id, self._bind()))
+        return hit[1]
+    
+    def _write_text(self, field: str, value: str | None, dictionary_id: int | None):
+        from services.compression import compress
+        setattr(self, f"{field}_text", None)
+        setattr(self, f"{field}_compressed",
+                None if value is None else compress(value, dictionary_id, self._bind()))
+    
+    def recompress(self, dictionary_id: int | None):
+        """Store both texts with the given dictionary version"""
+        transcript, summary = self.transcript, self.summary
+        self._write_text("transcript", transcript, dictionary_id)
+        self._write_text("summary", summary, dictionary_id)
+        self.compression_dictionary_id = dictionary_id
+    
+    @property
+    def transcript(self) -> str | None:
+        return self._read_text("transcript")
+    
+    @transcript.setter
+    def transcript(self, value: str | None):
+        self._set_text("transcript", value)
+    
+    @property
+    def summary(self) -> str | None:
+        return self._read_text("summary")
+    
+    @summary.setter
+    def summary(self, value: str | None):
+        self._set_text("summary", value)
+    
+    def _set_text(self, field: str, value: str | None):
+        from services.compression import active_dictionary_id
+        target = active_dictionary_id(self._bind())
+        if target != self.compression_dictionary_id:
+            # Both fields share one dictionary column, so move the other one over too
+            self.recompress(target)
+        self._write_text(field, value, target)
+    
     def __repr__(self):
         return f"<InterviewResult for Interview {self.interview_id}>"
+
+
+class RateLimitBucket(Base):
+    """Shared token bucket state for outbound API rate limiting"""
+    __tablename__ = "rate_limit_buckets"
+    
+    name = Column(String(100), primary_key=True)
+    tokens = Column(Float, nullable=False)
+    updated_at = Column(Float, nullable=False)  # Unix timestamp of the last refill
+    
+    def __repr__(self):
+        return f"<RateLimitBucket {self.name}: {self.tokens:.1f}>"
+
+
+class WorkLease(Base):
+    """Short-lived claim on a unit of work, so only one worker runs it at a time"""
+    __tablename__ = "work_leases"
+    
+    key = Column(String(100), primary_key=True)
+    owner = Column(String(100), nullable=False)
+    expires_at = Column(Float, nullable=False)  # Unix timestamp; expired leases may be taken over
+    
+    def __repr__(self):
+        return f"<WorkLease {self.key} by {self.owner}>"
+
+
+class CohortRanking(Base):
+    """One versioned rescoring run over a cohort (all completed interviews of a role)"""
+    __tablename__ = "cohort_rankings"
+    __table_args__ = (UniqueConstraint("role", "version", name="uq_cohort_rankings_role_version"),)
+    
+    id = Column(Integer, primary_key=True, index=True)
+    role = Column(String(255), nullable=False, index=True)
+    version = Column(Integer, nullable=False)
+    weights = Column(JSON, nullable=False)  # Sub-score name -> weight
+    normalization = Column(String(50), nullable=False)  # zscore, percentile or none
+    batch_by = Column(String(50), nullable=False, default="none")  # Normalization groups: none, week, month
+    candidate_count = Column(Integer, nullable=False, default=0)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    
+    # Relationship
+    entries = relationship("CohortRankingEntry", back_populates="ranking", cascade="all, delete-orphan",
+                           order_by="CohortRankingEntry.rank")
+    
+    def __repr__(self):
+        return f"<CohortRanking {self.role} v{self.version}>"
+
+
+class CohortRankingEntry(Base):
+    """A candidate's position in a cohort ranking"""
+    __tablename__ = "cohort_ranking_entries"
+    __table_args__ = (Index("ix_cohort_ranking_entries_ranking_rank", "ranking_id", "rank"),)
+    
+    id = Column(Integer, primary_key=True)
+    ranking_id = Column(Integer, ForeignKey("cohort_rankings.id", ondelete="CASCADE"), nullable=False)
+    interview_id = Column(Integer, ForeignKey("interviews.id"), nullable=False, index=True)
+    rank = Column(Integer, nullable=False)  # 1 = best; ties are broken, so ranks are unique
+    score = Column(Float, nullable=False)  # Weighted composite after normalization
+    percentile = Column(Float, nullable=False)  # 0-100 within the cohort
+    original_score = Column(Float, nullable=True)  # overall_score from VAPI, for comparison
+    
+    # Relationship
+    ranking = relationship("CohortRanking", back_populates="entries")
+    
+    def __repr__(self):
+        return f"<CohortRankingEntry #{self.rank} interview {self.interview_id}>"
+
+
+class TranscriptSignature(Base):
+    """MinHash signature of a transcript's candidate turns (near-duplicate detection)"""
+    __tablename__ = "transcript_signatures"
+    
+    interview_id = Column(Integer, ForeignKey("interviews.id"), primary_key=True)
+    signature = Column(LargeBinary, nullable=False)  # NUM_PERM little-endian uint64 minimums
+    shingle_count = Column(Integer, nullable=False)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    
+    def __repr__(self):
+        return f"<TranscriptSignature for Interview {self.interview_id}>"
+
+
+class TranscriptLSHBand(Base):
+    """LSH bucket of one signature band; interviews sharing a bucket are duplicate candidates"""
+    __tablename__ = "transcript_lsh_bands"
+    __table_args__ = (Index("ix_transcript_lsh_bands_band_bucket", "band", "bucket"),)
+    
+    interview_id = Column(Integer, ForeignKey("interviews.id"), primary_key=True)
+    band = Column(Integer, primary_key=True)
+    bucket = Column(String(16), nullable=False)  # Hex digest of the band's rows
+    
+    def __repr__(self):
+        return f"<TranscriptLSHBand {self.band}:{self.bucket} interview {self.interview_id}>"
+
+
+class CallRecording(Base):
+    """A call's audio recording, downloaded from VAPI in the background (see services/recordings.py)"""
+    __tablename__ = "call_recordings"
+    
+    id = Column(Integer, primary_key=True)
+    interview_id = Column(Integer, ForeignKey("interviews.id"), nullable=False, unique=True)
+    vapi_call_id = Column(String(255), nullable=True)
+    source_url = Column(Text, nullable=False)  # Where VAPI hosts it
+    status = Column(String(20), nullable=False, default="pending", index=True)  # pending, stored, failed
+    attempts = Column(Integer, nullable=False, default=0)
+    error = Column(Text, nullable=True)  # Last download error
+    attempted_at = Column(DateTime, nullable=True)  # Last download attempt, for retry backoff
+    
+    # Set once stored
+    path = Column(String(500), nullable=True)  # Relative to RECORDINGS_DIR
+    content_type = Column(String(100), nullable=True)
+    size_bytes = Column(Integer, nullable=True)
+    sha256 = Column(String(64), nullable=True)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    stored_at = Column(DateTime, nullable=True)
+    
+    def __repr__(self):
+        return f"<CallRecording {self.status} for Interview {self.interview_id}>"
+
+
+class OutboxEvent(Base):
+    """
+    A notification to deliver, written in the same transaction as the change it announces
+    (transactional outbox, drained by services/outbox.py)
+    """
+    __tablename__ = "outbox_events"
+    __table_args__ = (Index("ix_outbox_events_status_next_attempt", "status", "next_attempt_at"),)
+    
+    id = Column(Integer, primary_key=True)
+    event_type = Column(String(50), nullable=False)  # e.g. interview.completed
+    destination = Column(String(500), nullable=False)  # "email" or "webhook:<url>"
+    payload = Column(JSON, nullable=False)
+    status = Column(String(20), nullable=False, default="pending")  # pending, sent, dead
+    attempts = Column(Integer, nullable=False, default=0)
+    next_attempt_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    last_error = Column(Text, nullable=True)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    sent_at = Column(DateTime, nullable=True)
+    
+    def __repr__(self):
+        return f"<OutboxEvent {self.event_type} -> {self.destination} ({self.status})>"
+
+
+class CallAdmission(Base):
+    """A candidate's place in the live-call admission queue (see services/admission.py)"""
+    __tablename__ = "call_admissions"
+    __table_args__ = (Index("ix_call_admissions_state_enqueued", "state", "enqueued_at"),)
+    
+    interview_id = Column(Integer, ForeignKey("interviews.id"), primary_key=True)
+    state = Column(String(20), nullable=False)  # waiting, admitted (slot held until the call starts), active
+    vapi_call_id = Column(String(255), nullable=True)
+    enqueued_at = Column(DateTime, nullable=False)  # Queue order
+    admitted_at = Column(DateTime, nullable=True)
+    started_at = Column(DateTime, nullable=True)  # First status-update webhook of the call
+    seen_at = Column(DateTime, nullable=False)  # Last poll from the candidate page (or webhook)
+    
+    def __repr__(self):
+        return f"<CallAdmission {self.state} for Interview {self.interview_id}>"
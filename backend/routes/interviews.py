@@ -1,15 +1,35 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import FileResponse, StreamingResponse
+from sqlalchemy import func, update
+from sqlalchemy.orm import Session, contains_eager, joinedload
 from pydantic import BaseModel, EmailStr
 from typing import Literal
-from datetime import datetime
+from datetime import date, datetime
+import asyncio
+import os
 import secrets
 import bcrypt
 import string
 
-from database import get_db
-from models import Interview, InterviewResult
+from database import get_db, get_read_db, create_read_session
+from models import CallAdmission, CallRecording, CohortRankingEntry, Interview, InterviewResult
 from services.vapi_service import vapi_service
+from services.results import save_interview_result
+from services.archive import result_texts, purge_from_archive
+from services.recordings import delete_recording, recording_file, remove_recording_file
+from services.outbox import outbox_dispatcher
+from services.admission import admission_enabled, leave_queue, request_admission
+from services.write_queue import write_queue
+from services.reconciliation import (
+    reconcile_incomplete_interviews, fetch_interview_result, UNRESOLVED, FAILED, NOT_READY
+)
+from services.search_index import search_interviews, remove_from_index
+from services.duplicate_index import find_duplicates, remove_from_duplicate_index
+from services.evaluation_query import SCORE_NAME, evaluation_filters, score_expression
+from services.export import ExportQuery, EXPORT_FORMATS, stream_csv, stream_jsonl, stream_parquet
+from services.http_cache import (
+    CACHE_CONTROL, make_etag, is_not_modified, not_modified_response, set_cache_headers
+)
 from config import get_settings
 
 router = APIRouter(prefix="/api/interviews", tags=["interviews"])
@@ -103,23 +123,70 @@ async def create_interview(
 
 @router.get("", response_model=list[InterviewDetailResponse])
 async def list_interviews(
+    request: Request,
+    response: Response,
     role: str | None = None,
     status: str | None = None,
-    db: Session = Depends(get_db)
+    recommendation: list[str] | None = Query(None),
+    score_field: str = Query("overall_score", pattern=SCORE_NAME.pattern),
+    min_score: float | None = None,
+    max_score: float | None = None,
+    sort_by: str = Query("created_at", pattern=SCORE_NAME.pattern),
+    db: Session = Depends(get_read_db)
 ):
     """
     List all interviews with optional filters
     
-    HR uses this to view all past and pending interviews
-    """
-    query = db.query(Interview)
+    HR uses this to view all past and pending interviews.
+    Supports If-None-Match: the ETag is computed from a cheap aggregate, so an
+    unchanged list returns 304 without loading any transcripts.
     
+    Evaluation filters run in the database: `recommendation` (repeatable)
+    matches the indexed overall_recommendation column, `min_score`/`max_score`
+    bound `score_field` (any sub-score, default overall_score). `sort_by` is
+    created_at or any sub-score (highest first, unscored last); shared scores
+    use their indexed typed columns.
+    """
+    filters = []
     if role:
-        query = query.filter(Interview.role == role)
+        filters.append(Interview.role == role)
     if status:
-        query = query.filter(Interview.status == status)
+        filters.append(Interview.status == status)
+    filters += evaluation_filters(db, recommendation, score_field, min_score, max_score)
+    
+    count, last_updated, last_completed, archived, last_archived = (
+        db.query(
+            func.count(Interview.id),
+            func.max(Interview.updated_at),
+            func.max(InterviewResult.completed_at),
+            func.count(InterviewResult.archived_at),  # Archiving and rehydrating don't touch updated_at
+            func.max(InterviewResult.archived_at)
+        )
+        .outerjoin(InterviewResult, InterviewResult.interview_id == Interview.id)
+        .filter(*filters)
+        .one()
+    )
+    etag = make_etag("list", role, status, sorted(recommendation or []), score_field, min_score, max_score,
+                     sort_by, count, last_updated, last_completed, archived, last_archived)
+    if is_not_modified(request, etag):
+        return not_modified_response(etag)
+    set_cache_headers(response, etag)
+    
+    # Eager-load results (texts included, the dashboard shows them) so the loop below doesn't issue one query per interview
+    query = (
+        db.query(Interview)
+        .outerjoin(InterviewResult, InterviewResult.interview_id == Interview.id)
+        .options(contains_eager(Interview.result).undefer_group("texts"))
+        .filter(*filters)
+    )
+    
+    if sort_by == "created_at":
+        query = query.order_by(Interview.created_at.desc())
+    else:
+        score = score_expression(db, sort_by)
+        query = query.order_by(score.is_(None), score.desc(), Interview.created_at.desc())
     
-    interviews = query.order_by(Interview.created_at.desc()).all()
+    interviews = query.all()
     
     # Build response with results
     response = []
@@ -136,12 +203,14 @@ async def list_interviews(
         }
         
         if interview.result:
+            # Archived results are stubs here; the texts come with GET /{id}
             interview_dict["result"] = {
                 "transcript": interview.result.transcript,
                 "summary": interview.result.summary,
                 "evaluation": interview.result.evaluation,
                 "call_duration": interview.result.call_duration,
-                "completed_at": interview.result.completed_at.isoformat() if interview.result.completed_at else None
+                "completed_at": interview.result.completed_at.isoformat() if interview.result.completed_at else None,
+                "archived": interview.result.archived_at is not None
             }
         
         response.append(interview_dict)
@@ -149,17 +218,113 @@ async def list_interviews(
     return response
 
 
+@router.get("/search")
+async def search(
+    q: str = Query(..., min_length=2),
+    role: str | None = None,
+    page: int = Query(1, ge=1),
+    page_size: int = Query(20, ge=1, le=100),
+    db: Session = Depends(get_read_db)
+):
+    """
+    Full-text search over candidate names, transcripts, summaries and evaluations
+    
+    Results are ranked by relevance; `snippet` is HTML-escaped with matches in <mark>.
+    """
+    total, results = search_interviews(
+        db,
+        q,
+        role=role,
+        limit=page_size,
+        offset=(page - 1) * page_size
+    )
+    return {
+        "query": q,
+        "total": total,
+        "page": page,
+        "page_size": page_size,
+        "results": results
+    }
+
+
+@router.get("/export")
+async def export_interviews(
+    request: Request,
+    format: Literal["csv", "jsonl", "parquet"] = "csv",
+    role: str | None = None,
+    status: str | None = None,
+    start_date: date | None = None,
+    end_date: date | None = None,
+    include_transcript: bool = False
+):
+    """
+    Stream interviews and results as CSV, JSON Lines or Parquet
+    
+    Evaluation sub-scores are flattened into `evaluation.<name>` columns.
+    Rows are read through a server-side cursor, so memory use doesn't grow
+    with the size of the cohort.
+    """
+    if format == "parquet":
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            raise HTTPException(status_code=501, detail="Parquet export requires pyarrow (pip install pyarrow)")
+    
+    query = ExportQuery(
+        role=role,
+        status=status,
+        start_date=start_date,
+        end_date=end_date,
+        include_transcript=include_transcript
+    )
+    writer = {"csv": stream_csv, "jsonl": stream_jsonl, "parquet": stream_parquet}[format]
+    
+    def generate():
+        # The request's session is closed once the endpoint returns, so the stream owns its own
+        db = create_read_session(request)
+        try:
+            yield from writer(db, query)
+        finally:
+            db.close()
+    
+    filename = f"interviews-{datetime.utcnow():%Y%m%d-%H%M%S}.{format}"
+    return StreamingResponse(
+        generate(),
+        media_type=EXPORT_FORMATS[format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
+
+
 @router.get("/{interview_id}", response_model=InterviewDetailResponse)
 async def get_interview(
     interview_id: int,
-    db: Session = Depends(get_db)
+    request: Request,
+    response: Response,
+    db: Session = Depends(get_read_db)
 ):
-    """Get specific interview details"""
-    interview = db.query(Interview).filter(Interview.id == interview_id).first()
+    """Get specific interview details (supports If-None-Match)"""
+    version = (
+        db.query(Interview.updated_at, Interview.status, InterviewResult.completed_at, InterviewResult.archived_at)
+        .outerjoin(InterviewResult, InterviewResult.interview_id == Interview.id)
+        .filter(Interview.id == interview_id)
+        .first()
+    )
     
-    if not interview:
+    if not version:
         raise HTTPException(status_code=404, detail="Interview not found")
     
+    etag = make_etag("interview", interview_id, *version)
+    if is_not_modified(request, etag):
+        return not_modified_response(etag)
+    set_cache_headers(response, etag)
+    
+    interview = (
+        db.query(Interview)
+        .options(joinedload(Interview.result).undefer_group("texts"))
+        .filter(Interview.id == interview_id)
+        .first()
+    )
+    
     interview_dict = {
         "id": interview.id,
         "candidate_name": interview.candidate_name,
@@ -172,21 +337,84 @@ async def get_interview(
     }
     
     if interview.result:
+        # Read through to the Parquet archive for archived results (in a thread: may read a file)
+        transcript, summary = await asyncio.to_thread(result_texts, interview.result)
         interview_dict["result"] = {
-            "transcript": interview.result.transcript,
-            "summary": interview.result.summary,
+            "transcript": transcript,
+            "summary": summary,
             "evaluation": interview.result.evaluation,
             "call_duration": interview.result.call_duration,
-            "completed_at": interview.result.completed_at.isoformat() if interview.result.completed_at else None
+            "completed_at": interview.result.completed_at.isoformat() if interview.result.completed_at else None,
+            "archived": interview.result.archived_at is not None
         }
     
     return interview_dict
 
 
 
+@router.get("/{interview_id}/duplicates")
+async def get_duplicates(
+    interview_id: int,
+    threshold: float = Query(0.5, ge=0.0, le=1.0),
+    limit: int = Query(20, ge=1, le=100),
+    db: Session = Depends(get_read_db)
+):
+    """
+    Other interviews whose candidate answers are near-copies of this one's
+    
+    `similarity` estimates the Jaccard overlap of 5-word shingles in the
+    candidate's turns (1.0 = identical answers). Backed by a MinHash LSH
+    index, so a lookup doesn't compare against every transcript.
+    """
+    matches = find_duplicates(db, interview_id, threshold=threshold, limit=limit)
+    if matches is None:
+        if not db.query(Interview.id).filter(Interview.id == interview_id).first():
+            raise HTTPException(status_code=404, detail="Interview not found")
+        matches = []  # No transcript (yet)
+    return {"interview_id": interview_id, "threshold": threshold, "duplicates": matches}
+
+
+@router.get("/{interview_id}/recording")
+async def get_recording(
+    interview_id: int,
+    request: Request,
+    db: Session = Depends(get_read_db)
+):
+    """
+    The call's audio recording, served from local storage
+    
+    Supports Range requests (206, If-Range), so players can seek without
+    downloading the whole file. 404 until the background download finishes.
+    """
+    recording = db.query(CallRecording).filter(CallRecording.interview_id == interview_id).first()
+    if recording is None:
+        raise HTTPException(status_code=404, detail="No recording for this interview")
+    if recording.status != "stored":
+        raise HTTPException(status_code=404, detail=f"Recording not downloaded yet ({recording.status})")
+    
+    etag = f'"{recording.sha256}"'
+    if is_not_modified(request, etag):
+        return not_modified_response(etag)
+    path = recording_file(recording)
+    try:
+        stat_result = await asyncio.to_thread(os.stat, path)
+    except FileNotFoundError:
+        raise HTTPException(status_code=404, detail="Recording file is missing")
+    # FileResponse handles Range/If-Range itself and hands whole files to the server (pathsend) when it can
+    return FileResponse(
+        path,
+        media_type=recording.content_type,
+        stat_result=stat_result,
+        headers={"ETag": etag, "Cache-Control": CACHE_CONTROL},
+        content_disposition_type="inline",
+    )
+
+
 @router.get("/by-uid/{unique_id}")
 async def get_interview_by_uid(
     unique_id: str,
+    request: Request,
+    response: Response,
     db: Session = Depends(get_db)
 ):
     """
@@ -198,11 +426,43 @@ async def get_interview_by_uid(
     if not interview:
         raise HTTPException(status_code=404, detail="Interview not found")
     
-    # Update status to in_progress if pending
-    if interview.status == "pending":
-        interview.status = "in_progress"
-        db.commit()
+    _start_interview(db, interview)
+    
+    # Pending interviews always change status above, so only later visits can be 304s
+    etag = make_etag("by-uid", unique_id, interview.status, interview.updated_at, vapi_service.config_version())
+    if is_not_modified(request, etag):
+        return not_modified_response(etag)
+    set_cache_headers(response, etag)
+    
+    return await _candidate_payload(interview)
+
+
+def _start_interview(db: Session, interview: Interview):
+    """
+    Move a pending interview to in_progress (first visit of the candidate page)
     
+    A single conditional UPDATE, so concurrent visits can't race, and nothing
+    is written at all once the interview has left pending.
+    """
+    if interview.status != "pending":
+        return
+    now = datetime.utcnow()
+    started = db.execute(
+        update(Interview)
+        .where(Interview.id == interview.id, Interview.status == "pending")
+        .values(status="in_progress", updated_at=now)
+        .execution_options(synchronize_session=False)
+    ).rowcount
+    status = "in_progress"
+    if not started:  # Someone else moved it on first
+        status, now = db.query(Interview.status, Interview.updated_at).filter(Interview.id == interview.id).one()
+    db.expunge(interview)  # Detached, so the commit doesn't expire (and later reload) it
+    db.commit()
+    interview.status, interview.updated_at = status, now
+
+
+async def _candidate_payload(interview: Interview) -> dict:
+    """Interview summary plus the personalized VAPI Web SDK config"""
     # Get assistant config with personalization
     assistant_config = await vapi_service.create_assistant_overrides(
         role=interview.role,
@@ -243,33 +503,16 @@ async def manually_complete_interview(
     if not interview:
         raise HTTPException(status_code=404, detail="Interview not found")
     
-    # Check if result already exists
-    existing_result = db.query(InterviewResult).filter(
-        InterviewResult.interview_id == interview.id
-    ).first()
-    
-    if existing_result:
-        # Update existing
-        existing_result.evaluation = evaluation_data
-        existing_result.summary = evaluation_data.get("summary", "")
-        existing_result.completed_at = datetime.utcnow()
-    else:
-        # Create new result
-        result = InterviewResult(
-            interview_id=interview.id,
-            evaluation=evaluation_data,
-            summary=evaluation_data.get("summary", ""),
-            transcript="",
-            call_duration=0,
-            completed_at=datetime.utcnow()
-        )
-        db.add(result)
-    
-    # Update interview status
-    interview.status = "completed"
-    interview.updated_at = datetime.utcnow()
-    
+    save_interview_result(
+        db,
+        interview,
+        evaluation=evaluation_data,
+        evaluation_schema=None,  # Hand-entered, nothing to validate against
+        summary=evaluation_data.get("summary", ""),
+        completed_at=datetime.utcnow()
+    )
     db.commit()
+    outbox_dispatcher.wake()
     
     return {"message": "Interview completed successfully"}
 
@@ -289,14 +532,28 @@ async def delete_interview(
     if not interview:
         raise HTTPException(status_code=404, detail="Interview not found")
     
+    role = interview.role
+    
     # Delete associated results first (if any)
     db.query(InterviewResult).filter(
         InterviewResult.interview_id == interview.id
     ).delete()
     
+    remove_from_index(db, interview.id)
+    remove_from_duplicate_index(db, interview.id)
+    recording_path = delete_recording(db, interview.id)
+    db.query(CallAdmission).filter(CallAdmission.interview_id == interview.id).delete()
+    # Stored rankings keep everyone else's rank; the candidate just drops out of them
+    db.query(CohortRankingEntry).filter(CohortRankingEntry.interview_id == interview.id).delete()
+    
     # Delete the interview
     db.delete(interview)
     db.commit()
+    remove_recording_file(recording_path)
+    
+    if interview.status == "completed":
+        # Drop any archived copy too (rehydrated results keep theirs), so deletion removes the candidate's data
+        await asyncio.to_thread(purge_from_archive, interview_id, role)
     
     return {"message": "Interview deleted successfully"}
 
@@ -305,6 +562,39 @@ class VerifyPasswordRequest(BaseModel):
     password: str
 
 
+def _password_matches(interview: Interview, password: str) -> bool:
+    if not interview.password_hash:
+        # Old interviews without passwords are allowed through
+        return True
+    return bcrypt.checkpw(password.encode('utf-8'), interview.password_hash.encode('utf-8'))
+
+
+@router.post("/by-uid/{unique_id}/bootstrap")
+async def bootstrap_candidate_page(
+    unique_id: str,
+    request: VerifyPasswordRequest,
+    db: Session = Depends(get_db)
+):
+    """
+    Everything the candidate page needs, in one round trip
+    
+    Verifies the password, starts the interview if it's still pending and
+    returns the same payload as GET /by-uid/{unique_id}. A wrong password
+    returns {"valid": false} like verify-password.
+    """
+    interview = db.query(Interview).filter(Interview.unique_id == unique_id).first()
+    
+    if not interview:
+        raise HTTPException(status_code=404, detail="Interview not found")
+    
+    # bcrypt takes a few hundred ms; keep the event loop free meanwhile
+    if not await asyncio.to_thread(_password_matches, interview, request.password):
+        return {"valid": False, "message": "Invalid password"}
+    
+    _start_interview(db, interview)
+    return {"valid": True, **await _candidate_payload(interview)}
+
+
 @router.post("/by-uid/{unique_id}/verify-password")
 async def verify_password(
     unique_id: str,
@@ -321,23 +611,57 @@ async def verify_password(
     if not interview:
         raise HTTPException(status_code=404, detail="Interview not found")
     
-    # Check if password hash exists
-    if not interview.password_hash:
-        # Old interviews without passwords are allowed through
-        return {"valid": True}
-    
-    # Verify password
-    is_valid = bcrypt.checkpw(
-        request.password.encode('utf-8'),
-        interview.password_hash.encode('utf-8')
-    )
-    
-    if not is_valid:
+    if not _password_matches(interview, request.password):
         return {"valid": False, "message": "Invalid password"}
     
     return {"valid": True}
 
 
+def _candidate_interview_id(db: Session, unique_id: str) -> int:
+    interview = db.query(Interview.id, Interview.status).filter(Interview.unique_id == unique_id).first()
+    if not interview:
+        raise HTTPException(status_code=404, detail="Interview not found")
+    if interview.status == "completed":
+        raise HTTPException(status_code=409, detail="Interview already completed")
+    return interview.id
+
+
+@router.post("/by-uid/{unique_id}/admission")
+async def request_call_admission(
+    unique_id: str,
+    response: Response,
+    db: Session = Depends(get_read_db)
+):
+    """
+    Ask for a call slot before starting the VAPI call
+    
+    Returns {"admitted": true} when the call can start. Otherwise the
+    candidate is queued and gets their position, the queue length and an
+    estimated wait; the page polls again after `retry_after` seconds (also
+    sent as Retry-After) to keep its place.
+    """
+    interview_id = _candidate_interview_id(db, unique_id)
+    if not admission_enabled():
+        return {"admitted": True}
+    
+    admission = await write_queue.submit(lambda session: request_admission(session, interview_id))
+    if not admission["admitted"]:
+        response.headers["Retry-After"] = str(admission["retry_after"])
+    return admission
+
+
+@router.delete("/by-uid/{unique_id}/admission")
+async def leave_call_queue(
+    unique_id: str,
+    db: Session = Depends(get_read_db)
+):
+    """Give up the candidate's queue place or unused slot (page closed, call failed to start)"""
+    interview_id = _candidate_interview_id(db, unique_id)
+    if admission_enabled():
+        await write_queue.submit(lambda session: leave_queue(session, interview_id))
+    return {"message": "Left the call queue"}
+
+
 @router.post("/{interview_id}/fetch-results")
 async def fetch_results_from_vapi(
     interview_id: int,
@@ -348,135 +672,58 @@ async def fetch_results_from_vapi(
     
     This is a fallback when webhooks don't arrive.
     HR can click a button to pull results directly from VAPI.
+    Repeated clicks and concurrent operators share one in-flight fetch.
     """
     interview = db.query(Interview).filter(Interview.id == interview_id).first()
     
     if not interview:
         raise HTTPException(status_code=404, detail="Interview not found")
     
-    # Check if we have a result with VAPI call ID
-    existing_result = db.query(InterviewResult).filter(
-        InterviewResult.interview_id == interview.id
-    ).first()
-    
-    call_id = None
-    if existing_result and existing_result.vapi_call_id:
-        call_id = existing_result.vapi_call_id
-    
-    if not call_id:
-        # Fallback: Try to find a call on VAPI by unique ID or candidate name
-        print(f"🔍 No call_id found in DB. Searching VAPI for UID {interview.unique_id}...")
-        matching_calls = await vapi_service.find_calls_by_interview(
-            interview_unique_id=interview.unique_id,
-            candidate_name=interview.candidate_name
+    fetched = await fetch_interview_result(interview.id)
+    outcome = fetched["outcome"]
+    
+    if outcome == UNRESOLVED:
+        raise HTTPException(
+            status_code=400, 
+            detail=f"No VAPI call found for {interview.candidate_name}. Please ensure the interview has started."
         )
-        
-        if matching_calls:
-            # Use the most recent matching call
-            call_id = matching_calls[0].get("id")
-            print(f"✨ Found matching call on VAPI: {call_id}")
-            
-            # Save it so we don't have to search again
-            if existing_result:
-                existing_result.vapi_call_id = call_id
-            else:
-                existing_result = InterviewResult(
-                    interview_id=interview.id,
-                    vapi_call_id=call_id,
-                    transcript="",
-                    summary="",
-                    evaluation=None,
-                    call_duration=0
-                )
-                db.add(existing_result)
-            db.commit()
-        else:
-            raise HTTPException(
-                status_code=400, 
-                detail=f"No VAPI call found for {interview.candidate_name}. Please ensure the interview has started."
-            )
-    
-    # Fetch from VAPI API
-    print(f"🔄 Fetching results from VAPI for call {call_id}")
-    call_details = await vapi_service.get_call_details(call_id)
-    
-    if not call_details:
+    if outcome == FAILED:
         raise HTTPException(
             status_code=500,
             detail="Failed to fetch results from VAPI"
         )
-    
-    # Extract transcript and summary
-    artifact = call_details.get("artifact", {})
-    analysis = call_details.get("analysis", {})
-    summary = analysis.get("summary", "")
-    
-    # Extract structured outputs
-    structured_outputs = artifact.get("structuredOutputs", {})
-    
-    evaluation_data = None
-    for output_id, output_data in structured_outputs.items():
-        name = output_data.get("name")
-        if name in ["Interview_Evaluation", "Backend_Interview_Evaluation", "Scholarship_Evaluation"]:
-            evaluation_data = output_data.get("result")
-            # If evaluation has its own summary, use it
-            if evaluation_data and evaluation_data.get("summary"):
-                summary = evaluation_data.get("summary")
-            break
-    
-    if not evaluation_data:
-        # Fallback to analysis structured data
-        evaluation_data = analysis.get("structuredData") or analysis.get("evaluation")
-    
-    if not evaluation_data:
+    if outcome == NOT_READY:
         raise HTTPException(
             status_code=404,
             detail="VAPI has not generated evaluation yet. Please wait 1-2 minutes and try again."
         )
     
-    # Extract transcript from messages
-    messages = artifact.get("messages", [])
-    if not messages:
-        # Try from analysis or call root if missing in artifact
-        messages = call_details.get("messages", [])
-        
-    transcript_parts = []
-    for msg in messages:
-        role = msg.get("role", "unknown")
-        content = msg.get("message") or msg.get("content", "")
-        if content:
-            transcript_parts.append(f"{role.upper()}: {content}")
-    
-    transcript = "\n\n".join(transcript_parts)
-    
-    # Update database
-    if existing_result:
-        existing_result.evaluation = evaluation_data
-        existing_result.summary = summary
-        existing_result.transcript = transcript
-        existing_result.completed_at = datetime.utcnow()
-    else:
-        result = InterviewResult(
-            interview_id=interview.id,
-            vapi_call_id=call_id,
-            transcript=transcript,
-            summary=summary,
-            evaluation=evaluation_data,
-            call_duration=call_details.get("duration", 0),
-            completed_at=datetime.utcnow()
-        )
-        db.add(result)
-    
-    # Update interview status
-    interview.status = "completed"
-    interview.updated_at = datetime.utcnow()
-    
-    db.commit()
-    
     print(f"✅ Results fetched and saved for interview {interview.id}")
     
     return {
         "message": "Results fetched successfully",
-        "evaluation": evaluation_data
+        "evaluation": fetched["evaluation"],
+        "evaluation_status": fetched["evaluation_status"],
+        "evaluation_error": fetched["evaluation_error"]
     }
 
+
+@router.post("/reconcile")
+async def reconcile_interviews(
+    concurrency: int = 5,
+    limit: int | None = None
+):
+    """
+    Fetch missing results for all incomplete interviews at once
+    
+    Bulk version of "Fetch Results": covers every in_progress interview and
+    every completed interview that has no evaluation yet.
+    """
+    summary = await reconcile_incomplete_interviews(
+        concurrency=max(1, min(concurrency, 20)),
+        limit=limit
+    )
+    return {
+        "message": f"Reconciled {summary['updated']} of {summary['total']} interviews",
+        "summary": summary
+    }
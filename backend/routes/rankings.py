@@ -0,0 +1,146 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from sqlalchemy import func
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+from pydantic import BaseModel
+from typing import Literal
+from datetime import date
+
+from database import get_db, get_read_db
+from models import Interview, CohortRanking, CohortRankingEntry
+from services.rescoring import create_ranking, load_cohort, sub_scores
+from services.http_cache import make_etag, is_not_modified, not_modified_response, set_cache_headers
+
+router = APIRouter(prefix="/api/rankings", tags=["rankings"])
+
+
+class CreateRankingRequest(BaseModel):
+    role: str
+    weights: dict[str, float] | None = None  # Defaults to equal weights for every sub-score
+    normalization: Literal["zscore", "percentile", "none"] = "zscore"
+    batch_by: Literal["none", "week", "month"] = "none"
+    start_date: date | None = None
+    end_date: date | None = None
+
+
+def _ranking_summary(ranking: CohortRanking) -> dict:
+    return {
+        "id": ranking.id,
+        "role": ranking.role,
+        "version": ranking.version,
+        "weights": ranking.weights,
+        "normalization": ranking.normalization,
+        "batch_by": ranking.batch_by,
+        "candidate_count": ranking.candidate_count,
+        "created_at": ranking.created_at
+    }
+
+
+@router.get("/rubric")
+async def get_rubric(role: str, db: Session = Depends(get_read_db)):
+    """Sub-scores present in a role's evaluations, i.e. what can be weighted"""
+    evaluations = [evaluation for _, _, evaluation in load_cohort(db, role)]
+    return {"role": role, "candidates": len(evaluations), "sub_scores": sub_scores(evaluations)}
+
+
+@router.post("")
+async def create_cohort_ranking(request: CreateRankingRequest, db: Session = Depends(get_db)):
+    """
+    Rescore a role's completed interviews with custom rubric weights
+
+    Sub-scores are normalized (z-score or percentile, optionally per week/month
+    batch), combined with the weights and ranked. Each call stores a new
+    version, so earlier rankings stay reproducible.
+    """
+    try:
+        ranking = create_ranking(
+            db,
+            request.role,
+            weights=request.weights,
+            normalization=request.normalization,
+            batch_by=request.batch_by,
+            start_date=request.start_date,
+            end_date=request.end_date
+        )
+        db.commit()
+    except ValueError as e:
+        db.rollback()
+        raise HTTPException(status_code=400, detail=str(e))
+    except IntegrityError:
+        # Another ranking for this role took the same version number
+        db.rollback()
+        raise HTTPException(status_code=409, detail="A ranking for this role was created concurrently, retry")
+
+    print(f"🏆 Ranked {ranking.candidate_count} candidates for {ranking.role} (v{ranking.version})")
+    return _ranking_summary(ranking)
+
+
+@router.get("")
+async def list_rankings(
+    role: str | None = None,
+    version: int | None = None,
+    db: Session = Depends(get_read_db)
+):
+    """Ranking versions, newest first"""
+    query = db.query(CohortRanking)
+    if role:
+        query = query.filter(CohortRanking.role == role)
+    if version is not None:
+        query = query.filter(CohortRanking.version == version)
+    rankings = query.order_by(CohortRanking.created_at.desc(), CohortRanking.id.desc()).all()
+    return [_ranking_summary(r) for r in rankings]
+
+
+@router.get("/{ranking_id}")
+async def get_ranking(
+    ranking_id: int,
+    request: Request,
+    response: Response,
+    page: int = Query(1, ge=1),
+    page_size: int = Query(50, ge=1, le=500),
+    db: Session = Depends(get_read_db)
+):
+    """
+    One page of a stored ranking, best first
+
+    Rankings never change once stored, except that deleting an interview
+    removes its entry, so the ETag depends on the page and the entry count.
+    """
+    ranking = db.query(CohortRanking).filter(CohortRanking.id == ranking_id).first()
+    if not ranking:
+        raise HTTPException(status_code=404, detail="Ranking not found")
+
+    entry_count = (
+        db.query(func.count(CohortRankingEntry.id)).filter(CohortRankingEntry.ranking_id == ranking.id).scalar()
+    )
+    etag = make_etag("ranking", ranking.id, entry_count, page, page_size)
+    if is_not_modified(request, etag):
+        return not_modified_response(etag)
+    set_cache_headers(response, etag)
+
+    rows = (
+        db.query(CohortRankingEntry, Interview.candidate_name, Interview.candidate_email)
+        .join(Interview, Interview.id == CohortRankingEntry.interview_id)
+        .filter(CohortRankingEntry.ranking_id == ranking.id)
+        .order_by(CohortRankingEntry.rank)
+        .offset((page - 1) * page_size)
+        .limit(page_size)
+        .all()
+    )
+    return {
+        **_ranking_summary(ranking),
+        "page": page,
+        "page_size": page_size,
+        "entries": [
+            {
+                "rank": entry.rank,
+                "interview_id": entry.interview_id,
+                "candidate_name": candidate_name,
+                "candidate_email": candidate_email,
+                "score": entry.score,
+                "percentile": entry.percentile,
+                "original_score": entry.original_score
+            }
+            for entry, candidate_name, candidate_email in rows
+        ]
+    }
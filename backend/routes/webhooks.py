@@ -1,19 +1,23 @@
-from fastapi import APIRouter, Request, Depends, HTTPException
+from fastapi import APIRouter, Request, HTTPException
 from sqlalchemy.orm import Session
 from datetime import datetime
+import asyncio
 import json
 
-from database import get_db
 from models import Interview, InterviewResult
+from services.webhook_log import append_webhook_log
+from services.tracing import span, traced, set_attributes
+from services.write_queue import write_queue
+from services.results import build_transcript, extract_evaluation, save_interview_result
+from services.recordings import queue_recording, recording_downloader, recording_url
+from services.outbox import outbox_dispatcher
+from services.admission import call_ended, call_started
 
 router = APIRouter(prefix="/api/webhooks", tags=["webhooks"])
 
 
 @router.post("/vapi")
-async def vapi_webhook(
-    request: Request,
-    db: Session = Depends(get_db)
-):
+async def vapi_webhook(request: Request):
     """
     Webhook endpoint to receive interview data from VAPI
     
@@ -25,15 +29,10 @@ async def vapi_webhook(
     try:
         payload = await request.json()
         
-        # DEBUG: Write to file for troubleshooting
-        import os
-        debug_file = os.path.join(os.path.dirname(__file__), "..", "webhook_debug.log")
-        with open(debug_file, "a") as f:
-            f.write(f"\n{'='*80}\n")
-            f.write(f"WEBHOOK RECEIVED AT: {datetime.utcnow()}\n")
-            f.write(f"Event Type: {payload.get('type') or payload.get('event')}\n")
-            f.write(f"Full Payload:\n{json.dumps(payload, indent=2)}\n")
-            f.write(f"{'='*80}\n")
+        # DEBUG: Write to file for troubleshooting (indexed, see `python -m candimind webhook-log`)
+        with span("webhook.log"):
+            # File lock, fsync and (first time) the index catch-up: keep them off the event loop
+            await asyncio.to_thread(append_webhook_log, payload)
         
         # Enhanced logging for debugging
         print("\n" + "="*80)
@@ -50,21 +49,22 @@ async def vapi_webhook(
             event_type = payload["message"].get("type")
         if not event_type:
             event_type = payload.get("type") or payload.get("event")
+        set_attributes(**{"vapi.event_type": event_type})
         
         # Handle assistant-request (sent at the very start of the call)
         if event_type == "assistant-request":
             print(f"👋 Processing assistant-request webhook")
-            await handle_status_update(payload, db)
+            await handle_status_update(payload)
             
         # Handle end-of-call event
         elif event_type == "end-of-call-report" or event_type == "call.ended":
             print(f"✅ Processing end-of-call-report webhook")
-            await handle_end_of_call(payload, db)
+            await handle_end_of_call(payload)
         
         # Handle status updates
         elif event_type == "status-update" or event_type == "call.started":
             print(f"📍 Processing status-update webhook")
-            await handle_status_update(payload, db)
+            await handle_status_update(payload)
         
         else:
             print(f"⚠️  Unknown event type: {event_type}")
@@ -78,7 +78,8 @@ async def vapi_webhook(
         raise HTTPException(status_code=500, detail=str(e))
 
 
-async def handle_end_of_call(payload: dict, db: Session):
+@traced("webhook.end_of_call")
+async def handle_end_of_call(payload: dict):
     """Process end-of-call webhook from VAPI"""
     
     print("\n" + "="*80)
@@ -110,19 +111,14 @@ async def handle_end_of_call(payload: dict, db: Session):
     
     print(f"📋 Metadata: {metadata}")
     print(f"🔑 Interview Unique ID from metadata: {interview_unique_id}")
+    set_attributes(**{"vapi.call_id": call_id, "interview.unique_id": interview_unique_id})
     
     # Extract transcript and analysis from message_data
     messages = message_data.get("call", {}).get("messages") or message_data.get("messages", [])
     analysis = message_data.get("call", {}).get("analysis") or message_data.get("analysis", {})
     
     # Build transcript from messages
-    transcript_parts = []
-    for msg in messages:
-        role = msg.get("role", "unknown")
-        content = msg.get("content") or msg.get("message", "")
-        transcript_parts.append(f"{role.upper()}: {content}")
-    
-    transcript = "\n\n".join(transcript_parts)
+    transcript = build_transcript(messages)
     
     # Extract summary and structured data from VAPI's actual webhook structure
     summary = analysis.get("summary", "")
@@ -130,22 +126,22 @@ async def handle_end_of_call(payload: dict, db: Session):
     # VAPI sends structured outputs in: message_data.artifact.structuredOutputs
     artifact = message_data.get("artifact", {})
     structured_outputs = artifact.get("structuredOutputs", {})
-    evaluation_data = None
+    evaluation_name = evaluation_data = None
     
     print(f"📊 Structured Outputs found: {len(structured_outputs)} items")
     
     if structured_outputs:
         # Get the first structured output (there should only be one for Interview_Evaluation)
-        for output_id, output_data in structured_outputs.items():
-            if output_data.get("name") in ["Interview_Evaluation", "Backend_Interview_Evaluation", "Scholarship_Evaluation"]:
-                evaluation_data = output_data.get("result")
-                print(f"✅ Found {output_data.get('name')} structured output!")
-                print(f"   - Overall Score: {evaluation_data.get('overall_score')}")
-                print(f"   - Recommendation: {evaluation_data.get('overall_recommendation')}")
-                # Also use the summary from structured output if available
-                if evaluation_data and evaluation_data.get("summary"):
-                    summary = evaluation_data.get("summary")
-                break
+        evaluation_name, evaluation_data = extract_evaluation(structured_outputs)
+        if evaluation_data:
+            print(f"✅ Found {evaluation_name} structured output!")
+        # Not validated yet: a malformed output is stored and marked invalid, not read here
+        if isinstance(evaluation_data, dict):
+            print(f"   - Overall Score: {evaluation_data.get('overall_score')}")
+            print(f"   - Recommendation: {evaluation_data.get('overall_recommendation')}")
+            # Also use the summary from structured output if available
+            if evaluation_data.get("summary"):
+                summary = evaluation_data.get("summary")
     
     # Fallback to old location if not found in structuredOutputs
     if not evaluation_data:
@@ -155,69 +151,60 @@ async def handle_end_of_call(payload: dict, db: Session):
     # Get call duration
     duration = message_data.get("call", {}).get("duration") or message_data.get("duration", 0)
     
-    # Find interview by metadata
-    interview = None
-    if interview_unique_id:
-        interview = db.query(Interview).filter(
-            Interview.unique_id == interview_unique_id
-        ).first()
-        if interview:
-            print(f"✅ Found interview by unique_id: {interview.id} - {interview.candidate_name}")
-        else:
-            print(f"⚠️  No interview found with unique_id: {interview_unique_id}")
-    
-    # If not found by metadata, try to match by call timing (fallback)
-    if not interview:
-        print(f"🔍 Trying fallback: finding most recent in_progress interview...")
-        # Get most recent in_progress interview
-        interview = db.query(Interview).filter(
-            Interview.status == "in_progress"
-        ).order_by(Interview.updated_at.desc()).first()
+    def store(db: Session) -> int | None:
+        # Find interview by metadata
+        interview = None
+        if interview_unique_id:
+            interview = db.query(Interview).filter(
+                Interview.unique_id == interview_unique_id
+            ).first()
+            if interview:
+                print(f"✅ Found interview by unique_id: {interview.id} - {interview.candidate_name}")
+            else:
+                print(f"⚠️  No interview found with unique_id: {interview_unique_id}")
         
-        if interview:
-            print(f"✅ Found interview by fallback: {interview.id} - {interview.candidate_name}")
-    
-    if not interview:
-        print(f"⚠️  No interview found for call {call_id}")
-        return
-    
-    # Check if result already exists
-    existing_result = db.query(InterviewResult).filter(
-        InterviewResult.interview_id == interview.id
-    ).first()
-    
-    if existing_result:
-        # Update existing result
-        existing_result.vapi_call_id = call_id
-        existing_result.transcript = transcript
-        existing_result.summary = summary
-        existing_result.evaluation = evaluation_data
-        existing_result.call_duration = duration
-        existing_result.raw_webhook_data = message_data  # Save the actual message data
-        existing_result.completed_at = datetime.utcnow()
-    else:
-        # Create new result
-        result = InterviewResult(
-            interview_id=interview.id,
+        # If not found by metadata, try to match by call timing (fallback)
+        if not interview:
+            print(f"🔍 Trying fallback: finding most recent in_progress interview...")
+            # Get most recent in_progress interview
+            interview = db.query(Interview).filter(
+                Interview.status == "in_progress"
+            ).order_by(Interview.updated_at.desc()).first()
+            
+            if interview:
+                print(f"✅ Found interview by fallback: {interview.id} - {interview.candidate_name}")
+        
+        if not interview:
+            return None
+        
+        save_interview_result(
+            db,
+            interview,
             vapi_call_id=call_id,
             transcript=transcript,
             summary=summary,
             evaluation=evaluation_data,
+            evaluation_schema=evaluation_name if evaluation_data else None,
             call_duration=duration,
             raw_webhook_data=message_data,  # Save the actual message data
             completed_at=datetime.utcnow()
         )
-        db.add(result)
-    
-    # Update interview status
-    interview.status = "completed"
-    interview.updated_at = datetime.utcnow()
+        queue_recording(db, interview, call_id, recording_url(message_data))
+        call_ended(db, interview.id)  # Frees its admission slot
+        return interview.id
     
     print(f"📝 Committing to database...")
-    db.commit()
+    with span("webhook.store"):
+        interview_id = await write_queue.submit(store)
+    set_attributes(**{"interview.id": interview_id})
+    
+    if not interview_id:
+        print(f"⚠️  No interview found for call {call_id}")
+        return
     
-    print(f"✅ Interview {interview.id} ({interview.candidate_name}) completed and saved!")
-    print(f"   - Status: {interview.status}")
+    print(f"✅ Interview {interview_id} completed and saved!")
+    recording_downloader.wake()  # Download the recording (if any) in the background
+    outbox_dispatcher.wake()  # Notify HR, off the request path
     print(f"   - Evaluation data saved: {evaluation_data is not None}")
     
     # If no evaluation data yet, poll VAPI API for structured outputs
@@ -231,8 +218,9 @@ async def handle_end_of_call(payload: dict, db: Session):
             print(f"   You can manually trigger result fetch later.")
         else:
             # Import here to avoid circular dependency
-            from services.vapi_service import vapi_service
-            import asyncio
+            from services.reconciliation import fetch_interview_result, UPDATED, INVALID
+            from services.rate_limiter import PRIORITY_BACKGROUND
+            from services.circuit_breaker import CircuitOpenError
             
             # Poll VAPI API with retries (structured outputs take 1-2 minutes to process)
             max_attempts = 6
@@ -243,49 +231,45 @@ async def handle_end_of_call(payload: dict, db: Session):
                 await asyncio.sleep(wait_seconds)
                 
                 print(f"   Fetching call details from VAPI API...")
-                call_details = await vapi_service.get_call_details(call_id)
-                
-                # Check if structured outputs are available
-                structured_outputs = call_details.get("artifact", {}).get("structuredOutputs", {})
+                try:
+                    # Shares the fetch with any HR "Fetch Results" click running for this interview
+                    with span("webhook.poll_results", **{"webhook.attempt": attempt}) as current:
+                        fetched = await fetch_interview_result(interview_id, priority=PRIORITY_BACKGROUND)
+                        if current is not None:
+                            current.set_attribute("webhook.outcome", fetched["outcome"])
+                except CircuitOpenError as e:
+                    # Don't keep sleeping on an outage; reconciliation picks it up later
+                    print(f"   🔌 {e}. Stopped polling, results can be fetched later.")
+                    break
                 
-                if structured_outputs:
-                    print(f"   ✅ Structured outputs found! Updating interview...")
-                    
-                    # Extract evaluation from structured outputs
-                    for output_id, output_data in structured_outputs.items():
-                        name = output_data.get("name")
-                        if name in ["Interview_Evaluation", "Backend_Interview_Evaluation", "Scholarship_Evaluation"]:
-                            new_evaluation_data = output_data.get("result")
-                            
-                            if new_evaluation_data:
-                                # Update the interview result with evaluation data
-                                result = db.query(InterviewResult).filter(
-                                    InterviewResult.interview_id == interview.id
-                                ).first()
-                                
-                                if result:
-                                    result.evaluation = new_evaluation_data
-                                    if new_evaluation_data.get("summary"):
-                                        result.summary = new_evaluation_data.get("summary")
-                                    db.commit()
-                                    
-                                    print(f"   ✅ Evaluation data updated!")
-                                    print(f"      - Overall Score: {new_evaluation_data.get('overall_score')}")
-                                    print(f"      - Recommendation: {new_evaluation_data.get('overall_recommendation')}")
-                                    break
+                if fetched["outcome"] in (UPDATED, INVALID):
+                    new_evaluation_data = fetched["evaluation"]
+                    print(f"   ✅ Evaluation data updated!")
+                    if isinstance(new_evaluation_data, dict):
+                        print(f"      - Overall Score: {new_evaluation_data.get('overall_score')}")
+                        print(f"      - Recommendation: {new_evaluation_data.get('overall_recommendation')}")
                     break  # Exit retry loop
                 else:
-                    print(f"   ⏳ Structured outputs not ready yet...")
-    
+                    print(f"   ⏳ Structured outputs not ready yet ({fetched['outcome']})...")    
     
     print("="*80 + "\n")
 
 
-async def handle_status_update(payload: dict, db: Session):
+@traced("webhook.status_update")
+async def handle_status_update(payload: dict):
     """Handle call status updates from VAPI"""
+    interview_id = await write_queue.submit(lambda db: apply_status_update(db, payload))
+    set_attributes(**{"interview.id": interview_id})
+    if interview_id:
+        print(f"📍 Interview {interview_id} started")
+
+
+def apply_status_update(db: Session, payload: dict) -> int | None:
+    """Mark the interview in progress and remember its call id (runs on the write queue)"""
     
     # 1. Extract message data if nested
     message_data = payload.get("message", {}) if "message" in payload else payload
+    status = message_data.get("status")
     
     # 2. Extract interview ID from metadata or overrides
     # Check all possible locations for interviewId
@@ -300,61 +284,70 @@ async def handle_status_update(payload: dict, db: Session):
     )
     
     print(f"🔍 Webhook Search: interviewId={interview_unique_id}")
+    set_attributes(**{"interview.unique_id": interview_unique_id})
     
     if not interview_unique_id:
-        return
+        return None
     
     interview = db.query(Interview).filter(
         Interview.unique_id == interview_unique_id
     ).first()
     
-    if interview:
-        # Update status to in_progress if not already completed
-        if interview.status != "completed":
-            interview.status = "in_progress"
-            interview.updated_at = datetime.utcnow()
-        
-        # Extract call ID from webhook payload
-        # Try multiple locations to be safe
-        call_id = None
-        
-        # 1. Check inside "message" (nested format)
-        message_data = payload.get("message", {})
-        if "call" in message_data and isinstance(message_data["call"], dict):
-            call_id = message_data["call"].get("id")
-        if not call_id:
-            call_id = message_data.get("callId") or message_data.get("id")
-            
-        # 2. Check at root (flat format)
-        if not call_id:
-            if "call" in payload and isinstance(payload["call"], dict):
-                call_id = payload["call"].get("id")
-        if not call_id:
-            call_id = payload.get("callId") or payload.get("id")
+    if not interview:
+        return None
+    
+    # Update status to in_progress if not already completed
+    if interview.status != "completed":
+        interview.status = "in_progress"
+        interview.updated_at = datetime.utcnow()
+    
+    # Extract call ID from webhook payload
+    # Try multiple locations to be safe
+    call_id = None
+    
+    # 1. Check inside "message" (nested format)
+    message_data = payload.get("message", {})
+    if "call" in message_data and isinstance(message_data["call"], dict):
+        call_id = message_data["call"].get("id")
+    if not call_id:
+        call_id = message_data.get("callId") or message_data.get("id")
         
-        # Create InterviewResult record with call_id for later fetching
-        # This allows manual "Fetch Results" to work
-        if call_id:
-            existing_result = db.query(InterviewResult).filter(
-                InterviewResult.interview_id == interview.id
-            ).first()
-            
-            if not existing_result:
-                result = InterviewResult(
-                    interview_id=interview.id,
-                    vapi_call_id=call_id,
-                    transcript="",
-                    summary="",
-                    evaluation=None,
-                    call_duration=0
-                )
-                db.add(result)
-                print(f"💾 Saved call_id {call_id} for interview {interview.id}")
-            else:
-                 # Update existing result if it doesn't have call_id
-                 if not existing_result.vapi_call_id:
-                     existing_result.vapi_call_id = call_id
-                     print(f"💾 Updated call_id {call_id} for interview {interview.id}")
+    # 2. Check at root (flat format)
+    if not call_id:
+        if "call" in payload and isinstance(payload["call"], dict):
+            call_id = payload["call"].get("id")
+    if not call_id:
+        call_id = payload.get("callId") or payload.get("id")
+    set_attributes(**{"vapi.call_id": call_id})
+    
+    # The call holds an admission slot until it ends (late or redelivered updates don't take one)
+    if status == "ended":
+        call_ended(db, interview.id)
+    elif interview.status != "completed":
+        call_started(db, interview.id, call_id)
+    
+    # Create InterviewResult record with call_id for later fetching
+    # This allows manual "Fetch Results" to work
+    if call_id:
+        existing_result = db.query(InterviewResult).filter(
+            InterviewResult.interview_id == interview.id
+        ).first()
         
-        db.commit()
-        print(f"📍 Interview {interview.id} started")
+        if not existing_result:
+            result = InterviewResult(
+                interview_id=interview.id,
+                vapi_call_id=call_id,
+                transcript="",
+                summary="",
+                evaluation=None,
+                call_duration=0
+            )
+            db.add(result)
+            print(f"💾 Saved call_id {call_id} for interview {interview.id}")
+        else:
+             # Update existing result if it doesn't have call_id
+             if not existing_result.vapi_call_id:
+                 existing_result.vapi_call_id = call_id
+                 print(f"💾 Updated call_id {call_id} for interview {interview.id}")
+    
+    return interview.id
@@ -0,0 +1,201 @@
+"""
+Admission control: cap concurrent live calls, queue the rest fairly
+
+VAPI accounts have a concurrent-call limit; when a cohort starts at the same
+time, calls past the limit fail at VAPI. With ADMISSION_MAX_CONCURRENT_CALLS
+set, the candidate page asks for a slot before starting the call:
+
+- a free slot admits the candidate (held ADMISSION_HOLD_SECONDS for the
+  call to start), otherwise they join a first-come-first-served queue and
+  get their position and an estimated wait back;
+- waiting pages check in every ADMISSION_POLL_SECONDS; those that stop
+  (tab closed) lose their place after ADMISSION_WAITING_TIMEOUT_SECONDS;
+- VAPI's status-update webhook marks the call active and its end-of-call
+  report frees the slot (a call missing its report is freed after
+  ADMISSION_MAX_CALL_MINUTES).
+
+All state lives in call_admissions and every change runs on the write
+queue, so a burst of polls is one transaction per batch, serialized across
+workers by the database write lock (an advisory lock on PostgreSQL).
+"""
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy import delete, func, or_, and_, select
+from sqlalchemy.orm import Session
+
+from config import get_settings
+from database import SessionLocal
+from models import CallAdmission, InterviewResult
+
+settings = get_settings()
+
+WAITING = "waiting"
+ADMITTED = "admitted"
+ACTIVE = "active"
+
+ADMISSION_LOCK_KEY = 727_001  # pg_advisory_xact_lock key
+CALL_LENGTH_SAMPLE = 100  # Recent calls averaged for wait estimates
+CALL_LENGTH_TTL = 600.0
+
+_call_length = {"seconds": None, "checked_at": float("-inf")}
+
+
+def admission_enabled() -> bool:
+    return settings.admission_max_concurrent_calls > 0
+
+
+def _lock(db: Session):
+    # SQLite: the write queue's BEGIN IMMEDIATE already serializes writers
+    if db.get_bind().dialect.name == "postgresql":
+        db.execute(select(func.pg_advisory_xact_lock(ADMISSION_LOCK_KEY)))
+
+
+def _expire(db: Session, now: datetime):
+    """Free slots and queue places nobody is using any more"""
+    db.execute(delete(CallAdmission).where(or_(
+        and_(CallAdmission.state == WAITING,
+             CallAdmission.seen_at < now - timedelta(seconds=settings.admission_waiting_timeout_seconds)),
+        and_(CallAdmission.state == ADMITTED,
+             CallAdmission.admitted_at < now - timedelta(seconds=settings.admission_hold_seconds)),
+        and_(CallAdmission.state == ACTIVE,
+             CallAdmission.started_at < now - timedelta(minutes=settings.admission_max_call_minutes)),
+    )))
+
+
+def _average_call_seconds(db: Session) -> float:
+    """Mean length of recent calls (cached), ADMISSION_DEFAULT_CALL_MINUTES without history"""
+    if time.monotonic() - _call_length["checked_at"] > CALL_LENGTH_TTL:
+        recent = (
+            select(InterviewResult.call_duration)
+            .where(InterviewResult.call_duration > 0)
+            .order_by(InterviewResult.completed_at.desc())
+            .limit(CALL_LENGTH_SAMPLE)
+            .subquery()
+        )
+        _call_length["seconds"] = db.execute(select(func.avg(recent.c.call_duration))).scalar()
+        _call_length["checked_at"] = time.monotonic()
+    return _call_length["seconds"] or settings.admission_default_call_minutes * 60
+
+
+def _eta_seconds(db: Session, position: int, occupied: list[CallAdmission], now: datetime) -> int:
+    """
+    Estimated wait for the `position`-th waiting candidate
+
+    Each occupied slot frees up one average call after it started (or was
+    admitted); the candidate is admitted when enough calls have ended to
+    bring usage below the cap, later positions waiting for further rounds.
+    """
+    if not occupied:
+        return 0
+    call_seconds = _average_call_seconds(db)
+    frees_at = sorted(
+        max(now, (slot.started_at or slot.admitted_at or now) + timedelta(seconds=call_seconds))
+        for slot in occupied
+    )
+    # Calls that must end first: any over the cap (started outside admission), then one per place ahead
+    endings = len(occupied) - settings.admission_max_concurrent_calls + position
+    if endings <= 0:
+        return 0
+    rounds, slot = divmod(endings - 1, len(frees_at))
+    eta = frees_at[slot] + timedelta(seconds=rounds * call_seconds) - now
+    return max(0, int(eta.total_seconds()))
+
+
+def request_admission(db: Session, interview_id: int, now: datetime | None = None) -> dict:
+    """
+    Admit the candidate if a slot is free, else keep their place in the queue (runs on the write queue)
+
+    Returns {"admitted": True} or {"admitted": False, "position", "queue_length",
+    "eta_seconds", "retry_after"}. Slots that free up go to the head of the
+    queue, so a late arrival never jumps ahead of someone already waiting.
+    """
+    now = now or datetime.utcnow()
+    _lock(db)
+    _expire(db, now)
+
+    entry = db.get(CallAdmission, interview_id)
+    if entry is None:
+        entry = CallAdmission(interview_id=interview_id, state=WAITING, enqueued_at=now, seen_at=now)
+        db.add(entry)
+    entry.seen_at = now
+    if entry.state != WAITING:
+        return {"admitted": True}
+    db.flush()
+
+    occupied = db.query(CallAdmission).filter(CallAdmission.state.in_([ADMITTED, ACTIVE])).all()
+    queue = (
+        db.query(CallAdmission)
+        .filter(CallAdmission.state == WAITING)
+        .order_by(CallAdmission.enqueued_at, CallAdmission.interview_id)
+        .all()
+    )
+    free = max(settings.admission_max_concurrent_calls - len(occupied), 0)
+    newly_admitted, queue = queue[:free], queue[free:]
+    for admitted in newly_admitted:
+        # Candidates ahead of this one get their slot now and find out on their next poll
+        admitted.state = ADMITTED
+        admitted.admitted_at = now
+    if entry.state == ADMITTED:
+        return {"admitted": True}
+
+    position = queue.index(entry) + 1
+    return {
+        "admitted": False,
+        "position": position,
+        "queue_length": len(queue),
+        "eta_seconds": _eta_seconds(db, position, occupied + newly_admitted, now),
+        "retry_after": settings.admission_poll_seconds,
+    }
+
+
+def leave_queue(db: Session, interview_id: int):
+    """Give up a queue place or an unused slot (candidate left, or the call failed to start)"""
+    _lock(db)
+    db.execute(delete(CallAdmission).where(
+        CallAdmission.interview_id == interview_id, CallAdmission.state != ACTIVE
+    ))
+
+
+def call_started(db: Session, interview_id: int, call_id: str | None, now: datetime | None = None):
+    """
+    A status-update webhook: the call holds a slot until its end-of-call report
+
+    Calls started without asking (old page, admission just enabled) are
+    counted too, so the cap reflects what VAPI actually sees.
+    """
+    if not admission_enabled():
+        return
+    now = now or datetime.utcnow()
+    _lock(db)
+    entry = db.get(CallAdmission, interview_id)
+    if entry is None:
+        entry = CallAdmission(interview_id=interview_id, enqueued_at=now)
+        db.add(entry)
+    entry.state = ACTIVE
+    entry.started_at = entry.started_at or now
+    entry.seen_at = now
+    entry.vapi_call_id = call_id or entry.vapi_call_id
+
+
+def call_ended(db: Session, interview_id: int):
+    """End-of-call report (or an `ended` status): free the slot"""
+    if not admission_enabled():
+        return
+    _lock(db)
+    db.execute(delete(CallAdmission).where(CallAdmission.interview_id == interview_id))
+
+
+def admission_snapshot(session_factory=SessionLocal) -> dict:
+    """Slot usage and queue length, for /metrics"""
+    db = session_factory()
+    try:
+        counts = dict(db.query(CallAdmission.state, func.count()).group_by(CallAdmission.state).all())
+    finally:
+        db.close()
+    return {
+        "max_concurrent_calls": settings.admission_max_concurrent_calls,
+        "active": counts.get(ACTIVE, 0),
+        "admitted": counts.get(ADMITTED, 0),
+        "waiting": counts.get(WAITING, 0),
+    }
@@ -0,0 +1,329 @@
+"""
+Retention: move old completed interviews to Parquet, read them back on demand
+
+Completed interviews older than ARCHIVE_AFTER_DAYS (per role via
+ARCHIVE_ROLE_DAYS) are written to Parquet files partitioned by role and
+completion month:
+
+    ARCHIVE_DIR/role=Fulbright_PhD/month=2025-03/part-20250901T020000-1a2b3c4d.parquet
+
+and their result row is reduced to a stub: transcript, summary and the raw
+webhook payload are cleared, while the evaluation, typed scores and call
+metadata stay, so listing, filtering and rankings keep working from the
+database alone. Reads of an archived interview fetch the texts from its
+Parquet file (cached per file); any write to the result rehydrates it
+first. Files are immutable once written; only deleting an interview
+rewrites them.
+"""
+import asyncio
+import json
+import os
+import re
+import secrets
+from collections import OrderedDict
+from datetime import datetime, timedelta
+
+from sqlalchemy import and_, or_, select, update
+from sqlalchemy.orm import Session, joinedload, undefer_group
+
+from config import get_settings
+from database import SessionLocal
+from models import Interview, InterviewResult
+
+settings = get_settings()
+
+# Decoded partition files kept in memory: path -> {interview_id: record}
+FILE_CACHE_SIZE = 16
+
+_files: OrderedDict[str, dict[int, dict]] = OrderedDict()
+
+
+def _arrow_schema():
+    import pyarrow as pa
+
+    return pa.schema([
+        ("interview_id", pa.int64()),
+        ("unique_id", pa.string()),
+        ("candidate_name", pa.string()),
+        ("candidate_email", pa.string()),
+        ("role", pa.string()),
+        ("created_at", pa.timestamp("us")),
+        ("vapi_call_id", pa.string()),
+        ("call_duration", pa.float64()),
+        ("completed_at", pa.timestamp("us")),
+        ("transcript", pa.string()),
+        ("summary", pa.string()),
+        ("evaluation", pa.string()),  # JSON
+        ("evaluation_schema", pa.string()),
+        ("raw_webhook_data", pa.string()),  # JSON
+        ("archived_at", pa.timestamp("us")),
+    ])
+
+
+def role_retention_days() -> dict[str, int]:
+    """Per-role overrides from ARCHIVE_ROLE_DAYS ("Role=days,..."; 0 = never archive)"""
+    overrides = {}
+    for entry in settings.archive_role_days.split(","):
+        name, _, days = entry.partition("=")
+        if name.strip() and days.strip():
+            overrides[name.strip()] = int(days)
+    return overrides
+
+
+def _due_filter(now: datetime, default_days: int):
+    """Completed, not yet archived results past their role's retention period"""
+    overrides = role_retention_days()
+    clauses = [
+        and_(Interview.role == role, InterviewResult.completed_at < now - timedelta(days=days))
+        for role, days in overrides.items() if days > 0
+    ]
+    if default_days > 0:
+        clauses.append(and_(
+            Interview.role.notin_(list(overrides)),
+            InterviewResult.completed_at < now - timedelta(days=default_days),
+        ))
+    if not clauses:
+        return None
+    return and_(Interview.status == "completed", InterviewResult.archived_at.is_(None), or_(*clauses))
+
+
+def _partition(role: str, completed_at: datetime | None) -> str:
+    slug = re.sub(r"[^A-Za-z0-9._-]+", "_", role).strip("_") or "unknown"
+    month = f"{completed_at:%Y-%m}" if completed_at else "unknown"
+    return os.path.join(f"role={slug}", f"month={month}")
+
+
+def _record(interview: Interview, result: InterviewResult, archived_at: datetime) -> dict:
+    return {
+        "interview_id": interview.id,
+        "unique_id": interview.unique_id,
+        "candidate_name": interview.candidate_name,
+        "candidate_email": interview.candidate_email,
+        "role": interview.role,
+        "created_at": interview.created_at,
+        "vapi_call_id": result.vapi_call_id,
+        "call_duration": result.call_duration,
+        "completed_at": result.completed_at,
+        "transcript": result.transcript,
+        "summary": result.summary,
+        "evaluation": json.dumps(result.evaluation) if result.evaluation is not None else None,
+        "evaluation_schema": result.evaluation_schema,
+        "raw_webhook_data": json.dumps(result.raw_webhook_data) if result.raw_webhook_data is not None else None,
+        "archived_at": archived_at,
+    }
+
+
+def _write_file(relative_path: str, records: list[dict]):
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    path = os.path.join(settings.archive_dir, relative_path)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.partial"
+    pq.write_table(pa.Table.from_pylist(records, schema=_arrow_schema()), tmp_path, compression="zstd")
+    os.replace(tmp_path, path)  # Never leave a half-written file under a real name
+
+
+def archive_due_results(
+    session_factory,
+    batch_size: int = 500,
+    dry_run: bool = False,
+    default_days: int | None = None,
+    now: datetime | None = None,
+    log=print,
+) -> dict:
+    """
+    Apply the retention policy: archive every result past its retention period
+
+    `default_days` overrides ARCHIVE_AFTER_DAYS for roles without their own
+    setting. Each batch writes one new file per (role, month) partition, then
+    turns the rows into stubs in a single commit. The file is complete before
+    any row points at it, so an interrupted run at worst leaves an
+    unreferenced file. A row written meanwhile (webhook, reconciliation)
+    isn't stubbed, since its file copy is already stale; the next run
+    archives it again.
+    """
+    now = now or datetime.utcnow()
+    due = _due_filter(now, settings.archive_after_days if default_days is None else default_days)
+    summary = {"archived": 0, "files": 0, "partitions": 0}
+    if due is None:
+        return summary
+    partitions_seen = set()
+
+    db = session_factory()
+    try:
+        last_id = 0
+        while True:
+            batch = (
+                db.query(InterviewResult)
+                .join(Interview, Interview.id == InterviewResult.interview_id)
+                .options(joinedload(InterviewResult.interview), undefer_group("texts"))
+                .filter(due, InterviewResult.id > last_id)
+                .order_by(InterviewResult.id)
+                .limit(batch_size)
+                .all()
+            )
+            if not batch:
+                break
+            last_id = batch[-1].id
+
+            partitions: dict[str, list[InterviewResult]] = {}
+            for result in batch:
+                partitions.setdefault(_partition(result.interview.role, result.completed_at), []).append(result)
+            partitions_seen.update(partitions)
+            summary["partitions"] = len(partitions_seen)
+            if dry_run:
+                summary["archived"] += len(batch)
+                db.expunge_all()
+                continue
+
+            stamp = f"{now:%Y%m%dT%H%M%S}-{secrets.token_hex(4)}"
+            for partition, results in partitions.items():
+                relative_path = os.path.join(partition, f"part-{stamp}.parquet")
+                _write_file(relative_path, [_record(r.interview, r, now) for r in results])
+                summary["files"] += 1
+                for result in results:
+                    summary["archived"] += _stub(db, result, relative_path, now)
+            db.commit()
+            db.expunge_all()
+            log(f"  {summary['archived']} results archived")
+    finally:
+        db.close()
+
+    return summary
+
+
+def _stub(db: Session, result: InterviewResult, relative_path: str, now: datetime) -> bool:
+    """
+    Clear an archived result's texts, unless it changed since it was read
+
+    Every result write goes through save_interview_result, which bumps the
+    interview's updated_at, so an unchanged updated_at means the row still
+    matches what went into the file.
+    """
+    unchanged = (
+        select(Interview.id)
+        .where(Interview.id == InterviewResult.interview_id,
+               Interview.updated_at.is_not_distinct_from(result.interview.updated_at))
+        .exists()
+    )
+    return db.execute(
+        update(InterviewResult)
+        .where(InterviewResult.id == result.id, InterviewResult.archived_at.is_(None), unchanged)
+        .values(transcript_text=None, summary_text=None, transcript_compressed=None, summary_compressed=None,
+                compression_dictionary_id=None, raw_webhook_data=None, archived_at=now, archive_path=relative_path)
+        .execution_options(synchronize_session=False)
+    ).rowcount == 1
+
+
+def _load_file(relative_path: str) -> dict[int, dict]:
+    records = _files.get(relative_path)
+    if records is None:
+        import pyarrow.parquet as pq
+
+        table = pq.read_table(os.path.join(settings.archive_dir, relative_path))
+        records = {row["interview_id"]: row for row in table.to_pylist()}
+        _files[relative_path] = records
+        while len(_files) > FILE_CACHE_SIZE:
+            _files.popitem(last=False)
+    else:
+        _files.move_to_end(relative_path)
+    return records
+
+
+def archived_record(relative_path: str, interview_id: int) -> dict | None:
+    """An interview's archived fields (texts and raw payload decoded), or None if unavailable"""
+    try:
+        row = _load_file(relative_path).get(interview_id)
+    except (ImportError, OSError) as e:
+        print(f"❌ Could not read archive {relative_path}: {e}")
+        return None
+    if row is None:
+        return None
+    raw = row["raw_webhook_data"]
+    return {
+        "transcript": row["transcript"],
+        "summary": row["summary"],
+        "raw_webhook_data": json.loads(raw) if raw is not None else None,
+    }
+
+
+def result_texts(result: InterviewResult) -> tuple[str | None, str | None]:
+    """(transcript, summary) of a result, from its archive file if it has been archived"""
+    if result.archived_at is None:
+        return result.transcript, result.summary
+    record = archived_record(result.archive_path, result.interview_id) or {}
+    return record.get("transcript"), record.get("summary")
+
+
+def rehydrate(db: Session, result: InterviewResult) -> bool:
+    """
+    Move an archived result's fields back into its row (within the caller's transaction)
+
+    Called before anything writes to an archived result. The archive keeps
+    its copy; the row is simply archived again once it's due.
+    """
+    if result.archived_at is None:
+        return False
+    record = archived_record(result.archive_path, result.interview_id)
+    if record is None:
+        raise LookupError(f"Archived data for interview {result.interview_id} is missing ({result.archive_path})")
+    result.transcript = record["transcript"]
+    result.summary = record["summary"]
+    result.raw_webhook_data = record["raw_webhook_data"]
+    result.archived_at = None
+    result.archive_path = None
+    return True
+
+
+def purge_from_archive(interview_id: int, role: str) -> int:
+    """
+    Remove an interview from every archive file of its role (interview deletion)
+
+    A rehydrated and re-archived interview can have copies in several files,
+    so all of the role's partitions are checked; row-group statistics let
+    Parquet skip files that can't contain it. Returns the files rewritten.
+    """
+    try:
+        import pyarrow.compute as pc
+        import pyarrow.parquet as pq
+    except ImportError:
+        return 0
+
+    role_dir = os.path.dirname(_partition(role, None))
+    rewritten = 0
+    for root, _, files in os.walk(os.path.join(settings.archive_dir, role_dir)):
+        for name in files:
+            if not name.endswith(".parquet"):
+                continue
+            path = os.path.join(root, name)
+            if not pq.read_table(path, columns=["interview_id"], filters=[("interview_id", "=", interview_id)]).num_rows:
+                continue
+            table = pq.read_table(path)
+            remaining = table.filter(pc.not_equal(table["interview_id"], interview_id))
+            if remaining.num_rows:
+                tmp_path = f"{path}.partial"
+                pq.write_table(remaining, tmp_path, compression="zstd")
+                os.replace(tmp_path, path)
+            else:
+                os.remove(path)
+            _files.pop(os.path.relpath(path, settings.archive_dir), None)
+            rewritten += 1
+    return rewritten
+
+
+def archiving_enabled() -> bool:
+    return settings.archive_after_days > 0 or any(days > 0 for days in role_retention_days().values())
+
+
+async def archive_loop():
+    """Background task: apply the retention policy every ARCHIVE_INTERVAL_HOURS"""
+    interval = settings.archive_interval_hours * 3600
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            summary = await asyncio.to_thread(archive_due_results, SessionLocal, log=lambda message: None)
+            if summary["archived"]:
+                print(f"🗄️  Archived {summary['archived']} interviews to {summary['files']} Parquet files")
+        except Exception as e:
+            print(f"❌ Archiving failed: {e}")
@@ -0,0 +1,214 @@
+import asyncio
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+from config import get_settings
+
+settings = get_settings()
+
+# Breaker states
+CLOSED = "closed"        # Requests flow, outcomes are tracked
+OPEN = "open"            # Requests fail immediately until the cool-down ends
+HALF_OPEN = "half_open"  # A few probe requests decide whether to close again
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling a dependency whose circuit is open"""
+
+    def __init__(self, name: str, retry_after: float):
+        self.name = name
+        self.retry_after = retry_after
+        super().__init__(f"{name} is unavailable, retry in {retry_after:.0f}s")
+
+
+class _Call:
+    """Outcome of one guarded call; set `ok = False` for failures that didn't raise"""
+
+    def __init__(self, probe: bool):
+        self.probe = probe
+        self.ok = True
+
+
+class CircuitBreaker:
+    """
+    Per-process circuit breaker over the last `window` calls
+
+    Opens when, with at least `min_calls` recorded, the share of failed calls
+    reaches `failure_rate` or the share of calls slower than `slow_call_seconds`
+    reaches `slow_rate`. While open every call fails fast with CircuitOpenError.
+    After `open_seconds` up to `half_open_probes` calls are let through; if they
+    all succeed the breaker closes, a single failure re-opens it.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        window: int = 20,
+        min_calls: int = 5,
+        failure_rate: float = 0.5,
+        slow_call_seconds: float = 10.0,
+        slow_rate: float = 0.8,
+        open_seconds: float = 30.0,
+        half_open_probes: int = 2,
+    ):
+        self.name = name
+        self.min_calls = min_calls
+        self.failure_rate = failure_rate
+        self.slow_call_seconds = slow_call_seconds
+        self.slow_rate = slow_rate
+        self.open_seconds = open_seconds
+        self.half_open_probes = half_open_probes
+
+        self._lock = threading.Lock()
+        self._outcomes: deque[tuple[bool, bool]] = deque(maxlen=window)  # (failed, slow)
+        self._state = CLOSED
+        self._opened_at = 0.0
+        self._probes_in_flight = 0
+        self._probe_successes = 0
+        self.counters = {"calls": 0, "failures": 0, "slow_calls": 0, "rejected": 0, "opened": 0}
+
+    def _open(self, now: float, reason: str):
+        self._state = OPEN
+        self._opened_at = now
+        self._outcomes.clear()
+        self.counters["opened"] += 1
+        print(f"🔌 {self.name} circuit opened ({reason}), failing fast for {self.open_seconds:.0f}s")
+
+    def _rates(self) -> tuple[float, float]:
+        if not self._outcomes:
+            return 0.0, 0.0
+        total = len(self._outcomes)
+        return (
+            sum(failed for failed, _ in self._outcomes) / total,
+            sum(slow for _, slow in self._outcomes) / total,
+        )
+
+    def retry_after(self) -> float:
+        return max(0.0, self._opened_at + self.open_seconds - time.monotonic())
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if self._state == OPEN and self.retry_after() <= 0:
+                return HALF_OPEN
+            return self._state
+
+    def raise_if_open(self):
+        """Cheap check before queueing for other resources (e.g. a rate limit token)"""
+        with self._lock:
+            if self._state == OPEN and self.retry_after() > 0:
+                self.counters["rejected"] += 1
+                raise CircuitOpenError(self.name, self.retry_after())
+
+    def _admit(self) -> bool:
+        """Let a call through (True if it's a half-open probe) or raise CircuitOpenError"""
+        with self._lock:
+            if self._state == OPEN:
+                if self.retry_after() > 0:
+                    self.counters["rejected"] += 1
+                    raise CircuitOpenError(self.name, self.retry_after())
+                self._state = HALF_OPEN
+                self._probes_in_flight = 0
+                self._probe_successes = 0
+                print(f"🔌 {self.name} circuit half-open, probing")
+            if self._state == HALF_OPEN:
+                if self._probes_in_flight + self._probe_successes >= self.half_open_probes:
+                    self.counters["rejected"] += 1
+                    raise CircuitOpenError(self.name, 1.0)
+                self._probes_in_flight += 1
+                return True
+            return False
+
+    def _record(self, call: _Call, duration: float):
+        slow = duration >= self.slow_call_seconds
+        with self._lock:
+            self.counters["calls"] += 1
+            self.counters["failures"] += not call.ok
+            self.counters["slow_calls"] += slow
+            now = time.monotonic()
+
+            if call.probe:
+                self._probes_in_flight -= 1
+                if self._state != HALF_OPEN:
+                    return
+                if not call.ok or slow:
+                    self._open(now, "probe failed")
+                else:
+                    self._probe_successes += 1
+                    if self._probe_successes >= self.half_open_probes:
+                        self._state = CLOSED
+                        self._outcomes.clear()
+                        print(f"🔌 {self.name} circuit closed")
+                return
+
+            if self._state != CLOSED:
+                return
+            self._outcomes.append((not call.ok, slow))
+            if len(self._outcomes) < self.min_calls:
+                return
+            failure_rate, slow_rate = self._rates()
+            if failure_rate >= self.failure_rate:
+                self._open(now, f"{failure_rate:.0%} of recent calls failed")
+            elif slow_rate >= self.slow_rate:
+                self._open(now, f"{slow_rate:.0%} of recent calls took over {self.slow_call_seconds:.0f}s")
+
+    def _release(self, call: _Call):
+        """Forget a call that was cancelled before it had an outcome"""
+        if call.probe:
+            with self._lock:
+                self._probes_in_flight -= 1
+
+    @contextmanager
+    def guard(self):
+        """
+        Wrap one call to the dependency
+
+            with breaker.guard() as call:
+                response = await client.get(...)
+                call.ok = response.status_code < 500
+
+        Raises CircuitOpenError without running the block while open.
+        Exceptions raised by the block count as failures.
+        """
+        call = _Call(self._admit())
+        started = time.monotonic()
+        try:
+            yield call
+        except asyncio.CancelledError:
+            self._release(call)
+            raise
+        except Exception:
+            call.ok = False
+            self._record(call, time.monotonic() - started)
+            raise
+        else:
+            self._record(call, time.monotonic() - started)
+
+    def snapshot(self) -> dict:
+        """State and counters for /health and /metrics"""
+        state = self.state
+        with self._lock:
+            failure_rate, slow_rate = self._rates()
+            return {
+                "state": state,
+                "retry_after": round(self.retry_after(), 1) if state == OPEN else 0,
+                "window_calls": len(self._outcomes),
+                "failure_rate": round(failure_rate, 3),
+                "slow_rate": round(slow_rate, 3),
+                **self.counters,
+            }
+
+
+# Shared breaker for all outbound VAPI API calls
+vapi_circuit = CircuitBreaker(
+    name="VAPI",
+    window=settings.vapi_circuit_window,
+    min_calls=settings.vapi_circuit_min_calls,
+    failure_rate=settings.vapi_circuit_failure_rate,
+    slow_call_seconds=settings.vapi_circuit_slow_call_seconds,
+    slow_rate=settings.vapi_circuit_slow_rate,
+    open_seconds=settings.vapi_circuit_open_seconds,
+    half_open_probes=settings.vapi_circuit_half_open_probes,
+)
@@ -0,0 +1,147 @@
+import random
+import threading
+import time
+
+import zstandard as zstd
+from sqlalchemy import or_, text
+from sqlalchemy.orm import undefer_group
+
+from database import engine
+
+# Transcripts repeat the same questions and "ASSISTANT:"/"USER:" prefixes across
+# interviews, so a dictionary trained on our own corpus compresses far better
+# than zstd alone on a single ~10 KB document.
+LEVEL = 9
+DICT_SIZE = 112 * 1024
+MIN_TRAINING_SAMPLES = 50
+# How long a worker keeps using the dictionary it last saw as newest
+ACTIVE_DICTIONARY_TTL = 60
+
+_dictionaries: dict[int, zstd.ZstdCompressionDict] = {}  # Immutable once stored, cached forever
+# (De)compressor objects must not be shared between threads, so each thread keeps its own
+_local = threading.local()
+_active = {"id": None, "checked_at": 0.0}
+
+
+def _dictionary(dictionary_id: int, bind=None) -> zstd.ZstdCompressionDict:
+    cached = _dictionaries.get(dictionary_id)
+    if cached is None:
+        with (bind or engine).connect() as conn:
+            data = conn.execute(
+                text("SELECT data FROM compression_dictionaries WHERE id = :id"), {"id": dictionary_id}
+            ).scalar()
+        if data is None:
+            raise LookupError(f"Compression dictionary {dictionary_id} not found")
+        cached = _dictionaries[dictionary_id] = zstd.ZstdCompressionDict(bytes(data))
+    return cached
+
+
+def _compressor(dictionary_id: int | None, bind=None) -> zstd.ZstdCompressor:
+    compressors = _local.__dict__.setdefault("compressors", {})
+    compressor = compressors.get(dictionary_id)
+    if compressor is None:
+        dict_data = _dictionary(dictionary_id, bind) if dictionary_id else None
+        compressor = compressors[dictionary_id] = zstd.ZstdCompressor(level=LEVEL, dict_data=dict_data)
+    return compressor
+
+
+def _decompressor(dictionary_id: int | None, bind=None) -> zstd.ZstdDecompressor:
+    decompressors = _local.__dict__.setdefault("decompressors", {})
+    decompressor = decompressors.get(dictionary_id)
+    if decompressor is None:
+        dict_data = _dictionary(dictionary_id, bind) if dictionary_id else None
+        decompressor = decompressors[dictionary_id] = zstd.ZstdDecompressor(dict_data=dict_data)
+    return decompressor
+
+
+def active_dictionary_id(bind=None) -> int | None:
+    """Newest trained dictionary (re-checked every ACTIVE_DICTIONARY_TTL seconds)"""
+    now = time.monotonic()
+    if now - _active["checked_at"] > ACTIVE_DICTIONARY_TTL:
+        with (bind or engine).connect() as conn:
+            _active["id"] = conn.execute(text("SELECT max(id) FROM compression_dictionaries")).scalar()
+        _active["checked_at"] = now
+    return _active["id"]
+
+
+def compress(value: str, dictionary_id: int | None, bind=None) -> bytes:
+    """zstd frame of `value`, using the given dictionary version (None = no dictionary)"""
+    return _compressor(dictionary_id, bind).compress(value.encode("utf-8"))
+
+
+def decompress(data: bytes, dictionary_id: int | None, bind=None) -> str:
+    return _decompressor(dictionary_id, bind).decompress(bytes(data)).decode("utf-8")
+
+
+def train_dictionary(db, sample_limit: int = 2000, seed: int | None = None) -> int:
+    """
+    Train a dictionary on a random sample of transcripts and summaries and store it
+
+    The new dictionary becomes the active one for writes; rows compressed with
+    older versions stay readable. Returns the new dictionary id.
+    """
+    from models import CompressionDictionary, InterviewResult
+
+    ids = [i for (i,) in db.query(InterviewResult.id)]
+    rng = random.Random(seed)
+    sample_ids = rng.sample(ids, min(sample_limit, len(ids)))
+    samples = []
+    for start in range(0, len(sample_ids), 500):
+        chunk = sample_ids[start:start + 500]
+        query = db.query(InterviewResult).options(undefer_group("texts")).filter(InterviewResult.id.in_(chunk))
+        for result in query:
+            samples += [v.encode("utf-8") for v in (result.transcript, result.summary) if v]
+    if len(samples) < MIN_TRAINING_SAMPLES:
+        raise ValueError(f"Need at least {MIN_TRAINING_SAMPLES} transcripts/summaries to train, found {len(samples)}")
+
+    trained = zstd.train_dictionary(DICT_SIZE, samples, level=LEVEL)
+    dictionary = CompressionDictionary(data=trained.as_bytes(), sample_count=len(samples))
+    db.add(dictionary)
+    db.flush()
+    _active["checked_at"] = 0.0  # Pick it up on the next write
+    return dictionary.id
+
+
+def recompress_results(session_factory, batch_size: int = 500, log=print) -> int:
+    """
+    Rewrite every result not yet stored with the active dictionary, one batch per commit
+
+    Covers legacy plain-text rows as well as rows compressed with an older
+    dictionary; archived stubs have no texts to rewrite. Returns the number of
+    rows rewritten.
+    """
+    from models import InterviewResult
+
+    db = session_factory()
+    try:
+        _active["checked_at"] = 0.0
+        target = active_dictionary_id(db.get_bind())
+        stale = or_(InterviewResult.transcript_text.isnot(None), InterviewResult.summary_text.isnot(None))
+        if target is not None:
+            stale = or_(
+                stale,
+                InterviewResult.compression_dictionary_id.is_(None),
+                InterviewResult.compression_dictionary_id != target,
+            )
+        rewritten = 0
+        last_id = 0
+        while True:
+            batch = (
+                db.query(InterviewResult)
+                .options(undefer_group("texts"))
+                .filter(InterviewResult.id > last_id, InterviewResult.archived_at.is_(None), stale)
+                .order_by(InterviewResult.id)
+                .limit(batch_size)
+                .all()
+            )
+            if not batch:
+                return rewritten
+            for result in batch:
+                result.recompress(target)
+            last_id = batch[-1].id
+            db.commit()
+            db.expunge_all()
+            rewritten += len(batch)
+            log(f"  {rewritten} results recompressed")
+    finally:
+        db.close()
@@ -0,0 +1,191 @@
+import asyncio
+import copy
+import json
+import os
+
+from config import get_settings
+from services.rate_limiter import PRIORITY_BACKGROUND
+from services.vapi_service import vapi_service
+
+settings = get_settings()
+
+PROMPTS_DIR = os.path.join(os.path.dirname(__file__), "..", "..", "vapi-prompts")
+MANIFEST_FILE = "vapi-sync.json"
+
+
+def load_manifest(prompts_dir: str = PROMPTS_DIR) -> dict:
+    with open(os.path.join(prompts_dir, MANIFEST_FILE), "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def parse_prompt(text: str) -> tuple[str | None, str]:
+    """
+    Split a prompt file into (first message, system prompt)
+
+    Files with '## First Message' / '## System Prompt' sections are split;
+    anything else is used whole as the system prompt.
+    """
+    if "## System Prompt" not in text:
+        return None, text.strip()
+    head, _, system_prompt = text.partition("## System Prompt")
+    first_message = None
+    if "## First Message" in head:
+        first_message = head.split("## First Message", 1)[1].strip()
+    return first_message or None, system_prompt.strip()
+
+
+def deep_merge(base, override):
+    """Overlay `override` on `base`; dicts merge recursively, everything else is replaced"""
+    if not isinstance(base, dict) or not isinstance(override, dict):
+        return copy.deepcopy(override)
+    merged = copy.deepcopy(base)
+    for key, value in override.items():
+        merged[key] = deep_merge(base.get(key), value)
+    return merged
+
+
+def diff(desired, remote, path: str = "") -> list[str]:
+    """Dotted paths where `remote` differs from `desired` (keys absent from desired are ignored)"""
+    if isinstance(desired, dict) and isinstance(remote, dict):
+        changes = []
+        for key, value in desired.items():
+            changes += diff(value, remote.get(key), f"{path}.{key}" if path else key)
+        return changes
+    return [] if desired == remote else [path]
+
+
+def minimal_patch(desired: dict, remote: dict) -> tuple[dict, list[str]]:
+    """
+    PATCH body containing only the top-level fields that changed
+
+    Changed fields are sent merged with their remote value, because VAPI
+    replaces a top-level object (e.g. `model`) as a whole.
+    """
+    changed = diff(desired, remote)
+    top_level = {path.split(".", 1)[0] for path in changed}
+    patch = {key: deep_merge(remote.get(key), desired[key]) for key in sorted(top_level)}
+    return patch, changed
+
+
+class ConfigSync:
+    """Declarative sync of vapi-prompts/ (see vapi-sync.json) to the VAPI account"""
+
+    def __init__(self, prompts_dir: str = PROMPTS_DIR, service=vapi_service, priority: str = PRIORITY_BACKGROUND):
+        self.prompts_dir = prompts_dir
+        self.service = service
+        self.priority = priority  # An operator's bulk sync leaves the interactive reserve to HR
+        self.manifest = load_manifest(prompts_dir)
+
+    def _read(self, filename: str) -> str:
+        with open(os.path.join(self.prompts_dir, filename), "r", encoding="utf-8") as f:
+            return f.read()
+
+    def desired_output(self, spec: dict) -> dict:
+        return {
+            "name": spec["name"],
+            "description": spec.get("description", ""),
+            "schema": json.loads(self._read(spec["schema"])),
+        }
+
+    def desired_assistant(self, spec: dict, output_ids: dict) -> dict:
+        desired = copy.deepcopy(spec.get("config", {}))
+        if spec.get("prompt"):
+            first_message, system_prompt = parse_prompt(self._read(spec["prompt"]))
+            desired = deep_merge(desired, {"model": {"messages": [{"role": "system", "content": system_prompt}]}})
+            if first_message:
+                desired["firstMessage"] = first_message
+        if spec.get("structured_outputs"):
+            desired = deep_merge(desired, {"artifactPlan": {
+                "structuredOutputIds": [output_ids.get(name, f"<new:{name}>") for name in spec["structured_outputs"]]
+            }})
+        return desired
+
+    async def run(self, dry_run: bool = True, log=print) -> dict:
+        """
+        Fetch remote state concurrently, diff it, and apply only changed fields in parallel
+
+        Returns a count of created/updated/unchanged/failed items.
+        """
+        summary = {"created": 0, "updated": 0, "unchanged": 0, "failed": 0, "skipped": 0}
+
+        assistants = []
+        for spec in self.manifest.get("assistants", []):
+            assistant_id = getattr(settings, spec["id_setting"], None)
+            if assistant_id:
+                assistants.append((spec, assistant_id))
+            else:
+                log(f"⏭️  {spec['name']}: {spec['id_setting'].upper()} not set, skipping")
+                summary["skipped"] += 1
+
+        # 1. Fetch everything at once
+        remote_outputs, *remote_assistants = await asyncio.gather(
+            self.service.list_structured_outputs(priority=self.priority),
+            *(self.service.get_assistant(assistant_id, priority=self.priority) for _, assistant_id in assistants),
+            return_exceptions=True
+        )
+        if isinstance(remote_outputs, Exception):
+            log(f"❌ Could not list structured outputs: {remote_outputs}")
+            summary["failed"] += 1
+            remote_outputs = []
+        outputs_by_name = {o.get("name"): o for o in remote_outputs if isinstance(o, dict)}
+
+        # 2. Structured outputs first, so assistants can reference new ids
+        async def sync_output(spec):
+            desired = self.desired_output(spec)
+            remote = outputs_by_name.get(spec["name"])
+            if remote is None:
+                log(f"➕ Structured output {spec['name']}: create")
+                if dry_run:
+                    return "created", None
+                created = await self.service.create_structured_output(desired, priority=self.priority)
+                return "created", created.get("id")
+            patch, changed = minimal_patch(desired, remote)
+            if not patch:
+                return "unchanged", remote.get("id")
+            log(f"✏️  Structured output {spec['name']}: {', '.join(changed)}")
+            if not dry_run:
+                await self.service.update_structured_output(remote["id"], patch, priority=self.priority)
+            return "updated", remote.get("id")
+
+        output_specs = self.manifest.get("structured_outputs", [])
+        output_ids = {name: o.get("id") for name, o in outputs_by_name.items()}
+        results = await asyncio.gather(*(sync_output(spec) for spec in output_specs), return_exceptions=True)
+        for spec, result in zip(output_specs, results):
+            if isinstance(result, Exception):
+                log(f"❌ Structured output {spec['name']}: {result}")
+                summary["failed"] += 1
+                continue
+            outcome, output_id = result
+            summary[outcome] += 1
+            if output_id:
+                output_ids[spec["name"]] = output_id
+
+        # 3. Assistants
+        async def sync_assistant(spec, assistant_id, remote):
+            if isinstance(remote, Exception):
+                raise remote
+            # `<new:Name>` placeholders are for the dry-run diff only, never sent to VAPI
+            missing = [name for name in spec.get("structured_outputs", []) if not output_ids.get(name)]
+            if missing and not dry_run:
+                raise LookupError(f"no id for structured output {', '.join(missing)}, not updating")
+            patch, changed = minimal_patch(self.desired_assistant(spec, output_ids), remote)
+            if not patch:
+                return "unchanged"
+            log(f"✏️  Assistant {spec['name']} ({assistant_id}): {', '.join(changed)}")
+            if not dry_run:
+                await self.service.update_assistant(assistant_id, patch, priority=self.priority)
+            return "updated"
+
+        results = await asyncio.gather(
+            *(sync_assistant(spec, assistant_id, remote)
+              for (spec, assistant_id), remote in zip(assistants, remote_assistants)),
+            return_exceptions=True
+        )
+        for (spec, _), result in zip(assistants, results):
+            if isinstance(result, Exception):
+                log(f"❌ Assistant {spec['name']}: {result}")
+                summary["failed"] += 1
+            else:
+                summary[result] += 1
+
+        return summary
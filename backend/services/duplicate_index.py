@@ -0,0 +1,196 @@
+import hashlib
+import re
+import zlib
+
+import numpy as np
+from sqlalchemy import func, or_, tuple_
+from sqlalchemy.orm import Session, load_only
+
+from database import SessionLocal
+from models import Interview, InterviewResult, TranscriptSignature, TranscriptLSHBand
+
+# 32 bands x 4 rows: pairs above ~0.5 Jaccard almost always share a bucket,
+# pairs below ~0.2 almost never do
+NUM_PERM = 128
+BANDS = 32
+ROWS_PER_BAND = NUM_PERM // BANDS
+SHINGLE_SIZE = 5  # Words per shingle
+
+# Fixed universal hash family h(x) = (a*x + b) mod p over 32-bit shingle hashes.
+# a < 2^31 keeps a*x + b inside uint64; the seed must never change or stored
+# signatures stop being comparable.
+_PRIME = np.uint64(4294967311)
+_rng = np.random.default_rng(20240601)
+_A = _rng.integers(1, 2**31, size=NUM_PERM, dtype=np.uint64)
+_B = _rng.integers(0, 2**32, size=NUM_PERM, dtype=np.uint64)
+
+_WORD = re.compile(r"\w+")
+
+
+def candidate_text(transcript: str | None) -> str:
+    """The candidate's side of a transcript (paragraphs written as 'USER: ...')"""
+    turns = [
+        part.split(":", 1)[1]
+        for part in (transcript or "").split("\n\n")
+        if part.upper().startswith("USER:")
+    ]
+    return "\n".join(turns)
+
+
+def shingles(text: str) -> np.ndarray:
+    """Distinct 32-bit hashes of the word n-grams in `text`"""
+    words = _WORD.findall(text.lower())
+    if not words:
+        return np.empty(0, dtype=np.uint64)
+    grams = (
+        [" ".join(words[i:i + SHINGLE_SIZE]) for i in range(len(words) - SHINGLE_SIZE + 1)]
+        if len(words) >= SHINGLE_SIZE else [" ".join(words)]
+    )
+    return np.unique(np.fromiter((zlib.crc32(g.encode("utf-8")) for g in grams), dtype=np.uint64))
+
+
+def minhash(shingle_hashes: np.ndarray) -> np.ndarray:
+    """Signature: per permutation, the minimum hash over all shingles (one broadcast)"""
+    hashed = (np.outer(shingle_hashes, _A) + _B) % _PRIME
+    return hashed.min(axis=0)
+
+
+def band_buckets(signature: np.ndarray) -> list[str]:
+    """One bucket key per band; equal keys mean the band's rows are identical"""
+    rows = signature.reshape(BANDS, ROWS_PER_BAND)
+    return [hashlib.blake2b(row.tobytes(), digest_size=8).hexdigest() for row in rows]
+
+
+def similarity(signature: np.ndarray, others: np.ndarray) -> np.ndarray:
+    """Estimated Jaccard similarity: share of matching signature positions"""
+    return (others == signature).mean(axis=-1)
+
+
+def _decode(blob: bytes) -> np.ndarray:
+    return np.frombuffer(blob, dtype="<u8")
+
+
+def index_transcript(db: Session, interview_id: int, transcript: str | None):
+    """Insert or refresh an interview's signature and buckets (within the caller's transaction)"""
+    remove_from_duplicate_index(db, interview_id)
+    shingle_hashes = shingles(candidate_text(transcript))
+    if not len(shingle_hashes):
+        return
+
+    signature = minhash(shingle_hashes)
+    db.add(TranscriptSignature(
+        interview_id=interview_id,
+        signature=signature.astype("<u8").tobytes(),
+        shingle_count=len(shingle_hashes)
+    ))
+    db.add_all(
+        TranscriptLSHBand(interview_id=interview_id, band=band, bucket=bucket)
+        for band, bucket in enumerate(band_buckets(signature))
+    )
+
+
+def remove_from_duplicate_index(db: Session, interview_id: int):
+    """Drop an interview's signature and buckets (within the caller's transaction)"""
+    db.query(TranscriptLSHBand).filter(TranscriptLSHBand.interview_id == interview_id).delete(
+        synchronize_session=False
+    )
+    db.query(TranscriptSignature).filter(TranscriptSignature.interview_id == interview_id).delete(
+        synchronize_session=False
+    )
+
+
+def needs_backfill(db: Session) -> bool:
+    """True when transcripts exist but nothing has been indexed yet (fresh install/upgrade)"""
+    if db.query(TranscriptSignature.interview_id).first():
+        return False
+    has_transcript = or_(InterviewResult.transcript_text.isnot(None), InterviewResult.transcript_compressed.isnot(None))
+    return db.query(InterviewResult.id).filter(has_transcript).first() is not None
+
+
+def rebuild_duplicate_index(batch_size: int = 200, session_factory=SessionLocal) -> int:
+    """Index every transcript, committing per batch"""
+    db = session_factory()
+    try:
+        indexed = 0
+        last_id = 0
+        while True:
+            batch = (
+                db.query(InterviewResult)
+                .options(load_only(
+                    InterviewResult.interview_id, InterviewResult.transcript_text,
+                    InterviewResult.transcript_compressed, InterviewResult.compression_dictionary_id
+                ))
+                # Archived stubs have no transcript; their signatures stay from before archiving
+                .filter(InterviewResult.interview_id > last_id, InterviewResult.archived_at.is_(None))
+                .order_by(InterviewResult.interview_id)
+                .limit(batch_size)
+                .all()
+            )
+            if not batch:
+                return indexed
+            entries = [(result.interview_id, result.transcript) for result in batch]
+            db.expunge_all()
+            for interview_id, transcript in entries:
+                index_transcript(db, interview_id, transcript)
+            db.commit()
+            indexed += len(batch)
+            last_id = entries[-1][0]
+    finally:
+        db.close()
+
+
+def find_duplicates(
+    db: Session,
+    interview_id: int,
+    threshold: float = 0.5,
+    limit: int = 20
+) -> list[dict] | None:
+    """
+    Interviews whose candidate turns look like near-copies of this one's
+
+    Only interviews sharing at least one LSH bucket are compared, so the cost
+    depends on the number of candidates, not the size of the archive.
+    Returns None when the interview has no indexed transcript.
+    """
+    row = db.query(TranscriptSignature.signature).filter(
+        TranscriptSignature.interview_id == interview_id
+    ).first()
+    if not row:
+        return None
+    signature = _decode(row.signature)
+
+    buckets = [(band, bucket) for band, bucket in enumerate(band_buckets(signature))]
+    candidate_ids = (
+        db.query(TranscriptLSHBand.interview_id)
+        .filter(
+            tuple_(TranscriptLSHBand.band, TranscriptLSHBand.bucket).in_(buckets),
+            TranscriptLSHBand.interview_id != interview_id
+        )
+        .group_by(TranscriptLSHBand.interview_id)
+        .order_by(func.count().desc())
+        .limit(max(limit * 10, 200))  # Most shared bands first; caps pathological buckets
+        .subquery()
+    )
+    candidates = (
+        db.query(TranscriptSignature.interview_id, TranscriptSignature.signature,
+                 Interview.candidate_name, Interview.role)
+        .join(Interview, Interview.id == TranscriptSignature.interview_id)
+        .filter(TranscriptSignature.interview_id.in_(db.query(candidate_ids.c.interview_id)))
+        .all()
+    )
+    if not candidates:
+        return []
+
+    scores = similarity(signature, np.stack([_decode(c.signature) for c in candidates]))
+    matches = [
+        {
+            "interview_id": c.interview_id,
+            "candidate_name": c.candidate_name,
+            "role": c.role,
+            "similarity": round(float(score), 3)
+        }
+        for c, score in zip(candidates, scores)
+        if score >= threshold
+    ]
+    matches.sort(key=lambda m: (-m["similarity"], m["interview_id"]))
+    return matches[:limit]
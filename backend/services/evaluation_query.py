@@ -0,0 +1,51 @@
+import re
+
+from sqlalchemy import case, func, literal
+from sqlalchemy.orm import Session
+
+from models import InterviewResult
+from services.evaluation_schema import TYPED_SCORE_COLUMNS
+
+# Sub-score names accepted by the list filters (keys of the evaluation object)
+SCORE_NAME = re.compile(r"^[A-Za-z_][A-Za-z0-9_]{0,63}$")
+
+
+def score_expression(db: Session, name: str):
+    """
+    SQL expression for evaluation sub-score `name`
+
+    Shared scores use their typed, indexed column; any other rubric dimension
+    is read from the evaluation JSON in the database. Values that are missing
+    or not numbers come back as NULL, so an odd evaluation can't break the
+    query (Postgres would refuse to cast "N/A" to a float).
+    """
+    if name in TYPED_SCORE_COLUMNS:
+        return getattr(InterviewResult, name)
+
+    evaluation = InterviewResult.evaluation
+    if db.get_bind().dialect.name == "postgresql":
+        is_number = func.jsonb_typeof(evaluation.op("->")(literal(name))) == "number"
+    else:
+        is_number = func.json_type(evaluation, f'$."{name}"').in_(["integer", "real"])
+    return case((is_number, evaluation[name].as_float()), else_=None)
+
+
+def evaluation_filters(
+    db: Session,
+    recommendation: list[str] | None = None,
+    score_field: str = "overall_score",
+    min_score: float | None = None,
+    max_score: float | None = None,
+) -> list:
+    """WHERE clauses on interview_results for the list endpoint's evaluation filters"""
+    filters = []
+    recommendation = [value for value in recommendation or [] if value]  # "" = any
+    if recommendation:
+        filters.append(InterviewResult.overall_recommendation.in_(recommendation))
+    if min_score is not None or max_score is not None:
+        score = score_expression(db, score_field)
+        if min_score is not None:
+            filters.append(score >= min_score)
+        if max_score is not None:
+            filters.append(score <= max_score)
+    return filters
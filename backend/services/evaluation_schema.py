@@ -0,0 +1,121 @@
+import hashlib
+import json
+import os
+from typing import Callable
+
+import fastjsonschema
+
+from services.config_sync import PROMPTS_DIR, MANIFEST_FILE
+
+# evaluation_status values
+VALID = "valid"
+INVALID = "invalid"            # Failed its schema; queued for re-fetch (see reconciliation)
+UNVALIDATED = "unvalidated"    # No schema known for the structured output
+
+# Structured output names our assistants produce
+EVALUATION_OUTPUT_NAMES = ["Interview_Evaluation", "Backend_Interview_Evaluation", "Scholarship_Evaluation"]
+# Outputs configured directly on VAPI rather than in vapi-sync.json. There is no
+# schema for them, so validation is a no-op: their evaluations are always stored
+# UNVALIDATED and never re-fetched. Scholarship interviews produce only
+# Scholarship_Evaluation, so none of their evaluations are validated.
+UNMANAGED_OUTPUT_NAMES = {"Scholarship_Evaluation"}
+
+# Numeric fields every evaluation schema shares, copied into typed, indexed columns
+TYPED_SCORE_COLUMNS = ["overall_score", "communication_clarity", "culture_fit_ownership"]
+
+# Compiled validators by schema hash: recompiled only when a schema's content changes
+_validators: dict[str, Callable] = {}
+# (path, mtime) -> parsed JSON, so unchanged files aren't re-read on every ingest
+_json_files: dict[tuple[str, float], dict] = {}
+# Known outputs already reported as missing from vapi-sync.json
+_missing_schemas: set[str] = set()
+
+
+def schema_hash(schema: dict) -> str:
+    return hashlib.sha256(json.dumps(schema, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def compile_schema(schema: dict) -> Callable:
+    """Validator for `schema`, compiled to Python once per distinct schema"""
+    key = schema_hash(schema)
+    validator = _validators.get(key)
+    if validator is None:
+        validator = _validators[key] = fastjsonschema.compile(schema)
+    return validator
+
+
+def _read_json(path: str) -> dict:
+    key = (path, os.path.getmtime(path))
+    data = _json_files.get(key)
+    if data is None:
+        with open(path, "r", encoding="utf-8") as f:
+            data = _json_files[key] = json.load(f)
+    return data
+
+
+def schema_for(output_name: str | None, prompts_dir: str = PROMPTS_DIR) -> dict | None:
+    """
+    The JSON schema vapi-sync.json declares for a structured output name
+
+    None for outputs without one. A known evaluation output without a schema
+    is reported once: expected for UNMANAGED_OUTPUT_NAMES, a warning for the
+    others (renamed or dropped from the manifest).
+    """
+    if not output_name:
+        return None
+    for spec in _read_json(os.path.join(prompts_dir, MANIFEST_FILE)).get("structured_outputs", []):
+        if spec["name"] == output_name:
+            return _read_json(os.path.join(prompts_dir, spec["schema"]))
+    if output_name in EVALUATION_OUTPUT_NAMES and output_name not in _missing_schemas:
+        _missing_schemas.add(output_name)
+        if output_name in UNMANAGED_OUTPUT_NAMES:
+            print(f"ℹ️  {output_name} has no schema in {MANIFEST_FILE}, validation is skipped for it")
+        else:
+            print(f"⚠️  No schema for {output_name} in {MANIFEST_FILE}, its evaluations are stored unvalidated")
+    return None
+
+
+def validate_evaluation(output_name: str | None, evaluation) -> tuple[str, str | None]:
+    """(evaluation_status, first error message) for an evaluation from `output_name`"""
+    schema = schema_for(output_name)
+    if schema is None:
+        return UNVALIDATED, None
+    try:
+        compile_schema(schema)(evaluation)
+    except fastjsonschema.JsonSchemaValueException as e:
+        return INVALID, e.message
+    return VALID, None
+
+
+def typed_scores(evaluation) -> dict:
+    """TYPED_SCORE_COLUMNS values; anything that isn't a number becomes None"""
+    scores = {}
+    for column in TYPED_SCORE_COLUMNS:
+        value = evaluation.get(column) if isinstance(evaluation, dict) else None
+        is_number = isinstance(value, (int, float)) and not isinstance(value, bool)
+        scores[column] = float(value) if is_number else None
+    return scores
+
+
+def apply_evaluation_checks(result):
+    """
+    Validate a result's evaluation and refresh its typed score columns
+
+    Invalid evaluations are still stored (nothing VAPI sent is lost), but the
+    result is marked invalid and counts one fetch attempt, which puts it on
+    the reconciliation re-fetch queue (up to EVALUATION_REFETCH_ATTEMPTS).
+    """
+    for column, value in typed_scores(result.evaluation).items():
+        setattr(result, column, value)
+
+    if result.evaluation is None:
+        result.evaluation_status = None
+        result.evaluation_error = None
+        return
+
+    status, error = validate_evaluation(result.evaluation_schema, result.evaluation)
+    result.evaluation_status = status
+    result.evaluation_error = error
+    if status == INVALID:
+        result.evaluation_fetch_attempts = (result.evaluation_fetch_attempts or 0) + 1
+        print(f"⚠️  {result.evaluation_schema} output failed validation: {error}")
@@ -0,0 +1,246 @@
+import csv
+import io
+import json
+from datetime import date, datetime, time as dt_time
+from typing import Iterator
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from models import Interview, InterviewResult
+from services.archive import archived_record
+from services.compression import decompress
+
+EXPORT_FORMATS = {
+    "csv": "text/csv",
+    "jsonl": "application/x-ndjson",
+    "parquet": "application/vnd.apache.parquet",
+}
+
+# Rows fetched per round trip from the server-side cursor
+YIELD_PER = 500
+
+BASE_COLUMNS = [
+    ("id", Interview.id),
+    ("candidate_name", Interview.candidate_name),
+    ("candidate_email", Interview.candidate_email),
+    ("role", Interview.role),
+    ("status", Interview.status),
+    ("created_at", Interview.created_at),
+    ("updated_at", Interview.updated_at),
+    ("vapi_call_id", InterviewResult.vapi_call_id),
+    ("call_duration", InterviewResult.call_duration),
+    ("completed_at", InterviewResult.completed_at),
+    ("summary", None),
+]
+TRANSCRIPT_COLUMN = ("transcript", None)
+# Texts stored compressed: selected as (plain, compressed) and decoded per row
+TEXT_COLUMNS = {
+    "summary": (InterviewResult.summary_text, InterviewResult.summary_compressed),
+    "transcript": (InterviewResult.transcript_text, InterviewResult.transcript_compressed),
+}
+EVALUATION_PREFIX = "evaluation."
+
+
+def flatten_evaluation(evaluation, prefix: str = EVALUATION_PREFIX) -> dict:
+    """
+    Flatten an evaluation into columns: nested objects become dotted keys,
+    lists of scalars are joined with '; ' and other lists are JSON-encoded
+    """
+    flat = {}
+    if not isinstance(evaluation, dict):
+        return flat
+    for key, value in evaluation.items():
+        column = f"{prefix}{key}"
+        if isinstance(value, dict):
+            flat.update(flatten_evaluation(value, prefix=f"{column}."))
+        elif isinstance(value, list):
+            if all(not isinstance(v, (dict, list)) for v in value):
+                flat[column] = "; ".join(str(v) for v in value)
+            else:
+                flat[column] = json.dumps(value)
+        else:
+            flat[column] = value
+    return flat
+
+
+class ExportQuery:
+    """Filtered, streamed export of interviews joined with their results"""
+
+    def __init__(
+        self,
+        role: str | None = None,
+        status: str | None = None,
+        start_date: date | None = None,
+        end_date: date | None = None,
+        include_transcript: bool = False
+    ):
+        self.filters = []
+        if role:
+            self.filters.append(Interview.role == role)
+        if status:
+            self.filters.append(Interview.status == status)
+        if start_date:
+            self.filters.append(Interview.created_at >= datetime.combine(start_date, dt_time.min))
+        if end_date:
+            self.filters.append(Interview.created_at <= datetime.combine(end_date, dt_time.max))
+        self.columns = BASE_COLUMNS + ([TRANSCRIPT_COLUMN] if include_transcript else [])
+
+    def _select(self, *columns):
+        return (
+            select(*columns)
+            .select_from(Interview)
+            .outerjoin(InterviewResult, InterviewResult.interview_id == Interview.id)
+            .where(*self.filters)
+            .order_by(Interview.id)
+        )
+
+    def _stream(self, db: Session, statement):
+        # Column tuples + server-side cursor: memory stays flat regardless of cohort size
+        return db.execute(statement.execution_options(stream_results=True, yield_per=YIELD_PER))
+
+    def evaluation_columns(self, db: Session) -> dict[str, set]:
+        """First pass over the evaluations only: flattened column name -> Python value types"""
+        columns = {}
+        for (evaluation,) in self._stream(db, self._select(InterviewResult.evaluation)):
+            for column, value in flatten_evaluation(evaluation).items():
+                if value is not None:
+                    columns.setdefault(column, set()).add(type(value))
+                else:
+                    columns.setdefault(column, set())
+        return dict(sorted(columns.items()))
+
+    def rows(self, db: Session, evaluation_columns) -> Iterator[dict]:
+        """Second pass: one flat dict per interview"""
+        selected = []
+        for name, column in self.columns:
+            selected += TEXT_COLUMNS.get(name, (column,))
+        statement = self._select(
+            *selected, InterviewResult.archive_path, InterviewResult.compression_dictionary_id, InterviewResult.evaluation
+        )
+        bind = db.get_bind()
+        for row in self._stream(db, statement):
+            values = iter(row[:-3])
+            # Archived results: texts come from their Parquet file (cached per file, rows are in id order)
+            archived = (archived_record(row[-3], row[0]) or {}) if row[-3] else None
+            record = {}
+            for name, _ in self.columns:
+                if name in TEXT_COLUMNS:
+                    plain, data = next(values), next(values)
+                    if archived is not None:
+                        record[name] = archived.get(name)
+                    else:
+                        record[name] = plain if plain is not None or data is None else decompress(data, row[-2], bind)
+                else:
+                    record[name] = next(values)
+            flat = flatten_evaluation(row[-1])
+            for column in evaluation_columns:
+                record[column] = flat.get(column)
+            yield record
+
+
+def _jsonable(value):
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return value
+
+
+def stream_csv(db: Session, query: ExportQuery, chunk_rows: int = 200) -> Iterator[bytes]:
+    evaluation_columns = query.evaluation_columns(db)
+    header = [name for name, _ in query.columns] + list(evaluation_columns)
+
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=header)
+    writer.writeheader()
+    for i, record in enumerate(query.rows(db, evaluation_columns), start=1):
+        writer.writerow({k: _jsonable(v) for k, v in record.items()})
+        if i % chunk_rows == 0:
+            yield buffer.getvalue().encode("utf-8")
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue().encode("utf-8")
+
+
+def stream_jsonl(db: Session, query: ExportQuery, chunk_rows: int = 200) -> Iterator[bytes]:
+    evaluation_columns = query.evaluation_columns(db)
+    lines = []
+    for record in query.rows(db, evaluation_columns):
+        lines.append(json.dumps({k: _jsonable(v) for k, v in record.items()}))
+        if len(lines) >= chunk_rows:
+            yield ("\n".join(lines) + "\n").encode("utf-8")
+            lines = []
+    if lines:
+        yield ("\n".join(lines) + "\n").encode("utf-8")
+
+
+class _ChunkSink(io.RawIOBase):
+    """Write-only file that hands written bytes back to the response stream"""
+
+    def __init__(self):
+        self._chunks = []
+        self._position = 0
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self._chunks.append(bytes(data))
+        self._position += len(data)
+        return len(data)
+
+    def tell(self):
+        return self._position
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def _arrow_type(types: set):
+    import pyarrow as pa
+
+    if types and types <= {bool}:
+        return pa.bool_()
+    if types and types <= {int, float}:
+        return pa.float64()
+    return pa.string()
+
+
+def stream_parquet(db: Session, query: ExportQuery, row_group_size: int = 5000) -> Iterator[bytes]:
+    """Columnar export; each row group is flushed to the client as soon as it's written"""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    evaluation_columns = query.evaluation_columns(db)
+    base_types = {
+        "id": pa.int64(),
+        "created_at": pa.timestamp("us"),
+        "updated_at": pa.timestamp("us"),
+        "completed_at": pa.timestamp("us"),
+        "call_duration": pa.float64(),
+    }
+    fields = [pa.field(name, base_types.get(name, pa.string())) for name, _ in query.columns]
+    fields += [pa.field(column, _arrow_type(types)) for column, types in evaluation_columns.items()]
+    schema = pa.schema(fields)
+    string_columns = {f.name for f in fields if f.type == pa.string()}
+
+    def normalize(record):
+        # Mixed-type evaluation fields are exported as strings
+        return {
+            k: (str(v) if k in string_columns and v is not None and not isinstance(v, str) else v)
+            for k, v in record.items()
+        }
+
+    sink = _ChunkSink()
+    with pq.ParquetWriter(sink, schema, compression="zstd") as writer:
+        batch = []
+        for record in query.rows(db, evaluation_columns):
+            batch.append(normalize(record))
+            if len(batch) >= row_group_size:
+                writer.write_table(pa.Table.from_pylist(batch, schema=schema))
+                batch = []
+                yield sink.drain()
+        if batch:
+            writer.write_table(pa.Table.from_pylist(batch, schema=schema))
+    yield sink.drain()
@@ -0,0 +1,330 @@
+"""
+Transactional outbox for notifications (email to HR, outbound webhooks)
+
+Whatever produces an event writes one OutboxEvent row per destination in the
+same transaction as the change itself: a completed interview and its
+notifications commit (or roll back) together, and sending never happens on
+the webhook's request path. The OutboxDispatcher drains the table in the
+background:
+
+- events are grouped per destination and sent in batches (one SMTP session
+  for up to OUTBOX_BATCH_SIZE emails, one POST carrying a list of events);
+- each destination has its own concurrency limit and a database lease, so
+  one worker drains it at a time and a slow webhook never holds up email;
+- failures are retried with exponential backoff, up to OUTBOX_MAX_ATTEMPTS,
+  then the event is marked dead (`candimind outbox --retry-dead`).
+
+Delivery is at least once: webhook receivers should dedupe on the event id.
+"""
+import asyncio
+import hashlib
+import hmac
+import json
+import smtplib
+import time
+from datetime import datetime, timedelta
+from email.message import EmailMessage
+
+import httpx
+from sqlalchemy import delete, func
+from sqlalchemy.orm import Session
+
+from config import get_settings
+from database import SessionLocal
+from models import Interview, InterviewResult, OutboxEvent
+from services.single_flight import SQLLease, keep_lease
+
+settings = get_settings()
+
+PENDING = "pending"
+SENT = "sent"
+DEAD = "dead"
+
+EMAIL = "email"
+WEBHOOK_PREFIX = "webhook:"
+
+INTERVIEW_COMPLETED = "interview.completed"
+
+RETRY_BASE_SECONDS = 30
+RETRY_MAX_SECONDS = 3600
+KEEP_SENT_DAYS = 7  # Delivered events are pruned after this
+
+
+def destinations() -> list[str]:
+    """Configured destinations: "email" and one "webhook:<url>" per URL"""
+    found = [EMAIL] if settings.notify_emails.strip() else []
+    found += [f"{WEBHOOK_PREFIX}{url.strip()}" for url in settings.notify_webhook_urls.split(",") if url.strip()]
+    return found
+
+
+def enqueue(db: Session, event_type: str, payload: dict) -> int:
+    """Add an event for every destination (within the caller's transaction); returns rows added"""
+    rows = [
+        OutboxEvent(event_type=event_type, destination=destination, payload=payload, status=PENDING,
+                    attempts=0, next_attempt_at=datetime.utcnow())
+        for destination in destinations()
+    ]
+    db.add_all(rows)
+    return len(rows)
+
+
+def notify_interview_completed(db: Session, interview: Interview, result: InterviewResult) -> int:
+    evaluation = result.evaluation if isinstance(result.evaluation, dict) else {}
+    return enqueue(db, INTERVIEW_COMPLETED, {
+        "interview_id": interview.id,
+        "candidate_name": interview.candidate_name,
+        "candidate_email": interview.candidate_email,
+        "role": interview.role,
+        "overall_recommendation": evaluation.get("overall_recommendation"),
+        "overall_score": evaluation.get("overall_score"),
+        "evaluation_status": result.evaluation_status,
+        "completed_at": (result.completed_at or datetime.utcnow()).isoformat(),
+        "dashboard_url": settings.frontend_url,
+    })
+
+
+class DeliveryError(Exception):
+    """A batch (or some of its events) could not be delivered"""
+
+
+def _email(event: OutboxEvent) -> EmailMessage:
+    data = event.payload
+    recommendation = data.get("overall_recommendation") or "no recommendation yet"
+    message = EmailMessage()
+    message["From"] = settings.smtp_from
+    message["To"] = settings.notify_emails
+    message["Subject"] = f"Interview completed: {data['candidate_name']} ({data['role']}) - {recommendation}"
+    message["Message-ID"] = f"<outbox-{event.id}@candimind>"  # Stable, so a resent email can be deduped
+    score = data.get("overall_score")
+    message.set_content(
+        f"{data['candidate_name']} <{data['candidate_email']}> finished their {data['role']} interview.\n\n"
+        f"Recommendation: {recommendation}\n"
+        f"Overall score: {score if score is not None else '-'}\n"
+        f"Completed: {data['completed_at']} UTC\n\n"
+        f"Review it on the dashboard: {data['dashboard_url']}\n"
+    )
+    return message
+
+
+def _send_emails(events: list[OutboxEvent]) -> dict[int, str | None]:
+    """One SMTP session for the whole batch; returns event id -> error (None = sent)"""
+    outcomes = {}
+    with smtplib.SMTP(settings.smtp_host, settings.smtp_port, timeout=30) as smtp:
+        if settings.smtp_starttls:
+            smtp.starttls()
+        if settings.smtp_username:
+            smtp.login(settings.smtp_username, settings.smtp_password or "")
+        for event in events:
+            try:
+                smtp.send_message(_email(event))
+                outcomes[event.id] = None
+            except smtplib.SMTPRecipientsRefused as e:
+                outcomes[event.id] = f"Recipients refused: {e.recipients}"
+            except smtplib.SMTPDataError as e:
+                outcomes[event.id] = f"SMTP {e.smtp_code}: {e.smtp_error!r}"
+    return outcomes
+
+
+def _webhook_body(events: list[OutboxEvent]) -> bytes:
+    return json.dumps({"events": [
+        {"id": event.id, "type": event.event_type, "created_at": event.created_at.isoformat(), "data": event.payload}
+        for event in events
+    ]}).encode("utf-8")
+
+
+class OutboxDispatcher:
+    """
+    Per-worker background sender
+
+    `wake()` after committing new events dispatches them right away;
+    otherwise the outbox is rescanned every OUTBOX_POLL_SECONDS (retries,
+    events committed by other workers or the CLI).
+    """
+
+    def __init__(self, session_factory=SessionLocal, lease=None):
+        self.session_factory = session_factory
+        self.lease = lease or SQLLease(lease_seconds=300)
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task | None = None
+        self._http: httpx.AsyncClient | None = None
+        self._pruned_at = float("-inf")
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        if self._http is None:
+            self._http = httpx.AsyncClient(timeout=httpx.Timeout(15.0, connect=5.0))
+        return self._http
+
+    def start(self):
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    def wake(self):
+        self._wakeup.set()
+
+    async def aclose(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+
+    async def _run(self):
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=settings.outbox_poll_seconds)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            try:
+                await self.run_once()
+            except Exception as e:
+                print(f"❌ Outbox dispatch failed: {e}")
+
+    def _due_destinations(self) -> list[str]:
+        db = self.session_factory()
+        try:
+            if time.monotonic() - self._pruned_at > 3600:
+                db.execute(delete(OutboxEvent).where(
+                    OutboxEvent.status == SENT, OutboxEvent.sent_at < datetime.utcnow() - timedelta(days=KEEP_SENT_DAYS)
+                ))
+                db.commit()
+                self._pruned_at = time.monotonic()
+            return [destination for (destination,) in (
+                db.query(OutboxEvent.destination)
+                .filter(OutboxEvent.status == PENDING, OutboxEvent.next_attempt_at <= datetime.utcnow())
+                .distinct()
+            )]
+        finally:
+            db.close()
+
+    async def run_once(self) -> dict:
+        """Send everything that's due, destinations in parallel; returns counts by outcome"""
+        totals = {SENT: 0, "retry": 0, DEAD: 0}
+        destinations_due = await asyncio.to_thread(self._due_destinations)
+        for counts in await asyncio.gather(*(self._drain(d) for d in destinations_due)):
+            for outcome, count in counts.items():
+                totals[outcome] += count
+        return totals
+
+    def _claim(self, destination: str, limit: int) -> list[OutboxEvent]:
+        db = self.session_factory(expire_on_commit=False)
+        try:
+            events = (
+                db.query(OutboxEvent)
+                .filter(OutboxEvent.destination == destination, OutboxEvent.status == PENDING,
+                        OutboxEvent.next_attempt_at <= datetime.utcnow())
+                .order_by(OutboxEvent.id)
+                .limit(limit)
+                .all()
+            )
+            db.expunge_all()
+            return events
+        finally:
+            db.close()
+
+    async def _drain(self, destination: str) -> dict:
+        """Send a destination's due events, in batches, under its lease"""
+        counts = {SENT: 0, "retry": 0, DEAD: 0}
+        key = f"outbox:{hashlib.sha256(destination.encode()).hexdigest()[:32]}"  # URLs can be long
+        if not await asyncio.to_thread(self.lease.acquire, key):
+            return counts  # Another worker is draining it
+        # A long backlog (or slow SMTP) outlasts the lease; renew it, and stop if it's lost anyway
+        renewing = asyncio.ensure_future(keep_lease(self.lease, key, "outbox"))
+        try:
+            concurrency = (
+                settings.outbox_email_concurrency if destination == EMAIL else settings.outbox_webhook_concurrency
+            )
+            semaphore = asyncio.Semaphore(max(1, concurrency))
+            while not renewing.done():
+                events = await asyncio.to_thread(self._claim, destination, settings.outbox_batch_size * concurrency)
+                if not events:
+                    return counts
+                batches = [
+                    events[i:i + settings.outbox_batch_size]
+                    for i in range(0, len(events), settings.outbox_batch_size)
+                ]
+
+                async def send(batch):
+                    async with semaphore:
+                        return await self._send(destination, batch)
+
+                results = await asyncio.gather(*(send(batch) for batch in batches))
+                outcomes = {event_id: error for result in results for event_id, error in result.items()}
+                for outcome, count in (await asyncio.to_thread(self._record, outcomes)).items():
+                    counts[outcome] += count
+                if counts["retry"] or counts[DEAD]:
+                    return counts  # Destination is failing; back off instead of hammering it
+            return counts
+        finally:
+            renewing.cancel()
+            await asyncio.to_thread(self.lease.release, key)
+
+    async def _send(self, destination: str, events: list[OutboxEvent]) -> dict[int, str | None]:
+        """Deliver one batch; returns event id -> error (None = delivered)"""
+        try:
+            if destination == EMAIL:
+                return await asyncio.to_thread(_send_emails, events)
+            if destination.startswith(WEBHOOK_PREFIX):
+                await self._post_webhook(destination.removeprefix(WEBHOOK_PREFIX), events)
+                return {event.id: None for event in events}
+            raise DeliveryError(f"Unknown destination {destination!r}")
+        except (OSError, smtplib.SMTPException, httpx.HTTPError, DeliveryError) as e:
+            error = f"{type(e).__name__}: {e}"[:1000]
+            print(f"⚠️  Notification batch to {destination} failed ({len(events)} events): {error}")
+            return {event.id: error for event in events}
+
+    async def _post_webhook(self, url: str, events: list[OutboxEvent]):
+        body = _webhook_body(events)
+        headers = {"Content-Type": "application/json"}
+        if settings.notify_webhook_secret:
+            signature = hmac.new(settings.notify_webhook_secret.encode(), body, hashlib.sha256).hexdigest()
+            headers["X-Candimind-Signature"] = f"sha256={signature}"
+        response = await self.client.post(url, content=body, headers=headers)
+        response.raise_for_status()
+
+    def _record(self, outcomes: dict[int, str | None]) -> dict:
+        """Mark delivered events sent and schedule retries (or give up) for the rest"""
+        counts = {SENT: 0, "retry": 0, DEAD: 0}
+        now = datetime.utcnow()
+        db = self.session_factory()
+        try:
+            for event in db.query(OutboxEvent).filter(OutboxEvent.id.in_(list(outcomes))):
+                error = outcomes[event.id]
+                event.attempts += 1
+                if error is None:
+                    event.status = SENT
+                    event.sent_at = now
+                    event.last_error = None
+                    counts[SENT] += 1
+                elif event.attempts >= settings.outbox_max_attempts:
+                    event.status = DEAD
+                    event.last_error = error
+                    counts[DEAD] += 1
+                else:
+                    delay = min(RETRY_BASE_SECONDS * 2 ** (event.attempts - 1), RETRY_MAX_SECONDS)
+                    event.next_attempt_at = now + timedelta(seconds=delay)
+                    event.last_error = error
+                    counts["retry"] += 1
+            db.commit()
+        finally:
+            db.close()
+        return counts
+
+
+def outbox_counts(db: Session) -> list[tuple[str, str, int]]:
+    """(destination, status, count) rows, for the CLI"""
+    return (
+        db.query(OutboxEvent.destination, OutboxEvent.status, func.count())
+        .group_by(OutboxEvent.destination, OutboxEvent.status)
+        .order_by(OutboxEvent.destination, OutboxEvent.status)
+        .all()
+    )
+
+
+outbox_dispatcher = OutboxDispatcher()
@@ -0,0 +1,200 @@
+import cProfile
+import json
+import os
+import pstats
+import random
+import secrets
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+from sqlalchemy import event
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from config import get_settings
+from database import engine, query_stats
+
+settings = get_settings()
+
+PROFILE_HEADER = "X-Profile-Token"
+
+# One cProfile session at a time: overlapping ones replace (3.11) or reject (3.12+) each other's hook
+_profiler_lock = threading.Lock()
+
+
+class QueryStats:
+    """Collects the SQL statements executed while it is active"""
+
+    def __init__(self):
+        self.statements = []
+
+    def record(self, statement: str, duration: float):
+        self.statements.append((statement, duration))
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+    @property
+    def total_time(self) -> float:
+        return sum(duration for _, duration in self.statements)
+
+    def summary(self, limit: int = 20) -> list:
+        """Group identical statements, slowest first"""
+        grouped = {}
+        for statement, duration in self.statements:
+            entry = grouped.setdefault(statement, {"statement": statement, "count": 0, "total_ms": 0.0})
+            entry["count"] += 1
+            entry["total_ms"] += duration * 1000
+        return sorted(grouped.values(), key=lambda e: e["total_ms"], reverse=True)[:limit]
+
+
+def _collapsed_stacks(stats: pstats.Stats) -> list[str]:
+    """
+    Convert cProfile stats into collapsed stack lines for flamegraph.pl / speedscope
+
+    cProfile only records caller -> callee edges, so each function is attributed
+    to the stack formed by following its most expensive caller up to the root.
+    """
+    entries = stats.stats
+
+    def label(func):
+        filename, line, name = func
+        return f"{os.path.basename(filename)}:{name}:{line}"
+
+    def primary_caller(func):
+        callers = entries[func][4]
+        if not callers:
+            return None
+        return max(callers, key=lambda c: callers[c][3])
+
+    lines = []
+    for func, (_, _, tottime, _, _) in entries.items():
+        micros = int(tottime * 1_000_000)
+        if micros <= 0:
+            continue
+        stack = [label(func)]
+        seen = {func}
+        caller = primary_caller(func)
+        while caller is not None and caller not in seen and caller in entries:
+            stack.append(label(caller))
+            seen.add(caller)
+            caller = primary_caller(caller)
+        lines.append(f"{';'.join(reversed(stack))} {micros}")
+    return lines
+
+
+def _should_profile(request) -> bool:
+    token = request.headers.get(PROFILE_HEADER)
+    if settings.profiling_token and token:
+        return secrets.compare_digest(token, settings.profiling_token)
+    return settings.profiling_sample_rate > 0 and random.random() < settings.profiling_sample_rate
+
+
+class ProfilingMiddleware(BaseHTTPMiddleware):
+    """
+    Profile individual requests on demand
+
+    A request is profiled when it carries a valid X-Profile-Token header or is
+    picked by PROFILING_SAMPLE_RATE. For each profiled request we store in
+    PROFILING_DIR:
+    - <id>.prof   raw cProfile output (snakeviz, flameprof, gprof2dot)
+    - <id>.folded collapsed stacks (flamegraph.pl, speedscope)
+    - <id>.json   timings and the SQL statements that were executed
+    The profile id and timings are returned in response headers.
+
+    cProfile hooks the whole thread, so a profile also contains whatever else
+    the event loop ran meanwhile, and only one can be active at a time:
+    requests arriving while another is being profiled are served unprofiled.
+    """
+
+    async def dispatch(self, request, call_next):
+        if not _should_profile(request) or not _profiler_lock.acquire(blocking=False):
+            return await call_next(request)
+
+        try:
+            stats = QueryStats()
+            token = query_stats.set(stats)
+            profiler = cProfile.Profile()
+            started = time.perf_counter()
+            profiler.enable()
+            try:
+                response = await call_next(request)
+            finally:
+                profiler.disable()
+                query_stats.reset(token)
+        finally:
+            _profiler_lock.release()
+        elapsed = time.perf_counter() - started
+
+        profile_id = f"{datetime.utcnow():%Y%m%dT%H%M%S}-{secrets.token_hex(4)}"
+        try:
+            _store_profile(profile_id, profiler, stats, request, response, elapsed)
+        except OSError as e:
+            print(f"❌ Failed to store profile {profile_id}: {e}")
+
+        response.headers["X-Profile-Id"] = profile_id
+        response.headers["X-Query-Count"] = str(stats.count)
+        response.headers["Server-Timing"] = (
+            f'db;dur={stats.total_time * 1000:.1f};desc="{stats.count} queries", '
+            f"total;dur={elapsed * 1000:.1f}"
+        )
+        return response
+
+
+def _store_profile(profile_id, profiler, stats, request, response, elapsed):
+    os.makedirs(settings.profiling_dir, exist_ok=True)
+    base = os.path.join(settings.profiling_dir, profile_id)
+
+    profiler.dump_stats(f"{base}.prof")
+    with open(f"{base}.folded", "w", encoding="utf-8") as f:
+        f.write("\n".join(_collapsed_stacks(pstats.Stats(profiler))))
+
+    report = {
+        "id": profile_id,
+        "method": request.method,
+        "path": request.url.path,
+        "status_code": response.status_code,
+        "duration_ms": round(elapsed * 1000, 2),
+        "query_count": stats.count,
+        "query_time_ms": round(stats.total_time * 1000, 2),
+        "queries": stats.summary(),
+    }
+    with open(f"{base}.json", "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+
+    print(f"🔬 Profiled {request.method} {request.url.path}: {elapsed * 1000:.1f}ms, "
+          f"{stats.count} queries -> {base}.json")
+
+
+@contextmanager
+def assert_max_queries(limit: int, target_engine=engine):
+    """
+    Fail when the wrapped block executes more than `limit` SQL statements
+
+    Listens on the engine directly, so it also counts statements issued from
+    the TestClient's worker thread:
+
+        with assert_max_queries(2):
+            client.get("/api/interviews")
+
+    An N+1 regression (e.g. lazy loading `interview.result` per row) makes the
+    count grow with the number of rows and trips the budget.
+    """
+    stats = QueryStats()
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        stats.record(statement, time.perf_counter() - context._query_started_at)
+
+    event.listen(target_engine, "after_cursor_execute", _record)
+    try:
+        yield stats
+    finally:
+        event.remove(target_engine, "after_cursor_execute", _record)
+
+    if stats.count > limit:
+        details = "\n".join(f"  {e['count']}x {e['statement']}" for e in stats.summary())
+        raise AssertionError(
+            f"Query budget exceeded: {stats.count} statements (limit {limit})\n{details}"
+        )
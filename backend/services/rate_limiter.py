@@ -0,0 +1,170 @@
+import asyncio
+import json
+import random
+import time
+
+from sqlalchemy import insert, select, update
+from sqlalchemy.exc import IntegrityError, OperationalError
+
+from config import get_settings
+from database import engine
+from models import RateLimitBucket
+from services.file_lock import file_lock
+
+settings = get_settings()
+
+# User-facing requests (HR clicking "Fetch Results") may drain the bucket;
+# background work (webhook polling, reconciliation, the candimind CLI) must
+# leave a reserve for them.
+PRIORITY_INTERACTIVE = "interactive"
+PRIORITY_BACKGROUND = "background"
+
+
+def _refill(tokens: float, updated_at: float, now: float, rate: float, burst: float) -> float:
+    return min(burst, tokens + max(0.0, now - updated_at) * rate)
+
+
+class SQLBucketBackend:
+    """Token bucket state in the shared application database (compare-and-swap)"""
+
+    def __init__(self, target_engine=engine):
+        self.engine = target_engine
+        self.table = RateLimitBucket.__table__
+
+    def take(self, name: str, cost: float, floor: float, rate: float, burst: float) -> float:
+        table = self.table
+        for _ in range(20):
+            try:
+                with self.engine.begin() as conn:
+                    row = conn.execute(
+                        select(table.c.tokens, table.c.updated_at).where(table.c.name == name)
+                    ).first()
+                    if row is None:
+                        conn.execute(insert(table).values(name=name, tokens=burst, updated_at=time.time()))
+                        continue
+
+                    now = time.time()
+                    tokens = _refill(row.tokens, row.updated_at, now, rate, burst)
+                    if tokens - cost < floor:
+                        return (floor + cost - tokens) / rate
+
+                    # Only succeeds if no other worker touched the bucket since we read it
+                    swapped = conn.execute(
+                        update(table)
+                        .where(table.c.name == name, table.c.updated_at == row.updated_at)
+                        .values(tokens=tokens - cost, updated_at=now)
+                    ).rowcount
+                    if swapped:
+                        return 0.0
+            except (IntegrityError, OperationalError):
+                # Concurrent insert or "database is locked" - retry
+                time.sleep(random.uniform(0.005, 0.02))
+        return 1.0 / rate
+
+
+class FileBucketBackend:
+    """Token bucket state in a JSON file guarded by an OS file lock (single host)"""
+
+    def __init__(self, path: str):
+        self.path = path
+
+    def take(self, name: str, cost: float, floor: float, rate: float, burst: float) -> float:
+        with file_lock(f"{self.path}.lock"):
+            try:
+                with open(self.path, "r", encoding="utf-8") as f:
+                    state = json.load(f)
+            except (OSError, ValueError):
+                state = {}
+
+            now = time.time()
+            tokens, updated_at = state.get(name, (burst, now))
+            tokens = _refill(tokens, updated_at, now, rate, burst)
+            if tokens - cost < floor:
+                return (floor + cost - tokens) / rate
+
+            state[name] = (tokens - cost, now)
+            with open(self.path, "w", encoding="utf-8") as f:
+                json.dump(state, f)
+            return 0.0
+
+
+class RedisBucketBackend:
+    """Token bucket state in Redis (or any server speaking the Redis protocol)"""
+
+    SCRIPT = """
+    local cost = tonumber(ARGV[1])
+    local floor = tonumber(ARGV[2])
+    local rate = tonumber(ARGV[3])
+    local burst = tonumber(ARGV[4])
+    local now = tonumber(ARGV[5])
+    local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+    local tokens = tonumber(state[1]) or burst
+    local ts = tonumber(state[2]) or now
+    tokens = math.min(burst, tokens + math.max(0, now - ts) * rate)
+    if tokens - cost < floor then
+        return tostring((floor + cost - tokens) / rate)
+    end
+    redis.call('HSET', KEYS[1], 'tokens', tostring(tokens - cost), 'ts', tostring(now))
+    redis.call('EXPIRE', KEYS[1], 3600)
+    return '0'
+    """
+
+    def __init__(self, url: str):
+        import redis  # Optional dependency, only needed for this backend
+
+        self.client = redis.Redis.from_url(url)
+        self.script = self.client.register_script(self.SCRIPT)
+
+    def take(self, name: str, cost: float, floor: float, rate: float, burst: float) -> float:
+        wait = self.script(keys=[f"ratelimit:{name}"], args=[cost, floor, rate, burst, time.time()])
+        return float(wait)
+
+
+def create_backend():
+    """Build the bucket backend selected by VAPI_RATE_LIMIT_BACKEND"""
+    backend = settings.vapi_rate_limit_backend
+    if backend == "redis":
+        return RedisBucketBackend(settings.vapi_rate_limit_redis_url)
+    if backend == "file":
+        return FileBucketBackend(settings.vapi_rate_limit_file)
+    if backend == "sql":
+        return SQLBucketBackend()
+    raise ValueError(f"Unknown rate limit backend: {backend}")
+
+
+class RateLimiter:
+    """Token bucket limiter shared by every worker and script using the same backend"""
+
+    def __init__(self, name: str, rate: float, burst: float, reserved_fraction: float = 0.0, backend=None):
+        self.name = name
+        self.rate = rate
+        self.burst = burst
+        self.reserved = burst * reserved_fraction
+        self._backend = backend
+
+    @property
+    def backend(self):
+        if self._backend is None:
+            self._backend = create_backend()
+        return self._backend
+
+    async def acquire(self, priority: str = PRIORITY_INTERACTIVE, cost: float = 1.0):
+        """Wait until a token is available for the given priority"""
+        if self.rate <= 0:
+            return
+        floor = self.reserved if priority == PRIORITY_BACKGROUND else 0.0
+        while True:
+            wait = await asyncio.to_thread(self.backend.take, self.name, cost, floor, self.rate, self.burst)
+            if wait <= 0:
+                return
+            # Jitter so waiting workers don't retry in lockstep
+            await asyncio.sleep(min(wait, 5.0) + random.uniform(0, 0.05))
+
+
+# Shared limiter for all outbound VAPI API calls
+vapi_rate_limiter = RateLimiter(
+    name="vapi",
+    rate=settings.vapi_rate_limit_per_second,
+    burst=settings.vapi_rate_limit_burst,
+    reserved_fraction=settings.vapi_rate_limit_reserved_fraction,
+)
@@ -0,0 +1,361 @@
+import asyncio
+from datetime import datetime
+from typing import Callable
+
+from sqlalchemy import Text, cast, or_
+from sqlalchemy.orm import Session, contains_eager
+
+from config import get_settings
+from database import SessionLocal
+from models import Interview, InterviewResult
+from services.rate_limiter import PRIORITY_BACKGROUND, PRIORITY_INTERACTIVE
+from services.results import parse_call_details, save_interview_result
+from services.recordings import queue_recording, recording_downloader, recording_url
+from services.outbox import outbox_dispatcher
+from services.evaluation_schema import INVALID as INVALID_EVALUATION
+from services.single_flight import SingleFlight
+from services.vapi_service import vapi_service
+
+settings = get_settings()
+
+# Outcomes reported per interview
+UPDATED = "updated"
+NOT_READY = "not_ready"      # Call found but VAPI has no evaluation yet
+UNRESOLVED = "unresolved"    # No VAPI call could be linked to the interview
+FAILED = "failed"            # VAPI returned an error
+INVALID = "invalid"          # Evaluation fetched but failed its schema again
+
+
+def find_incomplete_interviews(db: Session, limit: int | None = None) -> list[Interview]:
+    """
+    Interviews that are in progress, or completed without a usable evaluation
+
+    Evaluations that failed schema validation are re-fetched until they have
+    been fetched EVALUATION_REFETCH_ATTEMPTS times.
+    """
+    missing_evaluation = or_(
+        InterviewResult.id.is_(None),
+        InterviewResult.evaluation.is_(None),
+        cast(InterviewResult.evaluation, Text) == "null",  # JSON null
+        (InterviewResult.evaluation_status == INVALID_EVALUATION)
+        & (InterviewResult.evaluation_fetch_attempts < settings.evaluation_refetch_attempts),
+    )
+    query = (
+        db.query(Interview)
+        .outerjoin(InterviewResult, InterviewResult.interview_id == Interview.id)
+        .options(contains_eager(Interview.result))
+        .filter(or_(
+            Interview.status == "in_progress",
+            (Interview.status == "completed") & missing_evaluation,
+        ))
+        .order_by(Interview.updated_at.asc())
+    )
+    if limit:
+        query = query.limit(limit)
+    return query.all()
+
+
+def _link_call(db: Session, interview: Interview, call_id: str):
+    """Keep the call id so the next fetch doesn't have to search again"""
+    if interview.result:
+        interview.result.vapi_call_id = call_id
+    else:
+        db.add(InterviewResult(
+            interview=interview,
+            vapi_call_id=call_id,
+            transcript="",
+            summary="",
+            evaluation=None,
+            call_duration=0
+        ))
+
+
+def apply_call_details(db: Session, interview: Interview, call_id: str, call_details: dict) -> str:
+    """Store a fetched call on the interview (without committing); returns the outcome"""
+    parsed = parse_call_details(call_details)
+    queue_recording(db, interview, call_id, recording_url(call_details))  # Ready before the evaluation often is
+    if not parsed["evaluation"]:
+        if not (interview.result and interview.result.vapi_call_id):
+            _link_call(db, interview, call_id)
+        return NOT_READY
+
+    save_interview_result(
+        db,
+        interview,
+        vapi_call_id=call_id,
+        transcript=parsed["transcript"],
+        summary=parsed["summary"],
+        evaluation=parsed["evaluation"],
+        evaluation_schema=parsed["evaluation_name"],
+        call_duration=parsed["call_duration"],
+        completed_at=datetime.utcnow()
+    )
+    return INVALID if interview.result.evaluation_status == INVALID_EVALUATION else UPDATED
+
+
+async def _resolve_call_ids(interviews: list[Interview], search_limit: int) -> dict[int, str]:
+    """Map interview id -> VAPI call id, listing recent calls once for all unlinked interviews"""
+    call_ids = {}
+    unlinked = []
+    for interview in interviews:
+        if interview.result and interview.result.vapi_call_id:
+            call_ids[interview.id] = interview.result.vapi_call_id
+        else:
+            unlinked.append(interview)
+
+    if unlinked:
+        recent_calls = await vapi_service.list_calls(limit=search_limit, priority=PRIORITY_BACKGROUND)
+        for interview in unlinked:
+            matches = vapi_service.match_calls(recent_calls, interview.unique_id, interview.candidate_name)
+            if matches:
+                call_ids[interview.id] = matches[0].get("id")
+
+    return call_ids
+
+
+class _ResultBatch:
+    """
+    Fetched calls waiting to be written in one transaction
+
+    Each fetch job parks its call details here and waits for the commit, so
+    it keeps its fetch_flight lease until the result is actually stored.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+        self.fetching = 0  # Jobs started that haven't parked or finished yet
+        self.pending: list[tuple[Interview, str, dict, asyncio.Future]] = []
+        self.changed = asyncio.Event()
+
+    async def fetch(self, interview: Interview, call_id: str, semaphore: asyncio.Semaphore) -> dict:
+        """fetch_flight job: fetch the call, then wait for the batch to store it"""
+        self.fetching += 1
+        try:
+            async with semaphore:
+                call_details = await vapi_service.get_call_details(call_id, priority=PRIORITY_BACKGROUND)
+            if not call_details:
+                return _fetch_outcome(FAILED, interview, call_id)
+            stored = asyncio.get_running_loop().create_future()
+            self.pending.append((interview, call_id, call_details, stored))
+        finally:
+            self.fetching -= 1
+            self.changed.set()
+        return await stored
+
+    def flush(self):
+        """Apply every parked call and commit them together"""
+        pending, self.pending = self.pending, []
+        # Re-read what other writers stored before we held the leases
+        self.db.expire_all()
+        try:
+            outcomes = [
+                apply_call_details(self.db, interview, call_id, call_details)
+                for interview, call_id, call_details, _ in pending
+            ]
+            self.db.commit()
+        except Exception as e:
+            self.db.rollback()
+            for *_, stored in pending:
+                stored.set_exception(e)
+            return
+        recording_downloader.wake()
+        outbox_dispatcher.wake()
+        for (interview, call_id, _, stored), outcome in zip(pending, outcomes):
+            stored.set_result(_fetch_outcome(outcome, interview, call_id))
+
+    async def run(self, tasks: list[asyncio.Task]):
+        """Flush whenever every started fetch has parked, until all tasks are done"""
+        while not all(task.done() for task in tasks):
+            self.changed.clear()
+            if self.pending and not self.fetching:
+                self.flush()
+                continue
+            changed = asyncio.ensure_future(self.changed.wait())
+            await asyncio.wait(
+                [task for task in tasks if not task.done()] + [changed],
+                return_when=asyncio.FIRST_COMPLETED
+            )
+            changed.cancel()
+
+
+async def reconcile_interviews(
+    db: Session,
+    interviews: list[Interview],
+    concurrency: int = 5,
+    batch_size: int = 20,
+    search_limit: int = 100,
+    progress: Callable[[int, int, Interview, str], None] | None = None,
+) -> dict:
+    """
+    Fetch and store VAPI results for the given interviews
+
+    Unlinked interviews are matched against one listing of recent calls and
+    their call ids stored up front. Call details are fetched with at most
+    `concurrency` requests in flight and each batch of `batch_size`
+    interviews is written in a single transaction. Every fetch runs under
+    fetch_flight, so it shares the per-interview lease with HR clicks and the
+    webhook poller. `db` should be created with expire_on_commit=False.
+    Returns a count per outcome.
+    """
+    total = len(interviews)
+    summary = {"total": total, UPDATED: 0, NOT_READY: 0, UNRESOLVED: 0, FAILED: 0, INVALID: 0}
+    if not interviews:
+        return summary
+
+    call_ids = await _resolve_call_ids(interviews, search_limit)
+    for interview in interviews:
+        if interview.id in call_ids and not (interview.result and interview.result.vapi_call_id):
+            _link_call(db, interview, call_ids[interview.id])
+    db.commit()
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def reconcile_one(batch: _ResultBatch, interview: Interview) -> str:
+        call_id = call_ids.get(interview.id)
+        if not call_id:
+            return UNRESOLVED
+        try:
+            fetched = await fetch_flight.run(
+                interview.id,
+                lambda: batch.fetch(interview, call_id, semaphore),
+                follow=lambda: _stored_result(interview.id)
+            )
+        except Exception as e:
+            print(f"❌ Fetching interview {interview.id} failed: {e}")
+            return FAILED
+        return fetched["outcome"]
+
+    done = 0
+    for start in range(0, total, batch_size):
+        interviews_batch = interviews[start:start + batch_size]
+        batch = _ResultBatch(db)
+        tasks = [asyncio.ensure_future(reconcile_one(batch, i)) for i in interviews_batch]
+        await batch.run(tasks)
+
+        for interview, task in zip(interviews_batch, tasks):
+            outcome = task.result()
+            summary[outcome] += 1
+            done += 1
+            if progress:
+                progress(done, total, interview, outcome)
+
+    return summary
+
+
+async def reconcile_incomplete_interviews(
+    concurrency: int = 5,
+    batch_size: int = 20,
+    limit: int | None = None,
+    search_limit: int = 100,
+    progress: Callable[[int, int, Interview, str], None] | None = None,
+) -> dict:
+    """Recover missing results for every incomplete interview (see reconcile_interviews)"""
+    # Keep loaded interviews usable across the per-batch commits
+    db = SessionLocal(expire_on_commit=False)
+    try:
+        return await reconcile_interviews(
+            db,
+            find_incomplete_interviews(db, limit=limit),
+            concurrency=concurrency,
+            batch_size=batch_size,
+            search_limit=search_limit,
+            progress=progress
+        )
+    finally:
+        db.close()
+
+
+def _fetch_outcome(outcome: str, interview: Interview | None = None, call_id: str | None = None) -> dict:
+    result = interview.result if interview is not None else None
+    return {
+        "outcome": outcome,
+        "call_id": call_id,
+        "evaluation": result.evaluation if result else None,
+        "evaluation_status": result.evaluation_status if result else None,
+        "evaluation_error": result.evaluation_error if result else None,
+    }
+
+
+async def _fetch_interview_result(interview_id: int, priority: str, search_limit: int) -> dict:
+    db = SessionLocal(expire_on_commit=False)
+    try:
+        interview = db.get(Interview, interview_id)
+        if interview is None:
+            raise LookupError(f"Interview {interview_id} not found")
+
+        call_id = interview.result.vapi_call_id if interview.result else None
+        if not call_id:
+            print(f"🔍 No call_id found in DB. Searching VAPI for UID {interview.unique_id}...")
+            matches = await vapi_service.find_calls_by_interview(
+                interview_unique_id=interview.unique_id,
+                candidate_name=interview.candidate_name,
+                limit=search_limit,
+                priority=priority
+            )
+            if not matches:
+                return _fetch_outcome(UNRESOLVED, interview)
+            call_id = matches[0].get("id")
+            print(f"✨ Found matching call on VAPI: {call_id}")
+            _link_call(db, interview, call_id)
+            db.commit()
+
+        print(f"🔄 Fetching results from VAPI for call {call_id}")
+        call_details = await vapi_service.get_call_details(call_id, priority=priority)
+        if not call_details:
+            return _fetch_outcome(FAILED, interview, call_id)
+        outcome = apply_call_details(db, interview, call_id, call_details)
+        db.commit()
+        recording_downloader.wake()
+        outbox_dispatcher.wake()
+        return _fetch_outcome(outcome, interview, call_id)
+    finally:
+        db.close()
+
+
+async def _stored_result(interview_id: int) -> dict | None:
+    """What another worker just stored, if it got a usable evaluation"""
+    db = SessionLocal()
+    try:
+        result = db.query(InterviewResult).filter(InterviewResult.interview_id == interview_id).first()
+        if result is None or result.evaluation is None or result.evaluation_status == INVALID_EVALUATION:
+            return None
+        return _fetch_outcome(UPDATED, result.interview, result.vapi_call_id)
+    finally:
+        db.close()
+
+
+# One VAPI fetch per interview at a time, across requests, workers and the webhook poller
+fetch_flight = SingleFlight("fetch-results")
+
+
+async def fetch_interview_result(
+    interview_id: int,
+    priority: str = PRIORITY_INTERACTIVE,
+    search_limit: int = 50
+) -> dict:
+    """
+    Fetch one interview's call from VAPI and store the result
+
+    Concurrent calls for the same interview share a single fetch (see
+    SingleFlight). Returns the outcome plus the stored evaluation, its
+    validation status and the call id. Raises LookupError for unknown
+    interviews and CircuitOpenError while VAPI is unavailable.
+    """
+    return await fetch_flight.run(
+        interview_id,
+        lambda: _fetch_interview_result(interview_id, priority, search_limit),
+        follow=lambda: _stored_result(interview_id)
+    )
+
+
+async def reconciliation_loop():
+    """Background task: reconcile incomplete interviews every RECONCILE_INTERVAL_MINUTES"""
+    interval = settings.reconcile_interval_minutes * 60
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            summary = await reconcile_incomplete_interviews(concurrency=settings.reconcile_concurrency)
+            if summary["total"]:
+                print(f"🔁 Reconciliation: {summary}")
+        except Exception as e:
+            print(f"❌ Reconciliation failed: {e}")
@@ -0,0 +1,379 @@
+"""
+Call recordings: background download from VAPI, local storage, served with Range support
+
+End-of-call webhooks and fetched call details carry a recording URL. Storing
+a result queues a CallRecording row (in the same transaction); the downloader
+streams the file to RECORDINGS_DIR in chunks, hashing as it goes, with at
+most RECORDING_DOWNLOAD_CONCURRENCY downloads per worker. A database lease
+per recording keeps two workers from fetching the same file. Failed
+downloads are retried with exponential backoff.
+
+The webhook is unauthenticated, so only https URLs on RECORDING_ALLOWED_HOSTS
+(VAPI's storage) are queued or followed through redirects, and downloads over
+RECORDING_MAX_MB are abandoned.
+
+    RECORDINGS_DIR/2025-03/42-<call id>-<sha256 prefix>.wav
+"""
+import asyncio
+import hashlib
+import mimetypes
+import os
+import re
+import time
+from datetime import datetime, timedelta
+from urllib.parse import urlparse
+
+import httpx
+from sqlalchemy import and_, or_
+from sqlalchemy.orm import Session
+
+from config import get_settings
+from database import SessionLocal
+from models import CallRecording, Interview
+from services.single_flight import SQLLease
+
+settings = get_settings()
+
+PENDING = "pending"
+STORED = "stored"
+FAILED = "failed"
+
+CHUNK_SIZE = 256 * 1024
+# Recordings claimed per scan; more wait for the next one
+SCAN_LIMIT = 50
+
+
+class RecordingRejected(Exception):
+    """A recording we won't download (host not allowed, too large); not retried"""
+
+
+def recording_url_allowed(url: str) -> bool:
+    """https on one of RECORDING_ALLOWED_HOSTS (or a subdomain)"""
+    parsed = urlparse(url)
+    host = (parsed.hostname or "").lower()
+    allowed = [h.strip().lower() for h in settings.recording_allowed_hosts.split(",") if h.strip()]
+    return parsed.scheme == "https" and any(host == h or host.endswith(f".{h}") for h in allowed)
+
+
+def recording_url(data: dict) -> str | None:
+    """
+    The call's recording URL from an end-of-call message or a `GET /call/{id}` response
+
+    Prefers the mono mix (both speakers in one track), which is what reviewers listen to.
+    """
+    for source in (data, data.get("call") or {}):
+        artifact = source.get("artifact") or {}
+        recording = artifact.get("recording") or {}
+        url = (
+            (recording.get("mono") or {}).get("combinedUrl")
+            or artifact.get("recordingUrl")
+            or source.get("recordingUrl")
+            or artifact.get("stereoRecordingUrl")
+            or source.get("stereoRecordingUrl")
+        )
+        if url:
+            if not recording_url_allowed(url):
+                print(f"⚠️  Ignoring recording URL on {urlparse(url).hostname}, not in RECORDING_ALLOWED_HOSTS")
+                return None
+            return url
+    return None
+
+
+def queue_recording(db: Session, interview: Interview, call_id: str | None, url: str | None) -> bool:
+    """
+    Schedule a download of the interview's recording (within the caller's transaction)
+
+    A recording already stored for the same call (or from the same URL) is
+    kept; another call's recording replaces it. Returns True when a download
+    was queued.
+    """
+    if not url or not settings.recordings_enabled:
+        return False
+    recording = db.query(CallRecording).filter(CallRecording.interview_id == interview.id).first()
+    if recording is None:
+        db.add(CallRecording(interview_id=interview.id, vapi_call_id=call_id, source_url=url,
+                             status=PENDING, attempts=0))
+        return True
+    same_call = call_id is not None and recording.vapi_call_id == call_id
+    if (same_call or recording.source_url == url) and recording.status != FAILED:
+        return False
+    recording.vapi_call_id = call_id
+    recording.source_url = url
+    recording.status = PENDING
+    recording.attempts = 0
+    recording.error = None
+    return True
+
+
+async def _check_request(request: httpx.Request):
+    if not recording_url_allowed(str(request.url)):
+        raise RecordingRejected(f"{request.url.host} is not in RECORDING_ALLOWED_HOSTS")
+
+
+def recording_file(recording: CallRecording) -> str:
+    return os.path.join(settings.recordings_dir, recording.path)
+
+
+def _extension(url: str, content_type: str | None) -> str:
+    ext = os.path.splitext(urlparse(url).path)[1].lower()
+    if re.fullmatch(r"\.[a-z0-9]{2,5}", ext):
+        return ext
+    return mimetypes.guess_extension(content_type or "") or ".bin"
+
+
+class RecordingDownloader:
+    """
+    Per-worker background downloader
+
+    `wake()` after committing queued recordings starts a scan right away;
+    otherwise pending and retryable recordings are picked up every
+    RECORDING_RETRY_MINUTES.
+    """
+
+    def __init__(self, session_factory=SessionLocal, lease=None):
+        self.session_factory = session_factory
+        self.lease = lease or SQLLease(lease_seconds=600)
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task | None = None
+        self._http: httpx.AsyncClient | None = None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        # Recording URLs point at VAPI's file storage, not the API: no credentials are sent
+        if self._http is None:
+            self._http = httpx.AsyncClient(
+                timeout=httpx.Timeout(60.0, connect=10.0),
+                follow_redirects=True,
+                limits=httpx.Limits(max_connections=settings.recording_download_concurrency),
+                event_hooks={"request": [_check_request]},  # Also runs for every redirect
+            )
+        return self._http
+
+    def start(self):
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    def wake(self):
+        self._wakeup.set()
+
+    async def aclose(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+
+    async def _run(self):
+        interval = settings.recording_retry_minutes * 60
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            try:
+                await self.run_once()
+            except Exception as e:
+                print(f"❌ Recording downloads failed: {e}")
+
+    def _due(self) -> list[int]:
+        """Ids of recordings waiting for a (re)try"""
+        now = datetime.utcnow()
+        retry_after = timedelta(minutes=settings.recording_retry_minutes)
+        db = self.session_factory()
+        try:
+            rows = (
+                db.query(CallRecording)
+                .filter(or_(
+                    CallRecording.status == PENDING,
+                    and_(CallRecording.status == FAILED,
+                         CallRecording.attempts < settings.recording_max_attempts),
+                ))
+                .order_by(CallRecording.id)
+                .limit(SCAN_LIMIT * 4)
+                .all()
+            )
+            return [
+                row.id for row in rows
+                if row.status == PENDING or now - row.attempted_at >= retry_after * 2 ** (row.attempts - 1)
+            ][:SCAN_LIMIT]
+        finally:
+            db.close()
+
+    async def run_once(self) -> dict:
+        """Download every recording that's due; returns counts by outcome"""
+        ids = await asyncio.to_thread(self._due)
+        semaphore = asyncio.Semaphore(settings.recording_download_concurrency)
+        outcomes = {STORED: 0, FAILED: 0, "skipped": 0}
+
+        async def one(recording_id: int):
+            async with semaphore:
+                outcomes[await self.download(recording_id)] += 1
+
+        await asyncio.gather(*(one(recording_id) for recording_id in ids))
+        return outcomes
+
+    async def download(self, recording_id: int) -> str:
+        """Fetch one recording under its lease; returns stored, failed or skipped"""
+        key = f"recording:{recording_id}"
+        if not await asyncio.to_thread(self.lease.acquire, key):
+            return "skipped"  # Another worker has it
+        try:
+            db = self.session_factory()
+            try:
+                recording = db.get(CallRecording, recording_id)
+                if recording is None or recording.status == STORED:
+                    return "skipped"
+                url, interview_id, call_id = recording.source_url, recording.interview_id, recording.vapi_call_id
+            finally:
+                db.close()
+
+            started = time.perf_counter()
+            try:
+                stored = await self._fetch(url, interview_id, call_id or str(recording_id))
+            except (httpx.HTTPError, OSError, RecordingRejected) as e:
+                print(f"❌ Recording for interview {interview_id} failed: {e}")
+                await asyncio.to_thread(self._mark, recording_id, url, status=FAILED, error=str(e)[:1000],
+                                        final=isinstance(e, RecordingRejected))
+                return FAILED
+
+            if not await asyncio.to_thread(self._mark, recording_id, url, status=STORED, **stored):
+                # The URL changed while downloading; the new one gets its own download
+                os.remove(os.path.join(settings.recordings_dir, stored["path"]))
+                return "skipped"
+            print(f"🎧 Recording for interview {interview_id} stored "
+                  f"({stored['size_bytes'] / 1e6:.1f} MB in {time.perf_counter() - started:.1f}s)")
+            return STORED
+        finally:
+            await asyncio.to_thread(self.lease.release, key)
+
+    async def _fetch(self, url: str, interview_id: int, name: str) -> dict:
+        """Stream the file to disk in chunks, hashing as it arrives"""
+        digest = hashlib.sha256()
+        size = 0
+        max_bytes = settings.recording_max_mb * 1024 * 1024
+        os.makedirs(settings.recordings_dir, exist_ok=True)
+        tmp_path = os.path.join(settings.recordings_dir, f".{interview_id}-{os.getpid()}-{id(digest):x}.partial")
+        try:
+            async with self.client.stream("GET", url) as response:
+                response.raise_for_status()
+                if int(response.headers.get("content-length") or 0) > max_bytes:
+                    raise RecordingRejected(f"recording is over RECORDING_MAX_MB ({settings.recording_max_mb})")
+                content_type = response.headers.get("content-type", "").split(";")[0].strip() or None
+                with open(tmp_path, "wb") as out:
+                    async for chunk in response.aiter_bytes(CHUNK_SIZE):
+                        digest.update(chunk)
+                        size += len(chunk)
+                        if size > max_bytes:
+                            raise RecordingRejected(f"recording is over RECORDING_MAX_MB ({settings.recording_max_mb})")
+                        await asyncio.to_thread(out.write, chunk)
+                    await asyncio.to_thread(os.fsync, out.fileno())
+            # Named by content, so a re-downloaded recording never overwrites the one being served
+            sha256 = digest.hexdigest()
+            relative_path = os.path.join(
+                f"{datetime.utcnow():%Y-%m}",
+                f"{interview_id}-{re.sub(r'[^A-Za-z0-9_-]', '_', name)}-{sha256[:12]}{_extension(url, content_type)}",
+            )
+            path = os.path.join(settings.recordings_dir, relative_path)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            os.replace(tmp_path, path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+        return {
+            "path": relative_path,
+            "content_type": content_type or mimetypes.guess_type(path)[0],
+            "size_bytes": size,
+            "sha256": sha256,
+        }
+
+    def _mark(self, recording_id: int, url: str, status: str, error: str | None = None,
+              final: bool = False, **stored) -> bool:
+        """
+        Record a download outcome, unless the recording was re-queued with another URL meanwhile
+
+        `final` failures use up the remaining attempts, so they aren't retried.
+        """
+        db = self.session_factory()
+        try:
+            recording = db.get(CallRecording, recording_id)
+            if recording is None or recording.source_url != url:
+                return False
+            old_path = recording.path
+            recording.status = status
+            recording.error = error
+            recording.attempts += 1
+            if final:
+                recording.attempts = max(recording.attempts, settings.recording_max_attempts)
+            recording.attempted_at = datetime.utcnow()
+            for field, value in stored.items():
+                setattr(recording, field, value)
+            if status == STORED:
+                recording.stored_at = recording.attempted_at
+            db.commit()
+        finally:
+            db.close()
+        if stored and old_path and old_path != stored["path"]:
+            try:
+                os.remove(os.path.join(settings.recordings_dir, old_path))
+            except FileNotFoundError:
+                pass
+        return True
+
+
+def backfill_recordings(session_factory=SessionLocal, batch_size: int = 200) -> int:
+    """Queue recordings for completed interviews whose stored webhook payload has one"""
+    from models import InterviewResult
+
+    db = session_factory()
+    try:
+        queued = 0
+        last_id = 0
+        while True:
+            batch = (
+                db.query(InterviewResult)
+                .filter(InterviewResult.id > last_id, InterviewResult.raw_webhook_data.isnot(None))
+                .order_by(InterviewResult.id)
+                .limit(batch_size)
+                .all()
+            )
+            if not batch:
+                return queued
+            for result in batch:
+                url = recording_url(result.raw_webhook_data or {})
+                queued += queue_recording(db, result.interview, result.vapi_call_id, url)
+            last_id = batch[-1].id
+            db.commit()
+            db.expunge_all()
+    finally:
+        db.close()
+
+
+def delete_recording(db: Session, interview_id: int) -> str | None:
+    """
+    Drop an interview's recording row (within the caller's transaction)
+
+    Returns the stored file's path, for the caller to remove with
+    remove_recording_file() once the transaction has committed.
+    """
+    recording = db.query(CallRecording).filter(CallRecording.interview_id == interview_id).first()
+    if recording is None:
+        return None
+    db.delete(recording)
+    return recording_file(recording) if recording.path else None
+
+
+def remove_recording_file(path: str | None):
+    if path:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+
+recording_downloader = RecordingDownloader()
@@ -0,0 +1,224 @@
+from datetime import date, datetime, time as dt_time
+
+import numpy as np
+from sqlalchemy import func, insert
+from sqlalchemy.orm import Session
+
+from models import Interview, InterviewResult, CohortRanking, CohortRankingEntry
+
+NORMALIZATIONS = ("zscore", "percentile", "none")
+BATCHES = ("none", "week", "month")
+
+# The VAPI-assigned total is kept for comparison and tie-breaking, never re-weighted
+ORIGINAL_SCORE = "overall_score"
+
+
+def _is_number(value) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def load_cohort(
+    db: Session,
+    role: str,
+    start_date: date | None = None,
+    end_date: date | None = None
+) -> list[tuple]:
+    """(interview id, completed_at, evaluation) for every evaluated interview of a role"""
+    query = (
+        db.query(Interview.id, InterviewResult.completed_at, InterviewResult.evaluation)
+        .join(InterviewResult, InterviewResult.interview_id == Interview.id)
+        .filter(Interview.role == role, Interview.status == "completed", InterviewResult.evaluation.isnot(None))
+    )
+    if start_date:
+        query = query.filter(InterviewResult.completed_at >= datetime.combine(start_date, dt_time.min))
+    if end_date:
+        query = query.filter(InterviewResult.completed_at <= datetime.combine(end_date, dt_time.max))
+    return [row for row in query.order_by(Interview.id) if isinstance(row[2], dict)]
+
+
+def sub_scores(evaluations: list[dict]) -> list[str]:
+    """Numeric evaluation fields (the rubric dimensions), excluding the original total"""
+    names = set()
+    for evaluation in evaluations:
+        names.update(k for k, v in evaluation.items() if _is_number(v))
+    names.discard(ORIGINAL_SCORE)
+    return sorted(names)
+
+
+def _batch_keys(completed_at: list, batch_by: str) -> np.ndarray:
+    """Group index per candidate; normalization statistics are computed per group"""
+    if batch_by == "week":
+        keys = [d.isocalendar()[0] * 100 + d.isocalendar()[1] if d else -1 for d in completed_at]
+    elif batch_by == "month":
+        keys = [d.year * 100 + d.month if d else -1 for d in completed_at]
+    else:
+        keys = [0] * len(completed_at)
+    return np.unique(np.asarray(keys, dtype=np.int64), return_inverse=True)[1].reshape(-1)
+
+
+def _group_means(values: np.ndarray, groups: np.ndarray, n_groups: int) -> tuple[np.ndarray, np.ndarray]:
+    """Per-group column means ignoring NaN, plus per-group counts of present values"""
+    present = ~np.isnan(values)
+    sums = np.zeros((n_groups, values.shape[1]))
+    counts = np.zeros((n_groups, values.shape[1]))
+    np.add.at(sums, groups, np.where(present, values, 0.0))
+    np.add.at(counts, groups, present)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        means = sums / counts
+    return means, counts
+
+
+def _percentile_ranks(values: np.ndarray, groups: np.ndarray) -> np.ndarray:
+    """
+    Percentile rank (0-100) of each value within its group, ties share the mid rank
+
+    One lexsort orders every (group, value) pair; runs of equal pairs give the
+    tie counts and each group's first position gives the "strictly below" count.
+    """
+    order = np.lexsort((values, groups))
+    sorted_groups, sorted_values = groups[order], values[order]
+    _, pair_start, pair_inverse, pair_counts = np.unique(
+        np.stack([sorted_groups, sorted_values], axis=1), axis=0,
+        return_index=True, return_inverse=True, return_counts=True
+    )
+    pair_inverse = pair_inverse.reshape(-1)
+    group_sizes = np.bincount(sorted_groups)
+    group_start = np.concatenate([[0], np.cumsum(group_sizes)[:-1]])
+    below = pair_start[pair_inverse] - group_start[sorted_groups]
+    ranks = np.empty(len(values))
+    ranks[order] = (below + 0.5 * pair_counts[pair_inverse]) / group_sizes[sorted_groups] * 100
+    return ranks
+
+
+def rescore(
+    evaluations: list[dict],
+    completed_at: list,
+    interview_ids: list[int],
+    weights: dict[str, float],
+    normalization: str = "zscore",
+    batch_by: str = "none"
+) -> dict[str, np.ndarray]:
+    """
+    Weighted, normalized composite scores and ranks for a cohort
+
+    Missing sub-scores are imputed with their batch mean, so they neither help
+    nor hurt. Ties on the composite are broken by the original overall_score,
+    then the earlier completion, then the lower interview id.
+    Returns arrays aligned with the inputs: score, percentile, rank, original_score.
+    """
+    names = list(weights)
+    n = len(evaluations)
+    matrix = np.array(
+        [[e.get(name) if _is_number(e.get(name)) else np.nan for name in names] for e in evaluations],
+        dtype=float
+    ).reshape(n, len(names))
+    original = np.array(
+        [e.get(ORIGINAL_SCORE) if _is_number(e.get(ORIGINAL_SCORE)) else np.nan for e in evaluations],
+        dtype=float
+    )
+    weight_vector = np.array([weights[name] for name in names], dtype=float)
+
+    groups = _batch_keys(completed_at, batch_by)
+    n_groups = int(groups.max()) + 1 if n else 0
+    means, counts = _group_means(matrix, groups, n_groups)
+    # A dimension nobody in the batch has gets a neutral 0 after normalization
+    means = np.nan_to_num(means)
+    filled = np.where(np.isnan(matrix), means[groups], matrix)
+
+    if normalization == "zscore":
+        squares = np.zeros((n_groups, len(names)))
+        np.add.at(squares, groups, (filled - means[groups]) ** 2)
+        std = np.sqrt(squares / np.maximum(counts, 1))
+        with np.errstate(invalid="ignore", divide="ignore"):
+            normalized = np.where(std[groups] > 0, (filled - means[groups]) / std[groups], 0.0)
+    elif normalization == "percentile":
+        normalized = np.column_stack([_percentile_ranks(filled[:, j], groups) for j in range(len(names))]) \
+            if names else np.zeros((n, 0))
+    else:
+        normalized = filled
+
+    total_weight = np.abs(weight_vector).sum() or 1.0
+    score = normalized @ weight_vector / total_weight
+
+    completed_ts = np.array([d.timestamp() if d else np.inf for d in completed_at], dtype=float)
+    # lexsort: last key is primary
+    order = np.lexsort((
+        np.asarray(interview_ids),
+        completed_ts,
+        -np.nan_to_num(original, nan=-np.inf),
+        -score,
+    ))
+    rank = np.empty(n, dtype=np.int64)
+    rank[order] = np.arange(1, n + 1)
+
+    return {
+        "score": score,
+        "percentile": _percentile_ranks(score, np.zeros(n, dtype=np.int64)) if n else score,
+        "rank": rank,
+        "original_score": original,
+    }
+
+
+def create_ranking(
+    db: Session,
+    role: str,
+    weights: dict[str, float] | None = None,
+    normalization: str = "zscore",
+    batch_by: str = "none",
+    start_date: date | None = None,
+    end_date: date | None = None
+) -> CohortRanking:
+    """
+    Rescore a role's cohort and store it as the role's next ranking version
+
+    Without `weights` every sub-score counts equally. Raises ValueError for an
+    unknown normalization/batching, an empty cohort or a weight on a
+    sub-score the cohort lacks.
+    """
+    if normalization not in NORMALIZATIONS:
+        raise ValueError(f"normalization must be one of {', '.join(NORMALIZATIONS)}")
+    if batch_by not in BATCHES:
+        raise ValueError(f"batch_by must be one of {', '.join(BATCHES)}")
+
+    rows = load_cohort(db, role, start_date, end_date)
+    if not rows:
+        raise ValueError(f"No evaluated interviews for {role}")
+    interview_ids = [r[0] for r in rows]
+    completed_at = [r[1] for r in rows]
+    evaluations = [r[2] for r in rows]
+
+    available = sub_scores(evaluations)
+    if weights is None:
+        weights = {name: 1.0 for name in available}
+    unknown = sorted(set(weights) - set(available))
+    if unknown:
+        raise ValueError(f"Unknown sub-scores for {role}: {', '.join(unknown)} (available: {', '.join(available)})")
+
+    scores = rescore(evaluations, completed_at, interview_ids, weights, normalization, batch_by)
+
+    latest = db.query(func.max(CohortRanking.version)).filter(CohortRanking.role == role).scalar()
+    ranking = CohortRanking(
+        role=role,
+        version=(latest or 0) + 1,
+        weights=weights,
+        normalization=normalization,
+        batch_by=batch_by,
+        candidate_count=len(rows)
+    )
+    db.add(ranking)
+    db.flush()
+
+    db.execute(insert(CohortRankingEntry.__table__), [
+        {
+            "ranking_id": ranking.id,
+            "interview_id": interview_id,
+            "rank": int(rank),
+            "score": round(float(score), 6),
+            "percentile": round(float(percentile), 3),
+            "original_score": None if np.isnan(original) else float(original),
+        }
+        for interview_id, rank, score, percentile, original in zip(
+            interview_ids, scores["rank"], scores["score"], scores["percentile"], scores["original_score"]
+        )
+    ])
+    return ranking
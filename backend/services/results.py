@@ -0,0 +1,104 @@
+from datetime import datetime
+from sqlalchemy.orm import Session
+
+from models import Interview, InterviewResult
+from services.search_index import index_interview
+from services.duplicate_index import index_transcript
+from services.evaluation_schema import apply_evaluation_checks, EVALUATION_OUTPUT_NAMES
+from services.archive import rehydrate
+from services.outbox import notify_interview_completed
+
+
+def extract_evaluation(structured_outputs: dict) -> tuple[str | None, dict | None]:
+    """Return (output name, result) of the first evaluation structured output"""
+    for output_id, output_data in (structured_outputs or {}).items():
+        name = output_data.get("name")
+        if name in EVALUATION_OUTPUT_NAMES:
+            return name, output_data.get("result")
+    return None, None
+
+
+def build_transcript(messages: list) -> str:
+    """Flatten VAPI messages into 'ROLE: text' paragraphs"""
+    transcript_parts = []
+    for msg in messages or []:
+        role = msg.get("role", "unknown")
+        content = msg.get("message") or msg.get("content", "")
+        if content:
+            transcript_parts.append(f"{role.upper()}: {content}")
+    return "\n\n".join(transcript_parts)
+
+
+def parse_call_details(call_details: dict) -> dict:
+    """
+    Extract transcript, summary and evaluation from a VAPI `GET /call/{id}` response
+    """
+    artifact = call_details.get("artifact", {}) or {}
+    analysis = call_details.get("analysis", {}) or {}
+    summary = analysis.get("summary", "")
+
+    evaluation_name, evaluation_data = extract_evaluation(artifact.get("structuredOutputs", {}))
+    if isinstance(evaluation_data, dict) and evaluation_data.get("summary"):
+        # If evaluation has its own summary, use it
+        summary = evaluation_data.get("summary")
+
+    if not evaluation_data:
+        # Fallback to analysis structured data
+        evaluation_data = analysis.get("structuredData") or analysis.get("evaluation")
+
+    # Messages are usually in the artifact, older calls have them at the root
+    messages = artifact.get("messages", []) or call_details.get("messages", [])
+
+    return {
+        "transcript": build_transcript(messages),
+        "summary": summary,
+        "evaluation": evaluation_data,
+        "evaluation_name": evaluation_name,
+        "call_duration": call_details.get("duration", 0),
+    }
+
+
+def save_interview_result(db: Session, interview: Interview, **fields) -> InterviewResult:
+    """
+    Create or update the interview's result and mark the interview completed
+
+    Only the given result fields are written. Pass `evaluation_schema` (the
+    structured output name) with an evaluation so it's validated against its
+    schema. Does not commit: the caller owns the transaction (reconciliation
+    writes a batch of interviews in one, holding each interview's fetch
+    lease until it commits). The first completion also queues HR
+    notifications (outbox).
+    """
+    result = interview.result
+
+    if result is not None and result.archived_at is not None:
+        rehydrate(db, result)  # Writes go to the full row, never to the stub
+
+    if not result:
+        result = InterviewResult(
+            interview=interview,
+            transcript="",
+            summary="",
+            evaluation=None,
+            call_duration=0
+        )
+        db.add(result)
+
+    for field, value in fields.items():
+        setattr(result, field, value)
+    if "evaluation" in fields:
+        apply_evaluation_checks(result)
+
+    # Update interview status
+    newly_completed = interview.status != "completed"
+    interview.status = "completed"
+    interview.updated_at = datetime.utcnow()
+    if newly_completed:
+        # Same transaction as the result: HR is notified exactly when the completion commits
+        notify_interview_completed(db, interview, result)
+
+    index_interview(db, interview, result)
+    if "transcript" in fields:
+        index_transcript(db, interview.id, result.transcript)
+
+    return result
@@ -0,0 +1,323 @@
+import html
+import sqlite3
+from sqlalchemy import text
+from sqlalchemy.orm import Session, contains_eager, selectinload
+
+from database import engine, SessionLocal
+from models import Interview, InterviewResult
+from services.archive import result_texts
+
+# Snippet markers, swapped for <mark> after the surrounding text is HTML-escaped
+_MARK_START = "\x02"
+_MARK_END = "\x03"
+
+
+def _is_postgres(bind) -> bool:
+    return bind.dialect.name == "postgresql"
+
+
+# SQLite 3.43+ can delete from contentless FTS5 tables; older versions leave replaced documents behind
+CONTENTLESS_DELETE = sqlite3.sqlite_version_info >= (3, 43, 0)
+
+FTS5_COLUMNS = "candidate_name, role, transcript, summary, evaluation"
+FTS5_TOKENIZER = "tokenize = 'porter unicode61'"
+
+
+def init_search_index(bind=engine) -> bool:
+    """
+    Create the full-text index if it doesn't exist yet
+
+    Only the index is stored, never a second copy of the text: SQLite uses a
+    contentless FTS5 table plus a small table mapping each interview to its
+    current document; Postgres a table of weighted tsvectors with a GIN index.
+    Snippets are built from the result's own texts at query time.
+    Returns True when the index was just (re)created and needs a backfill.
+    """
+    with bind.begin() as conn:
+        if _is_postgres(bind):
+            exists = conn.execute(text("SELECT to_regclass('interview_search')")).scalar()
+            if exists:
+                columns = {row[0] for row in conn.execute(text(
+                    "SELECT column_name FROM information_schema.columns WHERE table_name = 'interview_search'"
+                ))}
+                if "transcript" in columns:
+                    # Indexes created before the texts were dropped; the tsvectors stay valid
+                    conn.execute(text(
+                        "ALTER TABLE interview_search DROP COLUMN candidate_name, DROP COLUMN role, "
+                        "DROP COLUMN transcript, DROP COLUMN summary, DROP COLUMN evaluation"
+                    ))
+                    print("🔎 Dropped the text copies from interview_search")
+                return False
+            conn.execute(text("""
+                CREATE TABLE interview_search (
+                    interview_id INTEGER PRIMARY KEY REFERENCES interviews(id) ON DELETE CASCADE,
+                    document TSVECTOR
+                )
+            """))
+            conn.execute(text(
+                "CREATE INDEX ix_interview_search_document ON interview_search USING GIN (document)"
+            ))
+        else:
+            existing = conn.execute(text(
+                "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'interview_search'"
+            )).scalar()
+            if existing is not None:
+                if "content=''" in existing.replace(" ", ""):
+                    return _needs_compaction(conn)
+                # Index created with its own copy of the texts: replace it
+                conn.execute(text("DROP TABLE interview_search"))
+                print("🔎 Replacing the search index with a contentless one (VACUUM reclaims the space)")
+            options = "content = '', contentless_delete = 1" if CONTENTLESS_DELETE else "content = ''"
+            conn.execute(text(
+                f"CREATE VIRTUAL TABLE interview_search USING fts5({FTS5_COLUMNS}, {options}, {FTS5_TOKENIZER})"
+            ))
+            conn.execute(text("DROP TABLE IF EXISTS interview_search_docs"))
+            conn.execute(text("""
+                CREATE TABLE interview_search_docs (
+                    interview_id INTEGER PRIMARY KEY REFERENCES interviews(id),
+                    doc_id INTEGER NOT NULL UNIQUE
+                )
+            """))
+    return True
+
+
+def _needs_compaction(conn) -> bool:
+    """Without contentless_delete, rebuild once replaced documents outnumber live ones"""
+    if CONTENTLESS_DELETE:
+        return False
+    documents = conn.execute(text("SELECT count(*) FROM interview_search_docsize")).scalar()
+    live = conn.execute(text("SELECT count(*) FROM interview_search_docs")).scalar()
+    return documents > 2 * live + 100
+
+
+def _evaluation_text(value) -> str:
+    """Flatten the free-text parts of an evaluation (strengths, notes, ...)"""
+    if isinstance(value, dict):
+        return "\n".join(filter(None, (_evaluation_text(v) for v in value.values())))
+    if isinstance(value, list):
+        return "\n".join(filter(None, (_evaluation_text(v) for v in value)))
+    if isinstance(value, str):
+        return value
+    return ""
+
+
+def _document(interview: Interview, result: InterviewResult | None) -> dict:
+    """The searchable text of an interview"""
+    transcript, summary = result_texts(result) if result else (None, None)  # Archived: from Parquet
+    return {
+        "interview_id": interview.id,
+        "candidate_name": interview.candidate_name,
+        "role": interview.role,
+        "transcript": transcript or "",
+        "summary": summary or "",
+        "evaluation": _evaluation_text(result.evaluation) if result else "",
+    }
+
+
+def index_interview(db: Session, interview: Interview, result: InterviewResult | None = None):
+    """Insert or refresh an interview's search document (within the caller's transaction)"""
+    params = _document(interview, result or interview.result)
+
+    if _is_postgres(db.get_bind()):
+        db.execute(text("""
+            INSERT INTO interview_search (interview_id, document)
+            VALUES (:interview_id,
+                setweight(to_tsvector('english', :candidate_name), 'A') ||
+                setweight(to_tsvector('english', :summary || ' ' || :evaluation), 'B') ||
+                setweight(to_tsvector('english', :transcript), 'C'))
+            ON CONFLICT (interview_id) DO UPDATE SET document = EXCLUDED.document
+        """), params)
+    else:
+        _remove_document(db, interview.id)
+        doc_id = db.execute(text(f"""
+            INSERT INTO interview_search ({FTS5_COLUMNS})
+            VALUES (:candidate_name, :role, :transcript, :summary, :evaluation)
+        """), params).lastrowid
+        db.execute(text("INSERT INTO interview_search_docs (interview_id, doc_id) VALUES (:interview_id, :doc_id)"),
+                   {"interview_id": interview.id, "doc_id": doc_id})
+
+
+def _remove_document(db: Session, interview_id: int):
+    """Unlink an interview's FTS5 document (and delete it, where SQLite supports that)"""
+    if CONTENTLESS_DELETE:
+        db.execute(text(
+            "DELETE FROM interview_search WHERE rowid = "
+            "(SELECT doc_id FROM interview_search_docs WHERE interview_id = :interview_id)"
+        ), {"interview_id": interview_id})
+    db.execute(text("DELETE FROM interview_search_docs WHERE interview_id = :interview_id"),
+               {"interview_id": interview_id})
+
+
+def remove_from_index(db: Session, interview_id: int):
+    """Drop an interview's search document (within the caller's transaction)"""
+    if _is_postgres(db.get_bind()):
+        db.execute(text("DELETE FROM interview_search WHERE interview_id = :interview_id"),
+                   {"interview_id": interview_id})
+    else:
+        _remove_document(db, interview_id)
+
+
+def rebuild_search_index(batch_size: int = 200, session_factory=SessionLocal) -> int:
+    """Re-index every interview that has a result from scratch, committing per batch"""
+    db = session_factory()
+    try:
+        if _is_postgres(db.get_bind()):
+            db.execute(text("DELETE FROM interview_search"))
+        else:
+            db.execute(text("INSERT INTO interview_search (interview_search) VALUES ('delete-all')"))
+            db.execute(text("DELETE FROM interview_search_docs"))
+        db.commit()
+        indexed = 0
+        last_id = 0
+        while True:
+            batch = (
+                db.query(Interview)
+                .join(InterviewResult)
+                .options(contains_eager(Interview.result).undefer_group("texts"))
+                .filter(Interview.id > last_id)
+                .order_by(Interview.id)
+                .limit(batch_size)
+                .all()
+            )
+            if not batch:
+                return indexed
+            for interview in batch:
+                index_interview(db, interview)
+            last_id = batch[-1].id
+            db.commit()
+            db.expunge_all()
+            indexed += len(batch)
+    finally:
+        db.close()
+
+
+def _fts5_query(query: str) -> str:
+    """Quote each term so user input can't break FTS5 syntax; keep trailing * as prefix search"""
+    terms = []
+    for word in query.split():
+        prefix = word.endswith("*")
+        word = word.rstrip("*").replace('"', '""')
+        if word:
+            terms.append(f'"{word}"' + ("*" if prefix else ""))
+    return " ".join(terms)
+
+
+def _highlight(snippet: str | None) -> str:
+    escaped = html.escape(snippet or "")
+    return escaped.replace(_MARK_START, "<mark>").replace(_MARK_END, "</mark>")
+
+
+def search_interviews(
+    db: Session,
+    query: str,
+    role: str | None = None,
+    limit: int = 20,
+    offset: int = 0
+) -> tuple[int, list[dict]]:
+    """
+    Ranked full-text search over candidate names, transcripts, summaries and evaluations
+
+    Returns (total matches, page of hits with an HTML-safe highlighted snippet).
+    """
+    params = {"role": role, "limit": limit, "offset": offset}
+    role_filter = "AND i.role = :role" if role else ""
+
+    if _is_postgres(db.get_bind()):
+        params["q"] = query
+        match = """
+            FROM interview_search s
+            JOIN interviews i ON i.id = s.interview_id,
+            websearch_to_tsquery('english', :q) q
+            WHERE s.document @@ q {role_filter}
+        """.format(role_filter=role_filter)
+        total = db.execute(text(f"SELECT count(*) {match}"), params).scalar()
+        rows = db.execute(text(f"""
+            SELECT s.interview_id, ts_rank_cd(s.document, q) AS score
+            {match}
+            ORDER BY score DESC, s.interview_id DESC
+            LIMIT :limit OFFSET :offset
+        """), params).all()
+    else:
+        params["q"] = _fts5_query(query)
+        if not params["q"]:
+            return 0, []
+        match = """
+            FROM interview_search s
+            JOIN interview_search_docs d ON d.doc_id = s.rowid
+            JOIN interviews i ON i.id = d.interview_id
+            WHERE interview_search MATCH :q {role_filter}
+        """.format(role_filter=role_filter)
+        total = db.execute(text(f"SELECT count(*) {match}"), params).scalar()
+        # bm25 column weights: name, role, transcript, summary, evaluation (lower rank = better)
+        rows = db.execute(text(f"""
+            SELECT d.interview_id, -bm25(interview_search, 10.0, 2.0, 1.0, 4.0, 3.0) AS score
+            {match}
+            ORDER BY score DESC, d.interview_id DESC
+            LIMIT :limit OFFSET :offset
+        """), params).all()
+
+    interviews = {
+        i.id: i for i in (
+            db.query(Interview)
+            .options(selectinload(Interview.result).undefer_group("texts"))
+            .filter(Interview.id.in_([r.interview_id for r in rows]))
+        )
+    }
+    # Snippets only for the returned page, from the results' own texts
+    snippets = _snippets(db, params["q"], [_document(i, i.result) for i in interviews.values()])
+    hits = []
+    for row in rows:
+        interview = interviews.get(row.interview_id)
+        if not interview:
+            continue
+        hits.append({
+            "id": interview.id,
+            "candidate_name": interview.candidate_name,
+            "role": interview.role,
+            "status": interview.status,
+            "created_at": interview.created_at,
+            "rank": round(float(row.score), 6),
+            "snippet": _highlight(snippets.get(interview.id)),
+        })
+    return total, hits
+
+
+def _snippets(db: Session, query: str, documents: list[dict]) -> dict[int, str]:
+    """
+    Highlighted snippets for a page of documents (the index holds no text to cut them from)
+
+    SQLite indexes the page into a per-connection temp FTS5 table with the same
+    tokenizer and takes snippet() from there; Postgres runs ts_headline.
+    """
+    if not documents:
+        return {}
+    marks = {"mark_start": _MARK_START, "mark_end": _MARK_END, "q": query}
+    if _is_postgres(db.get_bind()):
+        rows = db.execute(text("""
+            SELECT t.interview_id, ts_headline('english', t.body, websearch_to_tsquery('english', :q),
+                'StartSel=' || :mark_start || ', StopSel=' || :mark_end || ', MaxFragments=2, MaxWords=25'
+            ) AS snippet
+            FROM unnest(CAST(:ids AS integer[]), CAST(:bodies AS text[])) AS t(interview_id, body)
+        """), {
+            **marks,
+            "ids": [d["interview_id"] for d in documents],
+            "bodies": [" … ".join(filter(None, (d["summary"], d["transcript"]))) for d in documents],
+        }).all()
+        return {row.interview_id: row.snippet for row in rows}
+
+    db.execute(text(
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS temp.interview_search_page USING fts5({FTS5_COLUMNS}, {FTS5_TOKENIZER})"
+    ))
+    try:
+        db.execute(text(f"""
+            INSERT INTO temp.interview_search_page (rowid, {FTS5_COLUMNS})
+            VALUES (:interview_id, :candidate_name, :role, :transcript, :summary, :evaluation)
+        """), documents)
+        rows = db.execute(text("""
+            SELECT rowid AS interview_id, snippet(interview_search_page, -1, :mark_start, :mark_end, '…', 24) AS snippet
+            FROM temp.interview_search_page
+            WHERE interview_search_page MATCH :q
+        """), marks).all()
+    finally:
+        db.execute(text("DELETE FROM temp.interview_search_page"))
+    return {row.interview_id: row.snippet for row in rows}
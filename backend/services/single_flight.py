@@ -0,0 +1,148 @@
+import asyncio
+import os
+import socket
+import time
+import uuid
+from typing import Awaitable, Callable, TypeVar
+
+from sqlalchemy import delete, insert, update
+from sqlalchemy.exc import IntegrityError, OperationalError
+
+from database import engine
+from models import WorkLease
+
+T = TypeVar("T")
+
+
+def _is_lock_error(error: OperationalError) -> bool:
+    return "locked" in str(error.orig).lower()
+
+
+class SQLLease:
+    """Expiring mutual-exclusion leases in the shared application database"""
+
+    def __init__(self, lease_seconds: float, target_engine=engine):
+        self.lease_seconds = lease_seconds
+        self.engine = target_engine
+        self.table = WorkLease.__table__
+        self.owner = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+    def acquire(self, key: str) -> bool:
+        table = self.table
+        now = time.time()
+        try:
+            with self.engine.begin() as conn:
+                conn.execute(insert(table).values(key=key, owner=self.owner, expires_at=now + self.lease_seconds))
+            return True
+        except IntegrityError:
+            pass
+        except OperationalError as e:
+            if not _is_lock_error(e):
+                raise
+            return False  # Try again on the next poll
+        # Take over the lease only if its holder let it expire (crashed worker)
+        try:
+            with self.engine.begin() as conn:
+                return conn.execute(
+                    update(table)
+                    .where(table.c.key == key, table.c.expires_at < now)
+                    .values(owner=self.owner, expires_at=now + self.lease_seconds)
+                ).rowcount == 1
+        except OperationalError as e:
+            if not _is_lock_error(e):
+                raise
+            return False
+
+    def renew(self, key: str) -> bool:
+        """Push back the expiry of a lease we still hold; False if it was lost"""
+        table = self.table
+        with self.engine.begin() as conn:
+            return conn.execute(
+                update(table)
+                .where(table.c.key == key, table.c.owner == self.owner)
+                .values(expires_at=time.time() + self.lease_seconds)
+            ).rowcount == 1
+
+    def release(self, key: str):
+        table = self.table
+        with self.engine.begin() as conn:
+            conn.execute(delete(table).where(table.c.key == key, table.c.owner == self.owner))
+
+
+async def keep_lease(lease: SQLLease, key: str, label: str):
+    """Renew a held lease every third of its length until cancelled; returns if it was lost"""
+    interval = lease.lease_seconds / 3
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            renewed = await asyncio.to_thread(lease.renew, key)
+        except OperationalError as e:
+            if not _is_lock_error(e):
+                raise
+            continue  # Try again next time, well before it expires
+        if not renewed:
+            print(f"⚠️ {label} lost its lease on {key}")
+            return
+
+
+class SingleFlight:
+    """
+    Coalesce concurrent runs of the same job
+
+    Within a process, callers asking for a key that is already running await
+    the same task and share its result (or exception). Across workers, the
+    job runs under a database lease: a worker that finds the lease taken
+    waits for it, then calls `follow()` to pick up what the other worker
+    stored, and only runs the job itself when that returns None. The lease
+    is renewed while the job runs, so a slow job (rate limited, retrying)
+    keeps it however long it takes.
+    """
+
+    def __init__(self, name: str, lease_seconds: float = 120.0, poll_interval: float = 0.5, lease=None):
+        self.name = name
+        self.poll_interval = poll_interval
+        self.lease = lease or SQLLease(lease_seconds)
+        self._inflight: dict[str, asyncio.Task] = {}
+
+    async def _lead(self, key: str, job: Callable[[], Awaitable[T]], follow) -> T:
+        lease_key = f"{self.name}:{key}"
+        waited = False
+        while not await asyncio.to_thread(self.lease.acquire, lease_key):
+            if not waited:
+                print(f"⏳ {self.name} {key} is running on another worker, waiting for it")
+                waited = True
+            await asyncio.sleep(self.poll_interval)
+        renewing = asyncio.ensure_future(keep_lease(self.lease, lease_key, self.name))
+        try:
+            if waited and follow is not None:
+                shared = await follow()
+                if shared is not None:
+                    return shared
+            return await job()
+        finally:
+            renewing.cancel()
+            await asyncio.to_thread(self.lease.release, lease_key)
+
+    async def run(
+        self,
+        key,
+        job: Callable[[], Awaitable[T]],
+        follow: Callable[[], Awaitable[T | None]] | None = None,
+    ) -> T:
+        key = str(key)
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._lead(key, job, follow))
+            self._inflight[key] = task
+
+            def finished(done: asyncio.Task):
+                if self._inflight.get(key) is done:
+                    del self._inflight[key]
+                if not done.cancelled():
+                    done.exception()  # Retrieved here so callers that went away don't cause warnings
+
+            task.add_done_callback(finished)
+        else:
+            print(f"🔗 {self.name} {key} already in flight, sharing its result")
+        # A caller going away (client disconnect) must not cancel the shared job
+        return await asyncio.shield(task)
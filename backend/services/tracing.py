@@ -0,0 +1,185 @@
+"""
+OpenTelemetry tracing (optional)
+
+Off unless TRACING_EXPORTER is set and the OpenTelemetry packages are installed:
+
+    pip install opentelemetry-sdk opentelemetry-exporter-otlp-proto-http
+
+Spans cover every HTTP request, each webhook handling phase, each SQL
+statement and each VAPI API call. Call and interview ids are attached as
+`vapi.call_id` / `interview.id` attributes, so one call's ingestion can be
+followed end to end in Jaeger, Tempo, etc. (or in the JSON lines file).
+"""
+import functools
+import os
+from contextlib import contextmanager
+
+from sqlalchemy import event
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from config import get_settings
+from database import engine, replica_engines
+
+settings = get_settings()
+
+try:
+    from opentelemetry import trace, propagate
+    from opentelemetry.trace import SpanKind, Status, StatusCode
+except ImportError:  # Tracing is optional
+    trace = None
+
+_tracer = None
+_provider = None
+
+
+@contextmanager
+def span(name: str, kind: str = "internal", **attributes):
+    """
+    Run the block inside a child span of the current one (no-op when tracing is off)
+
+        with span("webhook.store", **{"interview.id": interview_id}):
+            ...
+
+    `kind` is internal, client or server. Exceptions are recorded on the
+    span and re-raised. Yields the span, or None when tracing is off.
+    """
+    if _tracer is None:
+        yield None
+        return
+    with _tracer.start_as_current_span(
+        name, kind=SpanKind[kind.upper()], attributes=_clean(attributes)
+    ) as current:
+        yield current
+
+
+def traced(name: str):
+    """Decorator: run an async function inside span(name)"""
+    def decorate(func):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            with span(name):
+                return await func(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+def set_attributes(**attributes):
+    """Add attributes (e.g. ids found mid-way through a handler) to the current span"""
+    if _tracer is not None:
+        trace.get_current_span().set_attributes(_clean(attributes))
+
+
+def _clean(attributes: dict) -> dict:
+    # OpenTelemetry only takes str/bool/int/float values; None means "unknown"
+    return {
+        key: value if isinstance(value, (str, bool, int, float)) else str(value)
+        for key, value in attributes.items()
+        if value is not None
+    }
+
+
+class TracingMiddleware(BaseHTTPMiddleware):
+    """One server span per request, named after the matched route template"""
+
+    async def dispatch(self, request, call_next):
+        with _tracer.start_as_current_span(
+            f"{request.method} {request.url.path}",
+            context=propagate.extract(request.headers),  # Continue the caller's trace if it sent one
+            kind=SpanKind.SERVER,
+            attributes={"http.request.method": request.method, "url.path": request.url.path},
+        ) as current:
+            response = await call_next(request)
+            route = request.scope.get("route")
+            if route is not None:
+                current.update_name(f"{request.method} {route.path}")
+                current.set_attribute("http.route", route.path)
+            current.set_attribute("http.response.status_code", response.status_code)
+            if response.status_code >= 500:
+                current.set_status(Status(StatusCode.ERROR))
+            return response
+
+
+def _instrument_engine(target_engine):
+    """One client span per SQL statement inside a trace (startup DDL etc. is skipped)"""
+
+    @event.listens_for(target_engine, "before_cursor_execute")
+    def _start(conn, cursor, statement, parameters, context, executemany):
+        if not trace.get_current_span().get_span_context().is_valid:
+            return
+        context._span = _tracer.start_span(
+            statement.split(None, 1)[0].upper() if statement else "SQL",
+            kind=SpanKind.CLIENT,
+            attributes={
+                "db.system": target_engine.dialect.name,
+                "db.query.text": statement[:2000],
+                "db.operation.batch": executemany,
+            },
+        )
+
+    @event.listens_for(target_engine, "after_cursor_execute")
+    def _end(conn, cursor, statement, parameters, context, executemany):
+        current = getattr(context, "_span", None)
+        if current is not None:
+            if cursor.rowcount is not None and cursor.rowcount >= 0:
+                current.set_attribute("db.response.returned_rows", cursor.rowcount)
+            current.end()
+
+    @event.listens_for(target_engine, "handle_error")
+    def _error(exception_context):
+        current = getattr(exception_context.execution_context, "_span", None)
+        if current is not None:
+            current.record_exception(exception_context.original_exception)
+            current.set_status(Status(StatusCode.ERROR, str(exception_context.original_exception)))
+            current.end()
+
+
+def _exporter(kind: str):
+    if kind == "otlp":
+        from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+        return OTLPSpanExporter(endpoint=settings.tracing_otlp_endpoint)
+    from opentelemetry.sdk.trace.export import ConsoleSpanExporter
+    if kind == "file":
+        os.makedirs(os.path.dirname(os.path.abspath(settings.tracing_file)), exist_ok=True)
+        out = open(settings.tracing_file, "a", encoding="utf-8")
+        return ConsoleSpanExporter(out=out, formatter=lambda s: s.to_json(indent=None) + "\n")
+    if kind == "console":
+        return ConsoleSpanExporter()
+    raise ValueError(f"Unknown TRACING_EXPORTER {kind!r} (use otlp, file or console)")
+
+
+def setup_tracing() -> bool:
+    """Configure the tracer provider and SQL hooks from settings (call once at startup)"""
+    global _tracer, _provider
+    kind = settings.tracing_exporter.strip().lower()
+    if not kind or _tracer is not None:
+        return _tracer is not None
+    if trace is None:
+        print("⚠️  TRACING_EXPORTER is set but opentelemetry is not installed; tracing disabled")
+        return False
+    try:
+        from opentelemetry.sdk.resources import Resource
+        from opentelemetry.sdk.trace import TracerProvider
+        from opentelemetry.sdk.trace.export import BatchSpanProcessor
+        from opentelemetry.sdk.trace.sampling import ParentBased, TraceIdRatioBased
+
+        _provider = TracerProvider(
+            resource=Resource.create({"service.name": settings.tracing_service_name}),
+            sampler=ParentBased(TraceIdRatioBased(settings.tracing_sample_rate)),
+        )
+        _provider.add_span_processor(BatchSpanProcessor(_exporter(kind)))
+    except (ImportError, ValueError) as e:
+        print(f"⚠️  Tracing disabled: {e}")
+        _provider = None
+        return False
+
+    _tracer = _provider.get_tracer("candimind")
+    for target_engine in [engine, *replica_engines]:
+        _instrument_engine(target_engine)
+    print(f"🛰️  Tracing enabled ({kind}, sample rate {settings.tracing_sample_rate:g})")
+    return True
+
+
+def shutdown_tracing():
+    """Flush buffered spans (app shutdown)"""
+    if _provider is not None:
+        _provider.shutdown()
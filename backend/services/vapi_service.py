@@ -1,8 +1,40 @@
+import asyncio
+import os
+import re
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 import httpx
 from config import get_settings
+from services.circuit_breaker import vapi_circuit
+from services.rate_limiter import vapi_rate_limiter, PRIORITY_INTERACTIVE, PRIORITY_BACKGROUND
+from services.tracing import span
+
+# "/call/<id>?limit=5" -> ("/call/{id}", "<id>"): span names stay low-cardinality
+_CALL_PATH = re.compile(r"^/call/([^/?]+)")
 
 settings = get_settings()
 
+RATE_LIMIT_ATTEMPTS = 3
+# Longest Retry-After honoured before retrying; an HR click shouldn't hang for VAPI's full hour
+MAX_RETRY_AFTER_SECONDS = {PRIORITY_INTERACTIVE: 30.0, PRIORITY_BACKGROUND: 300.0}
+
+
+def _retry_after(header: str | None, attempt: int, priority: str) -> float:
+    """Seconds to wait from a Retry-After header (delta-seconds or HTTP-date), capped per priority"""
+    delay = None
+    if header:
+        try:
+            delay = float(header)
+        except ValueError:
+            try:
+                delay = (parsedate_to_datetime(header) - datetime.now(timezone.utc)).total_seconds()
+            except (TypeError, ValueError):
+                pass
+    if delay is None:
+        delay = 2 ** attempt
+    return min(max(delay, 0.0), MAX_RETRY_AFTER_SECONDS.get(priority, MAX_RETRY_AFTER_SECONDS[PRIORITY_INTERACTIVE]))
+
 
 class VAPIService:
     """Service for interacting with VAPI API"""
@@ -15,6 +47,33 @@ class VAPIService:
             "Authorization": f"Bearer {self.api_key}",
             "Content-Type": "application/json"
         }
+        self._http = None
+        self._http_loop = None
+        self._prompts: dict[str, tuple[float, str]] = {}  # path -> (mtime, prompt text)
+
+    def client(self) -> httpx.AsyncClient:
+        """
+        Pooled HTTP client shared by every request (keep-alive connections)
+
+        A client is tied to the event loop it was created on, so a new one is
+        opened when called from a different loop (e.g. successive asyncio.run).
+        """
+        loop = asyncio.get_running_loop()
+        if self._http is None or self._http.is_closed or self._http_loop is not loop:
+            self._http = httpx.AsyncClient(
+                base_url=self.BASE_URL,
+                headers=self.headers,
+                limits=httpx.Limits(max_connections=20, max_keepalive_connections=10)
+            )
+            self._http_loop = loop
+        return self._http
+
+    async def aclose(self):
+        """Close the pooled client (app shutdown / end of a CLI run)"""
+        if self._http is not None and not self._http.is_closed:
+            await self._http.aclose()
+        self._http = None
+        self._http_loop = None
     
     async def create_web_call_link(
         self,
@@ -41,17 +100,75 @@ class VAPIService:
         
         return web_url
     
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        priority: str = PRIORITY_INTERACTIVE,
+        **kwargs
+    ) -> httpx.Response:
+        """
+        Send a request to the VAPI API through the circuit breaker and shared rate limiter
+        
+        Retries a couple of times when VAPI still answers 429, waiting as
+        long as its Retry-After asks within the priority's cap. Raises
+        CircuitOpenError without calling VAPI while the breaker is open;
+        timeouts, connection errors and 5xx responses count against it.
+        """
+        kwargs.setdefault("timeout", settings.vapi_timeout_seconds)
+        call_match = _CALL_PATH.match(path)
+        route = "/call/{id}" if call_match else path.split("?", 1)[0]
+        for attempt in range(RATE_LIMIT_ATTEMPTS):
+            with span(f"VAPI {method} {route}", kind="client", **{
+                "http.request.method": method,
+                "url.path": route,
+                "vapi.call_id": call_match.group(1) if call_match else None,
+                "vapi.priority": priority,
+                "vapi.attempt": attempt + 1,
+            }) as current:
+                vapi_circuit.raise_if_open()
+                started = time.perf_counter()
+                await vapi_rate_limiter.acquire(priority)
+                if current is not None:
+                    current.set_attribute("vapi.rate_limit_wait_ms", round((time.perf_counter() - started) * 1000, 1))
+                with vapi_circuit.guard() as call:
+                    response = await self.client().request(method, path, **kwargs)
+                    call.ok = response.status_code < 500
+                if current is not None:
+                    current.set_attribute("http.response.status_code", response.status_code)
+            if response.status_code != 429 or attempt == RATE_LIMIT_ATTEMPTS - 1:
+                return response
+            retry_after = _retry_after(response.headers.get("Retry-After"), attempt, priority)
+            print(f"⏳ VAPI rate limited {method} {path}, retrying in {retry_after:.1f}s")
+            await asyncio.sleep(retry_after)
+    
+    SCHOLARSHIP_PROMPT = "scholarship-academic-prompt.md"
+    
+    def _prompt_path(self, filename: str) -> str:
+        return os.path.join(os.path.dirname(__file__), "..", "..", "vapi-prompts", filename)
+    
     def _get_prompt(self, filename: str) -> str:
-        """Helper to read prompt from file"""
-        import os
-        prompt_path = os.path.join(os.path.dirname(__file__), "..", "..", "vapi-prompts", filename)
+        """Helper to read prompt from file (cached until the file changes)"""
+        prompt_path = self._prompt_path(filename)
         try:
-            with open(prompt_path, "r", encoding="utf-8") as f:
-                return f.read()
+            mtime = os.path.getmtime(prompt_path)
+            cached = self._prompts.get(prompt_path)
+            if cached is None or cached[0] != mtime:
+                with open(prompt_path, "r", encoding="utf-8") as f:
+                    cached = self._prompts[prompt_path] = (mtime, f.read())
+            return cached[1]
         except Exception as e:
             print(f"❌ Error reading prompt file {filename}: {e}")
             return ""
 
+    def config_version(self) -> str:
+        """Changes whenever the assistant config handed to candidates would change"""
+        try:
+            prompt_mtime = os.path.getmtime(self._prompt_path(self.SCHOLARSHIP_PROMPT))
+        except OSError:
+            prompt_mtime = 0
+        return f"{settings.vapi_scholarship_assistant_id}:{settings.backend_url}:{prompt_mtime}"
+
     async def create_assistant_overrides(
         self,
         role: str,  # Now a scholarship program name
@@ -63,7 +180,7 @@ class VAPIService:
         base_assistant_id = settings.vapi_scholarship_assistant_id
 
         # Use the master scholarship prompt
-        system_prompt = self._get_prompt("scholarship-academic-prompt.md")
+        system_prompt = self._get_prompt(self.SCHOLARSHIP_PROMPT)
         
         # Simple template replacement
         system_prompt = system_prompt.replace("{{candidateName}}", candidate_name)
@@ -96,61 +213,92 @@ class VAPIService:
             }
         }
     
-    async def get_call_details(self, call_id: str) -> dict:
+    async def get_call_details(self, call_id: str, priority: str = PRIORITY_INTERACTIVE) -> dict:
         """Fetch call details from VAPI API"""
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{self.BASE_URL}/call/{call_id}",
-                headers=self.headers,
-                timeout=30.0
-            )
+        response = await self._request("GET", f"/call/{call_id}", priority=priority)
+        
+        if response.status_code == 200:
+            return response.json()
+        else:
+            print(f"❌ Failed to fetch call details: {response.status_code}")
+            return {}
+
+    async def list_calls(self, limit: int = 50, priority: str = PRIORITY_INTERACTIVE) -> list:
+        """List the most recent calls on the VAPI account"""
+        response = await self._request("GET", f"/call?limit={limit}", priority=priority)
+        
+        if response.status_code != 200:
+            return []
+        
+        return response.json()
+
+    @staticmethod
+    def match_calls(calls: list, interview_unique_id: str, candidate_name: str = None) -> list:
+        """Pick the calls that belong to an interview (by metadata or candidate name)"""
+        matching_calls = []
+        
+        for call in calls:
+            # 1. Check metadata (most reliable)
+            overrides = call.get("assistantOverrides", {}) or {}
+            metadata = overrides.get("metadata", {}) or call.get("metadata", {}) or {}
+            
+            if metadata.get("interviewId") == interview_unique_id:
+                matching_calls.append(call)
+                continue
+            
+            # 2. Check variableValues (fallback if individual call is fetched, 
+            # but might be missing in list response)
+            variables = call.get("variableValues", {}) or {}
+            if candidate_name and variables.get("candidateName") == candidate_name:
+                matching_calls.append(call)
+                continue
             
-            if response.status_code == 200:
-                return response.json()
-            else:
-                print(f"❌ Failed to fetch call details: {response.status_code}")
-                return {}
+            # 3. Check customer name
+            customer = call.get("customer", {}) or {}
+            if candidate_name and customer.get("name") == candidate_name:
+                matching_calls.append(call)
+                continue
+                
+        return matching_calls
 
-    async def find_calls_by_interview(self, interview_unique_id: str, candidate_name: str = None, limit: int = 50) -> list:
+    async def find_calls_by_interview(
+        self,
+        interview_unique_id: str,
+        candidate_name: str = None,
+        limit: int = 50,
+        priority: str = PRIORITY_INTERACTIVE
+    ) -> list:
         """
         Search for recent calls matching an interview ID or candidate name
         """
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{self.BASE_URL}/call?limit={limit}",
-                headers=self.headers,
-                timeout=30.0
-            )
-            
-            if response.status_code != 200:
-                return []
-                
-            calls = response.json()
-            matching_calls = []
-            
-            for call in calls:
-                # 1. Check metadata (most reliable)
-                overrides = call.get("assistantOverrides", {}) or {}
-                metadata = overrides.get("metadata", {}) or call.get("metadata", {}) or {}
-                
-                if metadata.get("interviewId") == interview_unique_id:
-                    matching_calls.append(call)
-                    continue
-                
-                # 2. Check variableValues (fallback if individual call is fetched, 
-                # but might be missing in list response)
-                variables = call.get("variableValues", {}) or {}
-                if candidate_name and variables.get("candidateName") == candidate_name:
-                    matching_calls.append(call)
-                    continue
-                
-                # 3. Check customer name
-                customer = call.get("customer", {}) or {}
-                if candidate_name and customer.get("name") == candidate_name:
-                    matching_calls.append(call)
-                    continue
-                    
-            return matching_calls
+        calls = await self.list_calls(limit=limit, priority=priority)
+        return self.match_calls(calls, interview_unique_id, candidate_name)
+
+
+    async def _json(self, method: str, path: str, **kwargs):
+        """Request that raises httpx.HTTPStatusError on failure and returns the JSON body"""
+        response = await self._request(method, path, **kwargs)
+        response.raise_for_status()
+        return response.json()
+
+    async def get_assistant(self, assistant_id: str, priority: str = PRIORITY_INTERACTIVE) -> dict:
+        return await self._json("GET", f"/assistant/{assistant_id}", priority=priority)
+
+    async def update_assistant(self, assistant_id: str, changes: dict, priority: str = PRIORITY_INTERACTIVE) -> dict:
+        return await self._json("PATCH", f"/assistant/{assistant_id}", json=changes, priority=priority)
+
+    async def list_structured_outputs(self, priority: str = PRIORITY_INTERACTIVE) -> list:
+        data = await self._json("GET", "/structured-output", priority=priority)
+        # Handle pagination results key if present, or list directly
+        return data if isinstance(data, list) else data.get("results", [])
+
+    async def create_structured_output(self, payload: dict, priority: str = PRIORITY_INTERACTIVE) -> dict:
+        return await self._json("POST", "/structured-output", json=payload, priority=priority)
+
+    async def update_structured_output(
+        self, output_id: str, changes: dict, priority: str = PRIORITY_INTERACTIVE
+    ) -> dict:
+        return await self._json("PATCH", f"/structured-output/{output_id}", json=changes, priority=priority)
 
 
 # Singleton instance
@@ -0,0 +1,195 @@
+import json
+import mmap
+import os
+from datetime import datetime
+
+from services.file_lock import file_lock
+
+LOG_PATH = os.path.join(os.path.dirname(__file__), "..", "webhook_debug.log")
+
+# Every logged webhook is one block:
+#   ===...===
+#   WEBHOOK RECEIVED AT: <timestamp>
+#   Event Type: <type>
+#   Full Payload:
+#   <pretty JSON>
+#   ===...===
+# The sidecar index (<log>.idx) has one tab-separated line per block:
+#   offset  length  timestamp  event_type  call_id
+# where offset/length cover the block from the "WEBHOOK RECEIVED AT" line on.
+SEPARATOR = "=" * 80
+BLOCK_MARKER = b"WEBHOOK RECEIVED AT: "
+
+
+def index_path(log_path: str) -> str:
+    return f"{log_path}.idx"
+
+
+def event_type_of(payload: dict) -> str | None:
+    """Event type from VAPI's nested ({"message": {...}}) or flat payloads"""
+    message = payload.get("message")
+    if isinstance(message, dict) and message.get("type"):
+        return message.get("type")
+    return payload.get("type") or payload.get("event")
+
+
+def call_id_of(payload: dict) -> str | None:
+    """Call id from the locations VAPI uses across event types"""
+    for data in (payload.get("message"), payload):
+        if not isinstance(data, dict):
+            continue
+        call = data.get("call")
+        if isinstance(call, dict) and call.get("id"):
+            return call.get("id")
+        if data.get("callId"):
+            return data.get("callId")
+    return None
+
+
+def _index_line(offset: int, length: int, timestamp: str, event_type, call_id) -> str:
+    fields = [str(offset), str(length), timestamp, event_type or "-", call_id or "-"]
+    return "\t".join(f.replace("\t", " ").replace("\n", " ") for f in fields) + "\n"
+
+
+def append_webhook_log(payload: dict, log_path: str = LOG_PATH):
+    """Append a webhook to the debug log and record its offset in the index"""
+    timestamp = datetime.utcnow().isoformat()
+    event_type = event_type_of(payload)
+    head = f"\n{SEPARATOR}\n"
+    body = (
+        f"WEBHOOK RECEIVED AT: {timestamp}\n"
+        f"Event Type: {event_type}\n"
+        f"Full Payload:\n{json.dumps(payload, indent=2)}\n"
+        f"{SEPARATOR}\n"
+    )
+    head_bytes = head.encode("utf-8")
+    body_bytes = body.encode("utf-8")
+
+    try:
+        if not os.path.exists(index_path(log_path)):
+            # First indexed write to a log created by older code: index what's there
+            rebuild_index(log_path)
+        # Lock so concurrent workers don't interleave blocks or index lines
+        with file_lock(f"{log_path}.lock"):
+            with open(log_path, "ab") as f:
+                offset = f.seek(0, os.SEEK_END) + len(head_bytes)
+                f.write(head_bytes + body_bytes)
+            with open(index_path(log_path), "a", encoding="utf-8") as f:
+                f.write(_index_line(offset, len(body_bytes), timestamp, event_type, call_id_of(payload)))
+    except OSError as e:
+        print(f"❌ Failed to write webhook debug log: {e}")
+
+
+def _parse_block(block: bytes) -> tuple[str, str | None, str | None]:
+    """Timestamp, event type and call id of a block written by any version of the logger"""
+    header, _, rest = block.partition(b"\n")
+    # Older logs wrote str(datetime); normalize so timestamps compare as ISO strings
+    timestamp = header[len(BLOCK_MARKER):].decode("utf-8", "ignore").strip().replace(" ", "T")
+    event_type = call_id = None
+    _, found, payload_text = rest.partition(b"Full Payload:")
+    if found:
+        payload_text = payload_text.rstrip().rstrip(b"=").rstrip()
+        try:
+            payload = json.loads(payload_text.decode("utf-8", "ignore"))
+            event_type = event_type_of(payload)
+            call_id = call_id_of(payload)
+        except ValueError:
+            pass
+    return timestamp, event_type, call_id
+
+
+def rebuild_index(log_path: str = LOG_PATH, start: int = 0) -> int:
+    """
+    Index blocks from byte `start` to the end of the log (one pass over the file)
+
+    With start=0 the index is rewritten; otherwise new entries are appended,
+    which lets the index catch up with blocks written by older code.
+    Returns the number of blocks indexed.
+    """
+    if not os.path.exists(log_path) or os.path.getsize(log_path) <= start:
+        if start == 0:
+            open(index_path(log_path), "w").close()
+        return 0
+
+    with file_lock(f"{log_path}.lock"):
+        with open(log_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            lines = []
+            pos = mm.find(BLOCK_MARKER, start)
+            while pos != -1:
+                next_pos = mm.find(BLOCK_MARKER, pos + len(BLOCK_MARKER))
+                end = next_pos if next_pos != -1 else len(mm)
+                # The block ends after its closing separator line
+                close = mm.find(b"\n" + SEPARATOR.encode(), pos, end)
+                line_end = mm.find(b"\n", close + 1, end) if close != -1 else -1
+                block_end = line_end + 1 if line_end != -1 else end
+                block = mm[pos:block_end]
+                timestamp, event_type, call_id = _parse_block(block)
+                lines.append(_index_line(pos, len(block), timestamp, event_type, call_id))
+                pos = next_pos
+
+        with open(index_path(log_path), "w" if start == 0 else "a", encoding="utf-8") as f:
+            f.writelines(lines)
+    return len(lines)
+
+
+def read_index(log_path: str = LOG_PATH) -> list[dict]:
+    """Load index entries, indexing any part of the log the index doesn't cover yet"""
+    path = index_path(log_path)
+    if not os.path.exists(path):
+        rebuild_index(log_path)
+
+    entries = {}
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            parts = line.rstrip("\n").split("\t")
+            if len(parts) != 5:
+                continue
+            offset, length, timestamp, event_type, call_id = parts
+            # Keyed by offset: a catch-up scan racing an append may index a block twice
+            entries[int(offset)] = {
+                "offset": int(offset),
+                "length": int(length),
+                "timestamp": timestamp,
+                "event_type": None if event_type == "-" else event_type,
+                "call_id": None if call_id == "-" else call_id,
+            }
+    entries = sorted(entries.values(), key=lambda e: e["offset"])
+
+    covered = max((e["offset"] + e["length"] for e in entries), default=0)
+    if os.path.exists(log_path) and os.path.getsize(log_path) > covered:
+        if rebuild_index(log_path, start=covered):
+            return read_index(log_path)
+    return entries
+
+
+def find_entries(
+    entries: list[dict],
+    call_id: str | None = None,
+    event_type: str | None = None,
+    since: str | None = None,
+    until: str | None = None
+) -> list[dict]:
+    """Filter index entries; call_id matches as a prefix, timestamps are ISO strings"""
+    matches = []
+    for entry in entries:
+        if call_id and not (entry["call_id"] or "").startswith(call_id):
+            continue
+        if event_type and entry["event_type"] != event_type:
+            continue
+        if since and entry["timestamp"] < since:
+            continue
+        if until and entry["timestamp"] > until:
+            continue
+        matches.append(entry)
+    return matches
+
+
+def read_blocks(entries: list[dict], log_path: str = LOG_PATH) -> list[str]:
+    """Read the given blocks straight from their offsets via mmap"""
+    if not entries:
+        return []
+    with open(log_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        return [
+            mm[e["offset"]:e["offset"] + e["length"]].decode("utf-8", errors="replace")
+            for e in entries
+        ]
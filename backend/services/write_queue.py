@@ -0,0 +1,124 @@
+import asyncio
+import contextvars
+from typing import Callable, TypeVar
+
+from sqlalchemy.orm import Session
+
+from config import get_settings
+from database import SessionLocal
+from services.tracing import span
+
+settings = get_settings()
+
+T = TypeVar("T")
+
+
+class WriteQueue:
+    """
+    Single writer per worker that group-commits queued mutations
+
+    Callers submit a function that takes a Session. The writer drains
+    everything queued (up to `max_batch`, waiting up to `max_delay` seconds
+    for stragglers), applies each mutation in its own SAVEPOINT and commits
+    the whole batch in one transaction: one write lock and one fsync per
+    batch instead of one per request. A mutation that raises is rolled back
+    on its own and the exception is re-raised to its caller.
+
+    Mutations run on a worker thread and should return plain values, not
+    ORM objects (the session is closed once the batch is committed).
+    """
+
+    def __init__(self, session_factory=SessionLocal, max_batch: int = 100, max_delay: float = 0.002):
+        self.session_factory = session_factory
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self._queue: asyncio.Queue | None = None
+        self._writer: asyncio.Task | None = None
+        self._loop = None
+        self.stats = {"mutations": 0, "batches": 0, "failed": 0}
+
+    def _ensure_writer(self) -> asyncio.Queue:
+        # Queue and writer task belong to the loop they were created on
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop or self._writer is None or self._writer.done():
+            self._queue = asyncio.Queue()
+            # Fresh context: the writer must not inherit the first caller's trace
+            self._writer = loop.create_task(self._run(), context=contextvars.Context())
+            self._loop = loop
+        return self._queue
+
+    async def submit(self, mutation: Callable[[Session], T]) -> T:
+        """Queue `mutation` and wait until its batch has been committed"""
+        future = asyncio.get_running_loop().create_future()
+        # The mutation runs in the caller's context, so its SQL shows up in the caller's trace
+        self._ensure_writer().put_nowait((contextvars.copy_context(), mutation, future))
+        return await future
+
+    async def _run(self):
+        queue = self._queue
+        while True:
+            batch = [await queue.get()]
+            if self.max_delay > 0:
+                await asyncio.sleep(self.max_delay)  # Let concurrent requests join the batch
+            while len(batch) < self.max_batch and not queue.empty():
+                batch.append(queue.get_nowait())
+
+            try:
+                outcomes = await asyncio.to_thread(self._apply, [item[:2] for item in batch])
+            except Exception as e:  # e.g. no database connection; keep the writer alive
+                outcomes = [(False, e)] * len(batch)
+            for (_, _, future), (ok, value) in zip(batch, outcomes):
+                if not future.done():  # Caller may have gone away
+                    if ok:
+                        future.set_result(value)
+                    else:
+                        future.set_exception(value)
+                queue.task_done()
+
+    def _apply(self, mutations: list[tuple[contextvars.Context, Callable[[Session], T]]]) -> list[tuple[bool, object]]:
+        db = self.session_factory(expire_on_commit=False)
+        try:
+            with span("write_queue.batch", **{"write_queue.batch_size": len(mutations)}):
+                # BEGIN IMMEDIATE on SQLite: take the write lock up front (see database.py)
+                db.connection(execution_options={"sqlite_immediate": True})
+                outcomes = []
+                for context, mutation in mutations:
+                    try:
+                        outcomes.append((True, context.run(self._apply_one, db, mutation)))
+                    except Exception as e:
+                        outcomes.append((False, e))
+                try:
+                    db.commit()
+                except Exception as e:
+                    db.rollback()
+                    outcomes = [(False, e)] * len(mutations)
+        finally:
+            db.close()
+
+        self.stats["mutations"] += len(mutations)
+        self.stats["batches"] += 1
+        self.stats["failed"] += sum(not ok for ok, _ in outcomes)
+        return outcomes
+
+    @staticmethod
+    def _apply_one(db: Session, mutation: Callable[[Session], T]) -> T:
+        with db.begin_nested():  # Released (and flushed) here, so a failure only undoes this mutation
+            return mutation(db)
+
+    async def aclose(self):
+        """Commit what's queued and stop the writer (app shutdown)"""
+        if self._writer is not None and not self._writer.done():
+            await self._queue.join()
+            self._writer.cancel()
+            try:
+                await self._writer
+            except asyncio.CancelledError:
+                pass
+        self._writer = None
+
+
+# Shared writer for webhook ingestion
+write_queue = WriteQueue(
+    max_batch=settings.write_queue_max_batch,
+    max_delay=settings.write_queue_max_delay_ms / 1000,
+)
@@ -1,8 +1,8 @@
-import React, { useState, useEffect, useRef } from 'react';
+import React, { useState, useRef, useEffect } from 'react';
 import { useParams } from 'react-router-dom';
 import Vapi from '@vapi-ai/web';
 import { interviewAPI } from '../services/api';
-import { Mic, MicOff, Phone, PhoneOff, Loader } from 'lucide-react';
+import { Mic, MicOff, Phone, PhoneOff, Loader, Clock } from 'lucide-react';
 
 export default function CandidateInterview() {
     const { uniqueId } = useParams();
@@ -20,15 +20,20 @@ export default function CandidateInterview() {
     const [vapiInstance, setVapiInstance] = useState(null);
     const [isCallActive, setIsCallActive] = useState(false);
     const [isMuted, setIsMuted] = useState(false);
-    const [callStatus, setCallStatus] = useState('idle'); // idle, connecting, active, ended
+    const [callStatus, setCallStatus] = useState('idle'); // idle, waiting, connecting, active, ended
     const [assistantMessage, setAssistantMessage] = useState('');
 
-    // Load interview data only after password is verified
-    useEffect(() => {
-        if (passwordVerified) {
-            loadInterview();
+    // Call queue state (when the server caps concurrent interviews)
+    const [queueInfo, setQueueInfo] = useState(null);
+    const waitingRef = useRef(false);
+
+    // Give up the queue place when the candidate leaves while waiting
+    useEffect(() => () => {
+        if (waitingRef.current) {
+            waitingRef.current = false;
+            interviewAPI.leaveAdmission(uniqueId).catch(() => {});
         }
-    }, [passwordVerified, uniqueId]);
+    }, [uniqueId]);
 
     const handlePasswordSubmit = async (e) => {
         e.preventDefault();
@@ -36,25 +41,30 @@ export default function CandidateInterview() {
         setPasswordError('');
 
         try {
-            const result = await interviewAPI.verifyPassword(uniqueId, password);
+            // One request verifies the password and returns the interview with its VAPI config
+            const result = await interviewAPI.bootstrapInterview(uniqueId, password);
 
             if (result.valid) {
                 setPasswordVerified(true);
+                setupInterview(result);
             } else {
                 setPasswordError('Invalid password. Please check your email and try again.');
             }
         } catch (error) {
             console.error('Error verifying password:', error);
-            setPasswordError('Failed to verify password. Please try again.');
+            if (error.response?.status === 404) {
+                setPasswordError('Interview not found or has expired.');
+            } else {
+                setPasswordError('Failed to verify password. Please try again.');
+            }
         } finally {
             setVerifying(false);
         }
     };
 
-    const loadInterview = async () => {
+    const setupInterview = (data) => {
         setLoading(true);
         try {
-            const data = await interviewAPI.getInterviewByUID(uniqueId);
             setInterview(data);
 
             // Initialize VAPI with public key
@@ -128,16 +138,53 @@ export default function CandidateInterview() {
             });
 
         } catch (err) {
-            console.error('Error loading interview:', err);
-            setError('Interview not found or has expired.');
+            console.error('Error setting up interview:', err);
+            setError(err.message || 'Failed to set up the interview.');
         } finally {
             setLoading(false);
         }
     };
 
+    // Poll for a call slot until admitted; false if the candidate cancelled meanwhile
+    const waitForAdmission = async () => {
+        waitingRef.current = true;
+        while (waitingRef.current) {
+            const admission = await interviewAPI.requestAdmission(uniqueId);
+            if (!waitingRef.current) break; // Left the queue while this request was in flight
+            if (admission.admitted) {
+                waitingRef.current = false;
+                setQueueInfo(null);
+                return true;
+            }
+            setQueueInfo(admission);
+            setCallStatus('waiting');
+            await new Promise((resolve) => setTimeout(resolve, (admission.retry_after || 5) * 1000));
+        }
+        return false;
+    };
+
+    const cancelWaiting = () => {
+        waitingRef.current = false;
+        setQueueInfo(null);
+        setCallStatus('idle');
+        interviewAPI.leaveAdmission(uniqueId).catch(() => {});
+    };
+
     const startInterview = async () => {
         if (!vapiInstance || !interview) return;
 
+        setCallStatus('connecting');
+
+        try {
+            if (!(await waitForAdmission())) return;
+        } catch (err) {
+            console.error('Error requesting a call slot:', err);
+            waitingRef.current = false;
+            setError('Could not reserve an interview slot. Please refresh and try again.');
+            setCallStatus('idle');
+            return;
+        }
+
         setCallStatus('connecting');
         console.log('Starting interview with config:', interview.vapi_config);
 
@@ -151,9 +198,16 @@ export default function CandidateInterview() {
             console.error('Error details:', JSON.stringify(err, null, 2));
             setError(`Failed to start interview. ${err.message || 'Please check your microphone and try again.'}`);
             setCallStatus('idle');
+            interviewAPI.leaveAdmission(uniqueId).catch(() => {}); // Free the slot for the next candidate
         }
     };
 
+    const formatWait = (seconds) => {
+        if (seconds < 60) return 'less than a minute';
+        const minutes = Math.round(seconds / 60);
+        return minutes === 1 ? 'about 1 minute' : `about ${minutes} minutes`;
+    };
+
     const endInterview = () => {
         if (vapiInstance) {
             vapiInstance.stop();
@@ -300,6 +354,29 @@ export default function CandidateInterview() {
                         </div>
                     )}
 
+                    {/* Waiting for a call slot */}
+                    {callStatus === 'waiting' && queueInfo && (
+                        <div className="card card-glass text-center">
+                            <div style={{ padding: 'var(--spacing-2xl)' }}>
+                                <Clock size={48} style={{
+                                    color: 'var(--color-primary)',
+                                    margin: '0 auto var(--spacing-lg)'
+                                }} />
+                                <h2 style={{ marginBottom: 'var(--spacing-md)' }}>You're in the queue</h2>
+                                <p style={{ fontSize: '1.25rem', marginBottom: 'var(--spacing-sm)' }}>
+                                    Position <strong>{queueInfo.position}</strong> of {queueInfo.queue_length}
+                                </p>
+                                <p style={{ color: 'var(--color-text-muted)', marginBottom: 'var(--spacing-lg)' }}>
+                                    All interviewers are busy right now. Estimated wait: {formatWait(queueInfo.eta_seconds)}.
+                                    Keep this page open; your interview starts automatically.
+                                </p>
+                                <button className="btn btn-secondary" onClick={cancelWaiting}>
+                                    Leave Queue
+                                </button>
+                            </div>
+                        </div>
+                    )}
+
                     {/* Connecting State */}
                     {callStatus === 'connecting' && (
                         <div className="card card-glass text-center">
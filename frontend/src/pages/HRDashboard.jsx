@@ -29,7 +29,9 @@ export default function HRDashboard() {
     // Filter state
     const [filters, setFilters] = useState({
         role: '',
-        status: ''
+        status: '',
+        recommendation: '',
+        sort_by: 'created_at'
     });
 
     // Check if already authenticated on mount
@@ -386,6 +388,29 @@ export default function HRDashboard() {
                             <option value="in_progress">In Progress</option>
                             <option value="completed">Completed</option>
                         </select>
+                        <select
+                            className="form-select"
+                            style={{ width: 'auto' }}
+                            value={filters.recommendation}
+                            onChange={(e) => setFilters({ ...filters, recommendation: e.target.value })}
+                        >
+                            <option value="">All Recommendations</option>
+                            <option value="Strong Hire">Strong Hire</option>
+                            <option value="Hire">Hire</option>
+                            <option value="Maybe">Maybe</option>
+                            <option value="No Hire">No Hire</option>
+                        </select>
+                        <select
+                            className="form-select"
+                            style={{ width: 'auto' }}
+                            value={filters.sort_by}
+                            onChange={(e) => setFilters({ ...filters, sort_by: e.target.value })}
+                        >
+                            <option value="created_at">Newest First</option>
+                            <option value="overall_score">Overall Score</option>
+                            <option value="communication_clarity">Communication</option>
+                            <option value="culture_fit_ownership">Culture Fit</option>
+                        </select>
                     </div>
                 </div>
 
@@ -449,7 +474,7 @@ export default function HRDashboard() {
                                                         {copiedId === interview.id ? <Check size={16} /> : <Copy size={16} />}
                                                     </button>
                                                     {interview.status === 'completed' && interview.result ? (
-                                                        <ViewResultButton result={interview.result} />
+                                                        <ViewResultButton result={interview.result} interviewId={interview.id} />
                                                     ) : interview.status === 'in_progress' ? (
                                                         <button
                                                             className="btn"
@@ -553,8 +578,25 @@ export default function HRDashboard() {
 }
 
 // Component to view interview results
-function ViewResultButton({ result }) {
+function ViewResultButton({ result: listResult, interviewId }) {
     const [showModal, setShowModal] = useState(false);
+    // Archived interviews come without transcript/summary in the list; load them on open
+    const [archivedResult, setArchivedResult] = useState(null);
+    const result = archivedResult || listResult;
+    // Hidden when there is no downloaded recording (the endpoint answers 404)
+    const [hasRecording, setHasRecording] = useState(true);
+
+    const openModal = async () => {
+        setShowModal(true);
+        if (listResult.archived && !archivedResult) {
+            try {
+                const interview = await interviewAPI.getInterview(interviewId);
+                setArchivedResult(interview.result);
+            } catch (error) {
+                console.error('Failed to load archived interview:', error);
+            }
+        }
+    };
 
 
 
@@ -579,7 +621,7 @@ function ViewResultButton({ result }) {
             <button
                 className="btn btn-success"
                 style={{ padding: '0.5rem 1rem', fontSize: '0.875rem' }}
-                onClick={() => setShowModal(true)}
+                onClick={openModal}
             >
                 View Results
             </button>
@@ -744,6 +786,23 @@ function ViewResultButton({ result }) {
                         </div>
                     )}
 
+                    {hasRecording && (
+                        <div className="mb-lg">
+                            <h3 style={{ marginBottom: 'var(--spacing-md)', fontSize: '1.125rem' }}>Recording</h3>
+                            <audio
+                                controls
+                                preload="metadata"
+                                src={interviewAPI.getRecordingUrl(interviewId)}
+                                onError={() => setHasRecording(false)}
+                                style={{ width: '100%' }}
+                            />
+                        </div>
+                    )}
+
+                    {result.archived && !archivedResult && (
+                        <p className="mb-lg" style={{ color: 'var(--color-text-muted)' }}>Loading transcript from archive...</p>
+                    )}
+
                     {result.transcript && (
                         <div className="mb-lg">
                             <h3 style={{ marginBottom: 'var(--spacing-md)', fontSize: '1.125rem' }}>Transcript</h3>
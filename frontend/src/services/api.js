@@ -9,6 +9,48 @@ const api = axios.create({
     },
 });
 
+// Read-your-writes: echo the server's last write stamp so reads made right
+// after a change are served by the primary database instead of a replica
+const LAST_WRITE_HEADER = 'x-last-write-at';
+let lastWriteAt = null;
+
+api.interceptors.request.use((config) => {
+    if (lastWriteAt) {
+        config.headers[LAST_WRITE_HEADER] = lastWriteAt;
+    }
+    return config;
+});
+
+api.interceptors.response.use((response) => {
+    const stamp = response.headers[LAST_WRITE_HEADER];
+    if (stamp) {
+        lastWriteAt = stamp;
+    }
+    return response;
+});
+
+// Conditional GET: remember each response's ETag and send it back as
+// If-None-Match, so unchanged interviews come back as an empty 304
+const etagCache = new Map();
+
+const cachedGet = async (url, config = {}) => {
+    const key = `${url}?${new URLSearchParams(config.params || {}).toString()}`;
+    const cached = etagCache.get(key);
+    const response = await api.get(url, {
+        ...config,
+        headers: { ...config.headers, ...(cached ? { 'If-None-Match': cached.etag } : {}) },
+        validateStatus: (status) => (status >= 200 && status < 300) || status === 304,
+    });
+    if (response.status === 304 && cached) {
+        return cached.data;
+    }
+    const etag = response.headers.etag;
+    if (etag) {
+        etagCache.set(key, { etag, data: response.data });
+    }
+    return response.data;
+};
+
 // Interview API calls
 export const interviewAPI = {
     // Create a new interview link
@@ -23,20 +65,63 @@ export const interviewAPI = {
 
     // Get all interviews
     listInterviews: async (filters = {}) => {
-        const response = await api.get('/api/interviews', { params: filters });
+        return cachedGet('/api/interviews', { params: filters });
+    },
+
+    // Full-text search over transcripts, summaries and evaluations
+    searchInterviews: async (query, { role, page = 1, pageSize = 20 } = {}) => {
+        const response = await api.get('/api/interviews/search', {
+            params: { q: query, role, page, page_size: pageSize },
+        });
+        return response.data;
+    },
+
+    // Download URL for a streamed export (format: csv, jsonl or parquet)
+    getExportUrl: (format = 'csv', filters = {}) => {
+        const params = new URLSearchParams({ format, ...filters });
+        return `${API_BASE_URL}/api/interviews/export?${params.toString()}`;
+    },
+
+    // Audio URL of the call recording (served with Range support, so players can seek)
+    getRecordingUrl: (interviewId) => {
+        return `${API_BASE_URL}/api/interviews/${interviewId}/recording`;
+    },
+
+    // Rescore a role's cohort with custom rubric weights (stored as a new version)
+    createRanking: async ({ role, weights, normalization = 'zscore', batchBy = 'none' }) => {
+        const response = await api.post('/api/rankings', {
+            role, weights, normalization, batch_by: batchBy,
+        });
         return response.data;
     },
 
+    // Ranking versions, optionally for one role
+    listRankings: async (role) => {
+        const response = await api.get('/api/rankings', { params: { role } });
+        return response.data;
+    },
+
+    // One page of a stored ranking
+    getRanking: async (rankingId, { page = 1, pageSize = 50 } = {}) => {
+        return cachedGet(`/api/rankings/${rankingId}`, { params: { page, page_size: pageSize } });
+    },
+
     // Get specific interview
     getInterview: async (interviewId) => {
-        const response = await api.get(`/api/interviews/${interviewId}`);
+        return cachedGet(`/api/interviews/${interviewId}`);
+    },
+
+    // Interviews whose candidate answers look copied from this one
+    getDuplicates: async (interviewId, { threshold = 0.5, limit = 20 } = {}) => {
+        const response = await api.get(`/api/interviews/${interviewId}/duplicates`, {
+            params: { threshold, limit },
+        });
         return response.data;
     },
 
     // Get interview by unique ID (for candidate page)
     getInterviewByUID: async (uniqueId) => {
-        const response = await api.get(`/api/interviews/by-uid/${uniqueId}`);
-        return response.data;
+        return cachedGet(`/api/interviews/by-uid/${uniqueId}`);
     },
 
     // Manually complete interview with evaluation data (for local testing)
@@ -51,6 +136,26 @@ export const interviewAPI = {
         return response.data;
     },
 
+    // Verify password, start the interview and get its VAPI config in one request
+    bootstrapInterview: async (uniqueId, password) => {
+        const response = await api.post(`/api/interviews/by-uid/${uniqueId}/bootstrap`, {
+            password: password
+        });
+        return response.data;
+    },
+
+    // Ask for a call slot; returns {admitted} or the queue position and estimated wait
+    requestAdmission: async (uniqueId) => {
+        const response = await api.post(`/api/interviews/by-uid/${uniqueId}/admission`);
+        return response.data;
+    },
+
+    // Give up a queue place (or an unused slot)
+    leaveAdmission: async (uniqueId) => {
+        const response = await api.delete(`/api/interviews/by-uid/${uniqueId}/admission`);
+        return response.data;
+    },
+
     // Verify password for interview access
     verifyPassword: async (uniqueId, password) => {
         const response = await api.post(`/api/interviews/by-uid/${uniqueId}/verify-password`, {